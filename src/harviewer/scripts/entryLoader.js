@@ -0,0 +1,84 @@
+/*
+ * Loads the details of the entries of a HAR summary served by pcaphar.
+ *
+ * The summary entries have an _index and no headers, cookies, query string,
+ * post data nor content text. When the viewer opens an entry, load() gets
+ * the complete entries around it from the entriesUrl parameter of the page
+ * and copies their request and response into the summary entries before the
+ * entry is rendered. Without entriesUrl, or for entries without _index,
+ * load() renders right away.
+ */
+var HarEntryLoader = (function() {
+  // Entries loaded per request, the size of the pcaphar entry blocks.
+  var PAGE_SIZE = 50;
+
+  function getURLParameter(name) {
+    var params = window.location.search.substring(1).split("&");
+    for (var i = 0; i < params.length; i++) {
+      var param = params[i].split("=");
+      if (param[0] == name && param[1])
+        return unescape(param[1]);
+    }
+    return null;
+  }
+
+  var entriesUrl = getURLParameter("entriesUrl");
+  // Complete entries by index.
+  var entries = {};
+  // Callbacks waiting for a page, by the index of its first entry.
+  var pending = {};
+
+  function complete(entry) {
+    var full = entries[entry._index];
+    if (full) {
+      entry.request = full.request;
+      entry.response = full.response;
+      entry._loaded = true;
+    }
+  }
+
+  function loadPage(start) {
+    $.ajax({
+      url: entriesUrl,
+      data: {start: start, count: PAGE_SIZE},
+      dataType: "jsonp",
+      success: function(data) {
+        for (var i = 0; i < data.entries.length; i++)
+          entries[data.start + i] = data.entries[i];
+        done(start);
+      },
+      error: function() {
+        done(start);
+      }
+    });
+  }
+
+  function done(start) {
+    var callbacks = pending[start];
+    delete pending[start];
+    for (var i = 0; i < callbacks.length; i++)
+      callbacks[i]();
+  }
+
+  return {
+    load: function(entry, callback) {
+      if (!entriesUrl || entry._index == null || entry._loaded) {
+        callback();
+        return;
+      }
+      if (entries[entry._index]) {
+        complete(entry);
+        callback();
+        return;
+      }
+      var start = entry._index - entry._index % PAGE_SIZE;
+      var waiting = pending[start];
+      pending[start] = (waiting || []).concat([function() {
+        complete(entry);
+        callback();
+      }]);
+      if (!waiting)
+        loadPage(start);
+    }
+  };
+})();
@@ -31,9 +31,11 @@ sys.path.append(os.path.abspath(path))
 dpkt_path = os.path.join(path, "dpkt")
 sys.path.append(os.path.abspath(dpkt_path))
 
+import collections
 import logging
 import hashlib
-import StringIO
+import re
+import threading
 import time
 import zlib
 
@@ -46,6 +48,23 @@ jinja_environment = jinja2.Environment(
         loader=jinja2.FileSystemLoader(os.path.dirname(__file__)))
 
 from pcap2har import convert
+from pcap2har import har
+from pcap2har import stats
+
+# Size of the data stored in each DataRecord.
+CHUNK_SIZE = 1000000
+# Number of DataRecords saved in one datastore call.
+PUT_BATCH_SIZE = 4
+# Bytes of compressed data kept in memory for Download and Entries.
+HAR_CACHE_SIZE = 32000000
+# Part of the conversion cache key. Change it when the converter output
+# changes, so that HARs converted before are not served anymore.
+CONVERTER_VERSION = 2
+# Most entries returned by one Entries request.
+MAX_ENTRIES_PER_REQUEST = 500
+# JSONP callback names accepted by Entries.
+CALLBACK_PATTERN = re.compile(r'^[A-Za-z_$][\w.$]*$')
+
 class TimingRecord(db.Model):
   date = db.DateTimeProperty(auto_now_add=True)
   hash_str = db.StringProperty()
@@ -55,6 +74,38 @@ class TimingRecord(db.Model):
   savehar = db.FloatProperty()
   loadhar = db.FloatProperty()
   total = db.FloatProperty()
+  # wall time of the conversion stages, and CPU time of the conversion
+  tcp = db.FloatProperty()
+  http = db.FloatProperty()
+  har = db.FloatProperty()
+  json = db.FloatProperty()
+  cpu = db.FloatProperty()
+  # counters of the conversion, see stats.COUNTERS
+  packets = db.IntegerProperty()
+  flows = db.IntegerProperty()
+  entries = db.IntegerProperty()
+  out_of_order = db.IntegerProperty()
+  retransmitted = db.IntegerProperty()
+  holes = db.IntegerProperty()
+  bytes_reassembled = db.IntegerProperty()
+  bytes_decompressed = db.IntegerProperty()
+
+# TimingRecord property, stats.Stats counter
+TIMING_COUNTERS = (
+  ('packets', 'packets_seen'),
+  ('flows', 'flows'),
+  ('entries', 'entries'),
+  ('out_of_order', 'out_of_order_segments'),
+  ('retransmitted', 'retransmitted_segments'),
+  ('holes', 'holes'),
+  ('bytes_reassembled', 'bytes_reassembled'),
+  ('bytes_decompressed', 'bytes_decompressed'),
+)
+
+# Columns of the Timing page.
+TIMING_COLUMNS = (('upload', 'savepcap', 'convert', 'savehar', 'loadhar',
+                   'total') + stats.STAGES + ('cpu',) +
+                  tuple(name for name, counter in TIMING_COUNTERS))
 
 class DataRecord(db.Model):
   hash_str = db.StringProperty()
@@ -66,8 +117,15 @@ class PcapHarInfo(db.Model):
   hash_str = db.StringProperty()
   pcapname = db.StringProperty()
   data_count = db.IntegerProperty()
+  # Summaries: positions of the entry blocks in the 'hare' data, and the end
+  # of the last one, see EntryBlockWriter.
+  block_offsets = db.ListProperty(int)
 
 def GetPcapHarInfo(hash_str):
+  # Infos are saved with their hash_str as key name, except older ones.
+  info = PcapHarInfo.get_by_key_name(hash_str)
+  if info:
+    return info
   query = "WHERE hash_str = :1 ORDER BY date DESC LIMIT 1"
   records = PcapHarInfo.gql(query, hash_str).fetch(1)
   if len(records) == 0:
@@ -75,6 +133,9 @@ def GetPcapHarInfo(hash_str):
   return records[0]
 
 def GetDataRecord(hash_str, idx):
+  """
+  Finds a DataRecord by query, for records saved before they had key names.
+  """
   query = DataRecord.all()
   query.filter("hash_str =", hash_str)
   query.filter("index = ", idx)
@@ -84,6 +145,56 @@ def GetDataRecord(hash_str, idx):
   else:
     return None
 
+def DataRecordKeyName(hash_str, idx):
+  return '%s:%d' % (hash_str, idx)
+
+def ConversionKey(pcap_hash_str, options):
+  """
+  Returns the hash_str of the HAR converted from a pcap with options. The
+  same pcap converted with the same options is only converted once.
+  """
+  md5 = hashlib.md5()
+  md5.update(repr((CONVERTER_VERSION, options.result_items())))
+  return '%s-%s' % (pcap_hash_str, md5.hexdigest()[:8])
+
+class LRUCache(object):
+  """
+  In-process cache that evicts the least recently used values once their
+  total size is above max_size. It is shared by the request threads.
+  """
+  def __init__(self, max_size):
+    self.max_size = max_size
+    self.size = 0
+    # key -> (value, size), least recently used first
+    self.items = collections.OrderedDict()
+    self.lock = threading.Lock()
+
+  def Get(self, key):
+    with self.lock:
+      item = self.items.pop(key, None)
+      if item is None:
+        return None
+      self.items[key] = item
+      return item[0]
+
+  def Put(self, key, value, size):
+    if size > self.max_size:
+      return
+    with self.lock:
+      old = self.items.pop(key, None)
+      if old:
+        self.size -= old[1]
+      self.items[key] = (value, size)
+      self.size += size
+      while self.size > self.max_size:
+        dummy, (dummy, old_size) = self.items.popitem(last=False)
+        self.size -= old_size
+
+# Compressed HARs and summaries by kind:hash_str, (pcapname, data), the
+# DataRecord data of entry blocks by key name, and the block offsets of
+# summaries by 'offsets:' + hash_str.
+har_cache = LRUCache(HAR_CACHE_SIZE)
+
 def GetRequestHostName(request):
   pos = request.url.find(request.path)
   host = ""
@@ -91,57 +202,234 @@ def GetRequestHostName(request):
     host = request.url[0:pos]
   return host
 
+def AcceptsEncoding(accept_encoding, encoding):
+  """
+  Returns whether an Accept-Encoding header value accepts the content
+  coding: listed, or matched by "*", with a q-value above 0.
+  """
+  qvalues = {}
+  for token in accept_encoding.split(','):
+    params = token.split(';')
+    coding = params[0].strip().lower()
+    if not coding:
+      continue
+    qvalue = 1.0
+    for param in params[1:]:
+      name, dummy, value = param.partition('=')
+      if name.strip().lower() == 'q':
+        try:
+          qvalue = float(value)
+        except ValueError:
+          qvalue = 0.0
+    qvalues[coding] = qvalue
+  if encoding in qvalues:
+    return qvalues[encoding] > 0
+  return qvalues.get('*', 0) > 0
+
+class DataWriter(object):
+  """
+  File-like object that saves the data written to it in DataRecords, each
+  record as soon as it is full, so the data never has to be held in memory
+  all at once. The PcapHarInfo is saved by close(), once all the records
+  are.
+  """
+  def __init__(self, kind, hash_str, pcapname):
+    self.data_hash = ':'.join([kind, hash_str])
+    self.pcapname = pcapname
+    self.pending = []
+    self.pending_size = 0
+    self.data_count = 0
+    # Records waiting to be saved in one batch.
+    self.records = []
+    # Time spent saving records.
+    self.duration = 0
+    # Other PcapHarInfo properties saved by close().
+    self.info_values = {}
+
+  def SaveRecord(self, data):
+    record = DataRecord(key_name=DataRecordKeyName(self.data_hash,
+                                                   self.data_count))
+    record.hash_str = self.data_hash
+    record.index = self.data_count
+    record.data = data
+    self.records.append(record)
+    self.data_count += 1
+    if len(self.records) >= PUT_BATCH_SIZE:
+      self.PutRecords()
+
+  def PutRecords(self):
+    start_time = time.time()
+    db.put(self.records)
+    self.records = []
+    self.duration += time.time() - start_time
+
+  def write(self, data):
+    self.pending.append(data)
+    self.pending_size += len(data)
+    if self.pending_size >= CHUNK_SIZE:
+      data = ''.join(self.pending)
+      start = 0
+      while len(data) - start >= CHUNK_SIZE:
+        self.SaveRecord(data[start:start + CHUNK_SIZE])
+        start += CHUNK_SIZE
+      self.pending = [data[start:]]
+      self.pending_size = len(data) - start
+
+  def Flush(self):
+    """
+    Saves the last records, without an info. Returns the time spent saving.
+    """
+    self.SaveRecord(''.join(self.pending))
+    self.pending = []
+    self.pending_size = 0
+    self.PutRecords()
+    return self.duration
+
+  def close(self):
+    """
+    Saves the last records and the info. Returns the time spent saving.
+    """
+    self.Flush()
+    start_time = time.time()
+    info = GetPcapHarInfo(self.data_hash)
+    if not info:
+      info = PcapHarInfo(key_name=self.data_hash)
+      info.hash_str = self.data_hash
+    info.data_count = self.data_count
+    info.pcapname = self.pcapname
+    for name, value in self.info_values.iteritems():
+      setattr(info, name, value)
+    info.put()
+    self.duration += time.time() - start_time
+    return self.duration
+
+class EntryBlockWriter(object):
+  """
+  Saves the entry blocks of a har.SplitWriter, each compressed on its own,
+  one after the other in the DataRecords of a DataWriter of kind 'hare'.
+  The records are put in batches like any other data, and have no info of
+  their own: offsets, the positions of the blocks in the data, are saved
+  on the info of the summary. See LoadEntries.
+  """
+  def __init__(self, hash_str):
+    self.writer = DataWriter('hare', hash_str, None)
+    self.offsets = [0]
+
+  def __call__(self, block, text):
+    data = zlib.compress(text)
+    self.writer.write(data)
+    self.offsets.append(self.offsets[-1] + len(data))
+
+  def close(self):
+    """
+    Saves the last records. Returns the time spent saving.
+    """
+    return self.writer.Flush()
+
 def SaveData(kind, hash_str, pcapname, data):
   start_time = time.time()
-  # Compress the data before save.
-  compressed_data = zlib.compress(data)
-  # Calculate the count of records.
-  size = len(compressed_data)
-  chunk_size = 1000000
-  data_count = int(size / chunk_size) + 1
-  data_hash = ':'.join([kind, hash_str])
-
-  # Save info
-  info = GetPcapHarInfo(data_hash)
-  if not info:
-    info = PcapHarInfo()
-    info.hash_str = data_hash
-  info.data_count = data_count
-  info.pcapname = pcapname
-  info.put()
-
-  # Create each data record and save it.
-  for idx in range(data_count):
-    record = GetDataRecord(data_hash, idx)
-    if not record:
-      record = DataRecord()
-      record.hash_str = data_hash
-      record.index = idx
-    start = idx*chunk_size
-    end = (idx+1)*chunk_size
-    if size < end:
-      end = size
-    record.data = compressed_data[start:end]
-    record.put()
+  # Compress the data while saving it.
+  writer = DataWriter(kind, hash_str, pcapname)
+  compressed_out = har.CompressingWriter(writer)
+  compressed_out.write(data)
+  compressed_out.close()
+  writer.close()
   return time.time() - start_time
 
-def LoadData(kind, hash_str):
+def LoadCompressedData(kind, hash_str):
+  """
+  Loads saved data without decompressing it. Returns (name, data, duration),
+  name and data are None if the data is not found.
+  """
   start_time = time.time()
   data_hash = ':'.join([kind, hash_str])
   info = GetPcapHarInfo(data_hash)
   if not info:
-    return None, None
-  data_a = []
+    return None, None, time.time() - start_time
   logging.info("Data count:" + str(info.data_count))
-  for idx in range(info.data_count):
-    record = GetDataRecord(data_hash, idx)
+  keys = [db.Key.from_path('DataRecord', DataRecordKeyName(data_hash, idx))
+          for idx in range(info.data_count)]
+  records = db.get(keys)
+  data_a = []
+  for idx, record in enumerate(records):
+    if not record:
+      record = GetDataRecord(data_hash, idx)
     if not record:
       logging.error("Not found: " + data_hash + " -- " + str(idx))
-      return None, None
+      return None, None, time.time() - start_time
     data_a.append(record.data)
-  data = zlib.decompress(''.join(data_a))
   duration = time.time() - start_time
-  return info.pcapname, data, duration
+  return info.pcapname, ''.join(data_a), duration
+
+def LoadData(kind, hash_str):
+  start_time = time.time()
+  name, data, duration = LoadCompressedData(kind, hash_str)
+  if data is not None:
+    data = zlib.decompress(data)
+  duration = time.time() - start_time
+  return name, data, duration
+
+def LoadCachedData(kind, hash_str):
+  """
+  LoadCompressedData through har_cache.
+  """
+  data_hash = ':'.join([kind, hash_str])
+  cached = har_cache.Get(data_hash)
+  if cached:
+    name, data = cached
+    return name, data, 0
+  name, data, duration = LoadCompressedData(kind, hash_str)
+  if name:
+    har_cache.Put(data_hash, (name, data), len(data))
+  return name, data, duration
+
+def LoadEntries(hash_str, start, count):
+  """
+  Loads the complete entries start to start + count - 1 of a converted HAR,
+  fewer at the end of the HAR. Returns their json texts, or None if the HAR
+  has no summary. Only the DataRecords that hold the entry blocks of the
+  entries are loaded, in one call, unless they are in har_cache.
+  """
+  offsets_key = 'offsets:' + hash_str
+  offsets = har_cache.Get(offsets_key)
+  if offsets is None:
+    info = GetPcapHarInfo('hars:' + hash_str)
+    if not info:
+      return None
+    offsets = info.block_offsets
+    har_cache.Put(offsets_key, offsets, 8 * len(offsets))
+  slices = [(block, first, end)
+            for block, first, end in har.block_slices(start, count)
+            if block < len(offsets) - 1]
+  if not slices:
+    return []
+  # The records from the one of the first block to the one of the last.
+  data_start = offsets[slices[0][0]]
+  data_end = offsets[slices[-1][0] + 1]
+  data_hash = 'hare:' + hash_str
+  names = [DataRecordKeyName(data_hash, idx)
+           for idx in range(data_start / CHUNK_SIZE,
+                            (data_end - 1) / CHUNK_SIZE + 1)]
+  chunks = dict((name, har_cache.Get(name)) for name in names)
+  missing = [name for name in names if chunks[name] is None]
+  if missing:
+    records = db.get([db.Key.from_path('DataRecord', name)
+                      for name in missing])
+    for name, record in zip(missing, records):
+      if not record:
+        logging.error("Not found: " + name)
+        return None
+      chunks[name] = record.data
+      har_cache.Put(name, record.data, len(record.data))
+  data = ''.join(chunks[name] for name in names)
+  data_start -= data_start % CHUNK_SIZE
+  entries = []
+  for block, first, end in slices:
+    text = zlib.decompress(data[offsets[block] - data_start:
+                                offsets[block + 1] - data_start])
+    # The blocks hold one json entry per line.
+    entries.extend(text.split('\n')[first:end])
+  return entries
 
 class MainPage(webapp2.RequestHandler):
   def get(self):
@@ -171,11 +459,20 @@ class View(webapp2.RequestHandler):
   def get(self):
     host = GetRequestHostName(self.request)
     hash_str = self.request.get('hash_str')
-    har_url = host + "/download/i/"+hash_str
+    # The viewer loads the summary, and the entry details when they are
+    # shown. Uploaded HARs and older conversions have no summary, the viewer
+    # loads the whole HAR.
+    if GetPcapHarInfo('hars:' + hash_str):
+      har_url = host + "/download/s/" + hash_str
+      entries_url = host + "/entries/" + hash_str
+    else:
+      har_url = host + "/download/i/" + hash_str
+      entries_url = ''
 
     template_values = {
       'hash_str': hash_str,
       'har_url': har_url,
+      'entries_url': entries_url,
     }
 
     template = jinja_environment.get_template('templates/harview.html')
@@ -199,16 +496,23 @@ class Converter(webapp2.RequestHandler):
       return None
     return upload_input
 
-  def ConvertPcapToHar(self, pcap_input, har_out, pcap_input_name):
+  def GetOptions(self):
     options = convert.Options()
     logging.info("Remove Cookie: %s", self.request.get('removecookies'))
     if not self.request.get('removecookies'):
       options.remove_cookies = False
+    return options
 
+  def ConvertPcapToHar(self, pcap_input, har_out, pcap_input_name, options):
     try:
       start_time = time.time()
-      convert.convert(pcap_input, har_out, options)
+      conversion_stats = convert.convert(pcap_input, har_out, options)
       self.perf_record.convert = time.time() - start_time
+      for stage in stats.STAGES:
+        setattr(self.perf_record, stage, conversion_stats.wall[stage])
+      self.perf_record.cpu = conversion_stats.total_cpu()
+      for name, counter in TIMING_COUNTERS:
+        setattr(self.perf_record, name, getattr(conversion_stats, counter))
     except:
       template_values = {
         'upfile_name': pcap_input_name,
@@ -233,27 +537,51 @@ class Converter(webapp2.RequestHandler):
     md5 = hashlib.md5()
     md5.update(pcap_input)
     pcap_hash_str = md5.hexdigest()
-    # Save the pcap data.
-    duration = SaveData('pcap', pcap_hash_str, pcap_input_name, pcap_input)
-    self.perf_record.savepcap = duration
+    # Save the pcap data, unless it was uploaded before.
+    if not GetPcapHarInfo('pcap:' + pcap_hash_str):
+      duration = SaveData('pcap', pcap_hash_str, pcap_input_name, pcap_input)
+      self.perf_record.savepcap = duration
 
+    # Save the har data, compressed and chunked while it is written.
     if pcap_input_name[-4:] == '.har':
-        har_out_str = pcap_input
+      hash_str = pcap_hash_str
+      if GetPcapHarInfo('har :' + hash_str):
+        logging.info("Already uploaded: %s", hash_str)
+      else:
+        duration = SaveData('har ', hash_str, pcap_input_name, pcap_input)
+        self.perf_record.savehar = duration
     else:
-        har_out = StringIO.StringIO()
-        if not self.ConvertPcapToHar(pcap_input, har_out, pcap_input_name):
-            return
-        har_out_str = har_out.getvalue()
-
-    # Save the har data.
-    duration = SaveData('har ', pcap_hash_str, pcap_input_name, har_out_str)
-    self.perf_record.savehar = duration
+      options = self.GetOptions()
+      hash_str = ConversionKey(pcap_hash_str, options)
+      if GetPcapHarInfo('har :' + hash_str):
+        logging.info("Already converted: %s", hash_str)
+      else:
+        # The complete HAR for download, the summary and the entry blocks
+        # for the viewer.
+        har_writer = DataWriter('har ', hash_str, pcap_input_name)
+        har_out = har.CompressingWriter(har_writer)
+        summary_writer = DataWriter('hars', hash_str, pcap_input_name)
+        summary_out = har.CompressingWriter(summary_writer)
+        block_writer = EntryBlockWriter(hash_str)
+        split_out = har.SplitWriter(har.StreamWriter(har_out),
+                                    har.StreamWriter(summary_out, indent=None),
+                                    block_writer)
+        if not self.ConvertPcapToHar(pcap_input, split_out, pcap_input_name,
+                                     options):
+          return
+        har_out.close()
+        summary_out.close()
+        # The summary is saved last: View only uses the blocks once it is.
+        summary_writer.info_values['block_offsets'] = block_writer.offsets
+        self.perf_record.savehar = (har_writer.close() +
+                                    block_writer.close() +
+                                    summary_writer.close())
 
     # Show the waterfall view.
-    self.redirect("/view?hash_str=" + pcap_hash_str)
+    self.redirect("/view?hash_str=" + hash_str)
     self.perf_record.total = time.time() - total_time_start
     logging.info("Total time:" + str(self.perf_record.total))
-    self.perf_record.hash_str = pcap_hash_str
+    self.perf_record.hash_str = hash_str
     self.perf_record.put()
 
 
@@ -267,8 +595,11 @@ class Download(webapp2.RequestHandler):
   """
   Dowland handler.
 
-  The converted HAR is shared across requests. Latest convert for the same pcap
-  file will overwrite the content.
+  The converted HAR is shared across requests. Each pcap is converted once per
+  set of options, so the HAR of a hash_str never changes and can be cached.
+  The "d" download is served compressed if the client accepts deflate. The
+  "i" and "s" downloads are the HAR and its summary for the viewer, as
+  JSONP.
   """
   def get(self, download, hash_str):
     """
@@ -276,7 +607,11 @@ class Download(webapp2.RequestHandler):
     """
     self.perf_record = TimingRecord()
     total_time_start = time.time()
-    name, data, duration = LoadData('har ', hash_str)
+    if download == "s":
+      kind = 'hars'
+    else:
+      kind = 'har '
+    name, data, duration = LoadCachedData(kind, hash_str)
     self.perf_record.loadhar = duration
     if not name:
       self.response.out.write('<html><body>')
@@ -287,10 +622,10 @@ class Download(webapp2.RequestHandler):
 
     logging.info("path=%s", self.request.path)
     headers = self.response.headers
-    if download == "i":
+    if download in ("i", "s"):
       headers['Content-Type'] = 'text/javascript'
       self.response.out.write("onInputData(")
-      self.response.out.write(data)
+      self.response.out.write(zlib.decompress(data))
       self.response.out.write(");")
     else:
       headers['Content-Type'] = 'text/plain'
@@ -300,13 +635,58 @@ class Download(webapp2.RequestHandler):
       else:
         download_name = str(name) + '.har'
       headers['Content-disposition'] = 'attachment; filename=' + download_name
-      self.response.out.write(data)
+      # The data is saved as a zlib stream, which is what HTTP calls deflate.
+      if AcceptsEncoding(self.request.headers.get('Accept-Encoding', ''),
+                         'deflate'):
+        headers['Content-Encoding'] = 'deflate'
+        self.response.out.write(data)
+      else:
+        self.response.out.write(zlib.decompress(data))
     self.perf_record.total = time.time() - total_time_start
     logging.info("Total time:" + str(self.perf_record.total))
     self.perf_record.hash_str = hash_str
     self.perf_record.put()
 
 
+class Entries(webapp2.RequestHandler):
+  """
+  Serves complete entries of a converted HAR, for the viewer to show the
+  details of the entries of the summary.
+
+  Parameters: start, the index of the first entry, count, the number of
+  entries (1 by default), and callback, to get JSONP. The response is
+  {"start": start, "entries": [entry]}, with fewer entries than asked at the
+  end of the HAR. See LoadEntries.
+  """
+  def get(self, hash_str):
+    try:
+      start = int(self.request.get('start', 0))
+      count = int(self.request.get('count', 1))
+    except ValueError:
+      self.error(400)
+      return
+    callback = self.request.get('callback')
+    if start < 0 or count < 1 or (callback and
+                                  not CALLBACK_PATTERN.match(callback)):
+      self.error(400)
+      return
+    count = min(count, MAX_ENTRIES_PER_REQUEST)
+
+    entries = LoadEntries(hash_str, start, count)
+    if entries is None:
+      self.error(404)
+      return
+
+    headers = self.response.headers
+    text = '{"start": %d, "entries": [%s]}' % (start, ',\n'.join(entries))
+    if callback:
+      headers['Content-Type'] = 'text/javascript'
+      self.response.out.write('%s(%s);' % (callback, text))
+    else:
+      headers['Content-Type'] = 'application/json'
+      self.response.out.write(text)
+
+
 class Timing(webapp2.RequestHandler):
   """
   Show timing info.
@@ -315,12 +695,8 @@ class Timing(webapp2.RequestHandler):
     time_start = time.time()
     self.response.out.write('<table><tr>\n')
     self.response.out.write('<th>date')
-    self.response.out.write('<th>upload')
-    self.response.out.write('<th>savepcap')
-    self.response.out.write('<th>convert')
-    self.response.out.write('<th>savehar')
-    self.response.out.write('<th>loadhar')
-    self.response.out.write('<th>total')
+    for column in TIMING_COLUMNS:
+      self.response.out.write('<th>' + column)
     self.response.out.write('<th>hash')
     self.response.out.write('\n</tr>\n')
 
@@ -329,18 +705,9 @@ class Timing(webapp2.RequestHandler):
     for record in results:
       self.response.out.write('<tr><td>')
       self.response.out.write(str(record.date))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.upload or ""))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.savepcap or ""))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.convert or ""))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.savehar or ""))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.loadhar  or ""))
-      self.response.out.write(' <td> ')
-      self.response.out.write(str(record.total or ""))
+      for column in TIMING_COLUMNS:
+        self.response.out.write(' <td> ')
+        self.response.out.write(str(getattr(record, column) or ""))
       #self.response.out.write(' <td> ')
       #self.response.out.write(record.hash_str)
       self.response.out.write('\n<tr>\n')
@@ -357,5 +724,6 @@ app = webapp2.WSGIApplication(
        ('/view', View),
        ('/timing', Timing),
        (r'/download/(.*)/(.*)', Download),
+       (r'/entries/(.*)', Entries),
        ],
       debug=True)
@@ -0,0 +1,253 @@
+# Copyright 2010 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests of the pcaphar storage and conversion cache, against the datastore
+stub of the App Engine testbed.
+
+Run with the App Engine SDK and its libraries on sys.path:
+  python pcaphar_test.py
+"""
+
+import json
+import os
+import unittest
+import zlib
+
+from google.appengine.datastore import datastore_stub_util
+from google.appengine.ext import db
+from google.appengine.ext import testbed
+
+import webapp2
+
+import pcaphar
+from pcap2har import convert
+
+SAMPLE_PCAP = os.path.join(os.path.dirname(__file__), 'third_party',
+                           'pcap2har', 'http.cap')
+
+
+class DatastoreTestCase(unittest.TestCase):
+  """
+  Runs each test on an empty, strongly consistent datastore stub, with a
+  small CHUNK_SIZE and an empty har_cache, and counts the db.put calls.
+  """
+  def setUp(self):
+    self.testbed = testbed.Testbed()
+    self.testbed.activate()
+    policy = datastore_stub_util.PseudoRandomHRConsistencyPolicy(
+        probability=1)
+    self.testbed.init_datastore_v3_stub(consistency_policy=policy)
+    self.testbed.init_memcache_stub()
+    self.chunk_size = pcaphar.CHUNK_SIZE
+    pcaphar.CHUNK_SIZE = 10
+    pcaphar.har_cache = pcaphar.LRUCache(pcaphar.HAR_CACHE_SIZE)
+    self.puts = []
+    self.db_put = db.put
+    def CountingPut(models, **kwargs):
+      self.puts.append(len(models))
+      return self.db_put(models, **kwargs)
+    pcaphar.db.put = CountingPut
+
+  def tearDown(self):
+    pcaphar.db.put = self.db_put
+    pcaphar.CHUNK_SIZE = self.chunk_size
+    self.testbed.deactivate()
+
+
+class DataWriterTest(DatastoreTestCase):
+  def testRecordsAreBatchedWithKeyNames(self):
+    writer = pcaphar.DataWriter('har ', 'abc', 'test.pcap')
+    data = ''.join(chr(ord('a') + idx % 26) for idx in range(95))
+    # written in pieces that do not fall on record boundaries
+    for start in range(0, len(data), 7):
+      writer.write(data[start:start + 7])
+    writer.close()
+
+    # 9 full records and the rest, saved 4 at a time
+    self.assertEqual([4, 4, 2], self.puts)
+    for idx in range(10):
+      record = pcaphar.DataRecord.get_by_key_name('har :abc:%d' % idx)
+      self.assertEqual('har :abc', record.hash_str)
+      self.assertEqual(idx, record.index)
+      self.assertEqual(data[idx * 10:idx * 10 + 10], record.data)
+    info = pcaphar.GetPcapHarInfo('har :abc')
+    self.assertEqual('har :abc', info.key().name())
+    self.assertEqual(10, info.data_count)
+    self.assertEqual('test.pcap', info.pcapname)
+
+  def testSaveAndLoadData(self):
+    data = 'x' * 25 + 'y' * 25
+    pcaphar.SaveData('pcap', 'abc', 'test.pcap', data)
+    name, loaded, duration = pcaphar.LoadData('pcap', 'abc')
+    self.assertEqual('test.pcap', name)
+    self.assertEqual(data, loaded)
+
+  def testLoadMissingData(self):
+    self.assertEqual((None, None),
+                     pcaphar.LoadCompressedData('har ', 'nothing')[:2])
+
+
+class LoadCompressedDataTest(DatastoreTestCase):
+  def testRecordsWithoutKeyNames(self):
+    # records and info saved before they had key names
+    data = zlib.compress('legacy data')
+    for idx, start in enumerate(range(0, len(data), 10)):
+      pcaphar.DataRecord(hash_str='har :old', index=idx,
+                         data=data[start:start + 10]).put()
+    pcaphar.PcapHarInfo(hash_str='har :old', pcapname='old.pcap',
+                        data_count=idx + 1).put()
+
+    name, loaded, duration = pcaphar.LoadCompressedData('har ', 'old')
+    self.assertEqual('old.pcap', name)
+    self.assertEqual(data, loaded)
+
+  def testMixedRecords(self):
+    data = zlib.compress('some data')
+    pcaphar.DataRecord(key_name='har :mixed:0', hash_str='har :mixed',
+                       index=0, data=data[:10]).put()
+    pcaphar.DataRecord(hash_str='har :mixed', index=1, data=data[10:]).put()
+    pcaphar.PcapHarInfo(hash_str='har :mixed', pcapname='mixed.pcap',
+                        data_count=2).put()
+
+    self.assertEqual(data, pcaphar.LoadCompressedData('har ', 'mixed')[1])
+
+  def testMissingRecord(self):
+    pcaphar.PcapHarInfo(hash_str='har :lost', pcapname='lost.pcap',
+                        data_count=1).put()
+    self.assertEqual((None, None),
+                     pcaphar.LoadCompressedData('har ', 'lost')[:2])
+
+
+class LRUCacheTest(unittest.TestCase):
+  def testEvictsLeastRecentlyUsed(self):
+    cache = pcaphar.LRUCache(10)
+    cache.Put('a', 'A', 4)
+    cache.Put('b', 'B', 4)
+    self.assertEqual('A', cache.Get('a'))
+    # b is the least recently used now
+    cache.Put('c', 'C', 4)
+    self.assertEqual(None, cache.Get('b'))
+    self.assertEqual('A', cache.Get('a'))
+    self.assertEqual('C', cache.Get('c'))
+    self.assertEqual(8, cache.size)
+
+  def testReplacesValue(self):
+    cache = pcaphar.LRUCache(10)
+    cache.Put('a', 'A', 4)
+    cache.Put('a', 'AA', 6)
+    self.assertEqual('AA', cache.Get('a'))
+    self.assertEqual(6, cache.size)
+
+  def testIgnoresValuesAboveMaxSize(self):
+    cache = pcaphar.LRUCache(10)
+    cache.Put('a', 'A', 4)
+    cache.Put('big', 'BIG', 11)
+    self.assertEqual(None, cache.Get('big'))
+    self.assertEqual('A', cache.Get('a'))
+
+
+class AcceptsEncodingTest(unittest.TestCase):
+  def testEncodings(self):
+    self.assertTrue(pcaphar.AcceptsEncoding('gzip, deflate', 'deflate'))
+    self.assertTrue(pcaphar.AcceptsEncoding('Deflate;q=0.5', 'deflate'))
+    self.assertTrue(pcaphar.AcceptsEncoding('identity, *', 'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('', 'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('gzip', 'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('deflate;q=0', 'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('gzip, deflate; q=0.0',
+                                             'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('deflate;q=0, *', 'deflate'))
+    self.assertFalse(pcaphar.AcceptsEncoding('*;q=0', 'deflate'))
+
+
+class ConverterTest(DatastoreTestCase):
+  def setUp(self):
+    DatastoreTestCase.setUp(self)
+    pcaphar.CHUNK_SIZE = self.chunk_size
+    self.conversions = 0
+    self.convert = convert.convert
+    def CountingConvert(*args):
+      self.conversions += 1
+      return self.convert(*args)
+    convert.convert = CountingConvert
+    f = open(SAMPLE_PCAP, 'rb')
+    self.pcap = f.read()
+    f.close()
+
+  def tearDown(self):
+    convert.convert = self.convert
+    DatastoreTestCase.tearDown(self)
+
+  def Upload(self, removecookies=True, name='http.cap', data=None):
+    post = {'upfile': (name, data or self.pcap)}
+    if removecookies:
+      post['removecookies'] = 'on'
+    request = webapp2.Request.blank('/convert', POST=post)
+    response = request.get_response(pcaphar.app)
+    self.assertEqual(302, response.status_int)
+    return response.headers['Location'].split('hash_str=')[1]
+
+  def testConvertsOncePerOptions(self):
+    hash_str = self.Upload()
+    self.assertEqual(1, self.conversions)
+    # same capture and options: the HAR is reused
+    self.assertEqual(hash_str, self.Upload())
+    self.assertEqual(1, self.conversions)
+    # other options: converted again, under another key
+    other_hash_str = self.Upload(removecookies=False)
+    self.assertNotEqual(hash_str, other_hash_str)
+    self.assertEqual(2, self.conversions)
+
+    name, data, duration = pcaphar.LoadData('har ', hash_str)
+    self.assertEqual('http.cap', name)
+    entries = json.loads(data)['log']['entries']
+    self.assertTrue(entries)
+    self.assertEqual(
+        [json.loads(entry) for entry in
+         pcaphar.LoadEntries(hash_str, 0, len(entries) + 1)], entries)
+
+  def testStoresHarOnce(self):
+    saved = []
+    save_data = pcaphar.SaveData
+    def CountingSaveData(kind, *args):
+      saved.append(kind)
+      return save_data(kind, *args)
+    pcaphar.SaveData = CountingSaveData
+    try:
+      har_data = json.dumps({'log': {'entries': []}})
+      hash_str = self.Upload(name='test.har', data=har_data)
+      self.assertEqual(hash_str, self.Upload(name='test.har', data=har_data))
+    finally:
+      pcaphar.SaveData = save_data
+    self.assertEqual(['pcap', 'har '], saved)
+    self.assertEqual(0, self.conversions)
+    self.assertEqual(har_data, pcaphar.LoadData('har ', hash_str)[1])
+
+  def testKeyDependsOnVersionAndOptions(self):
+    options = convert.Options()
+    key = pcaphar.ConversionKey('abc', options)
+    self.assertEqual(key, pcaphar.ConversionKey('abc', convert.Options()))
+    self.assertTrue(key.startswith('abc-'))
+    options.content = 'none'
+    self.assertNotEqual(key, pcaphar.ConversionKey('abc', options))
+    # options that don't change the HAR don't change the key
+    options = convert.Options()
+    options.workers = 4
+    self.assertEqual(key, pcaphar.ConversionKey('abc', options))
+
+
+if __name__ == '__main__':
+  unittest.main()
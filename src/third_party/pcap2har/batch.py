@@ -0,0 +1,298 @@
+#!/usr/bin/python
+'''
+Converts many captures to HAR in one run.
+
+Inputs are files, directories (searched recursively for captures) and glob
+patterns. The files are converted on a pool of worker processes, which stay
+up for the whole run, so the interpreter starts and the modules are imported
+once per worker rather than once per file.
+
+Every conversion is recorded in a manifest, with the MD5 of the capture and
+the conversion options. On the next run, captures whose content and options
+did not change, and whose HAR is still there, are skipped. A capture that
+fails to convert is reported and the run goes on; its HAR is not written.
+
+A line is printed for every file as it is done, and a summary at the end.
+The exit status is 1 if any capture failed.
+
+Usage: batch.py [options] <file, directory or glob> ...
+'''
+
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import optparse
+import os
+import sys
+import time
+
+# add third_party directory to sys.path for global import, like main.py
+path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(path)
+sys.path.append(os.path.join(path, 'dpkt'))
+
+import convert
+import har
+
+CAPTURE_EXTENSIONS = '.pcap,.cap,.pcapng'
+MANIFEST_NAME = 'pcap2har-manifest.json'
+# Results after which the manifest is saved, so that an interrupted run
+# does not start over.
+MANIFEST_SAVE_INTERVAL = 50
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_hash(filename):
+  '''
+  returns the hex MD5 of the content of the file.
+  '''
+  md5 = hashlib.md5()
+  f = open(filename, 'rb')
+  try:
+    while True:
+      block = f.read(HASH_BLOCK_SIZE)
+      if not block:
+        break
+      md5.update(block)
+  finally:
+    f.close()
+  return md5.hexdigest()
+
+
+def options_key(options, stream, compress):
+  '''
+  returns the manifest key of the convert.Options and output settings.
+  '''
+  return hashlib.md5(repr((options.result_items(), stream,
+                           compress))).hexdigest()
+
+
+def find_inputs(args, extensions):
+  '''
+  returns [(capture file, output name)] for the files, directories and glob
+  patterns of args. Files found in a directory are named by their path in
+  it, the others by their file name.
+  '''
+  inputs = []
+  for arg in args:
+    if os.path.isdir(arg):
+      for dirpath, dirnames, filenames in os.walk(arg):
+        dirnames.sort()
+        for filename in sorted(filenames):
+          if os.path.splitext(filename)[1].lower() in extensions:
+            filename = os.path.join(dirpath, filename)
+            inputs.append((filename, os.path.relpath(filename, arg)))
+    else:
+      filenames = sorted(glob.glob(arg))
+      if not filenames:
+        logging.warning('no capture matches %s', arg)
+      for filename in filenames:
+        if os.path.isfile(filename):
+          inputs.append((filename, os.path.basename(filename)))
+  return inputs
+
+
+def load_manifest(filename):
+  '''
+  returns {capture file: entry} from the manifest file, empty if there is
+  none yet.
+  '''
+  if not os.path.exists(filename):
+    return {}
+  f = open(filename)
+  try:
+    return json.load(f)
+  finally:
+    f.close()
+
+
+def save_manifest(filename, manifest):
+  '''
+  writes the manifest, replacing the previous one only once it is complete.
+  '''
+  temp = filename + '.tmp'
+  f = open(temp, 'w')
+  try:
+    json.dump(manifest, f, indent=2, sort_keys=True)
+  finally:
+    f.close()
+  os.rename(temp, filename)
+
+
+def init_worker(logging_level):
+  logging.basicConfig(level=logging_level)
+
+
+def convert_file(task):
+  '''
+  converts a capture in a worker process, unless the previous manifest entry
+  shows it is up to date. Never raises: failures are returned.
+
+  Args:
+  task = (capture file, HAR file, convert.Options, streaming, compress,
+          previous manifest entry or None)
+  Returns the manifest entry of the capture, a dict with its status 'ok',
+  'skipped' or 'failed', and the timings and counters of the conversion.
+  '''
+  pcap_file, har_file, options, stream, compress, previous = task
+  start = time.time()
+  result = {'har': har_file,
+            'options': options_key(options, stream, compress)}
+  try:
+    result['hash'] = file_hash(pcap_file)
+    if (previous and previous.get('status') != 'failed' and
+        previous.get('hash') == result['hash'] and
+        previous.get('options') == result['options'] and
+        previous.get('har') == har_file and os.path.exists(har_file)):
+      result.update(previous)
+      result['status'] = 'skipped'
+      result['time'] = time.time() - start
+      return pcap_file, result
+    directory = os.path.dirname(har_file)
+    if directory and not os.path.isdir(directory):
+      os.makedirs(directory)
+    # write to a temporary file, a failed conversion leaves no HAR behind
+    temp = har_file + '.tmp'
+    outf = open(temp, 'wb')
+    try:
+      if compress:
+        har_out = har.CompressingWriter(outf, 'gzip')
+      else:
+        har_out = outf
+      inf = open(pcap_file, 'rb')
+      try:
+        if stream:
+          stats = convert.convert_stream(inf, har_out, options)
+        else:
+          stats = convert.convert(inf, har_out, options)
+      finally:
+        inf.close()
+      if compress:
+        har_out.close()
+    finally:
+      outf.close()
+    os.rename(temp, har_file)
+    result['status'] = 'ok'
+    result['entries'] = stats.entries
+    result['packets'] = stats.packets_seen
+    result['cpu'] = stats.total_cpu()
+  except Exception, error:
+    logging.debug('%s failed', pcap_file, exc_info=True)
+    result['status'] = 'failed'
+    result['error'] = '%s: %s' % (error.__class__.__name__, error)
+    if os.path.exists(har_file + '.tmp'):
+      os.remove(har_file + '.tmp')
+  result['time'] = time.time() - start
+  return pcap_file, result
+
+
+def print_result(pcap_file, result):
+  if result['status'] == 'failed':
+    print '%-7s %8.2fs %7s  %s  %s' % (result['status'], result['time'], '',
+                                       pcap_file, result['error'])
+  else:
+    print '%-7s %8.2fs %7d  %s' % (result['status'], result['time'],
+                                   result.get('entries', 0), pcap_file)
+  sys.stdout.flush()
+
+
+def main(argv=None):
+  parser = optparse.OptionParser(
+      usage='%prog [options] <file, directory or glob> ...')
+  parser.add_option('-j', '--jobs', type='int',
+                    default=multiprocessing.cpu_count(),
+                    help='worker processes [%default]')
+  parser.add_option('-o', '--output-dir',
+                    help='directory of the HARs, next to the captures by '
+                    'default')
+  parser.add_option('--manifest',
+                    help='manifest file [<output dir>/%s]' % MANIFEST_NAME)
+  parser.add_option('--force', action='store_true', default=False,
+                    help='convert unchanged captures too')
+  parser.add_option('--extensions', default=CAPTURE_EXTENSIONS,
+                    help='capture file extensions searched in directories '
+                    '[%default]')
+  parser.add_option('--port', type='int', action='append', default=[],
+                    help='filter out a port')
+  parser.add_option('--filter', action='append', default=[],
+                    help='filter out matching traffic, see main.py')
+  parser.add_option('--only', action='append', default=[],
+                    help='only convert matching connections, see main.py')
+  parser.add_option('--stream', action='store_true', default=False,
+                    help='convert flows as they close, with bounded memory')
+  parser.add_option('--content', choices=convert.http.CONTENT_MODES,
+                    help='response bodies in the HAR: none, text-only, '
+                    'capped or full')
+  parser.add_option('--content-limit', type='int',
+                    help='bytes kept per body in capped mode')
+  parser.add_option('--compact', action='store_true', default=False,
+                    help='write the HARs without indentation')
+  parser.add_option('--columnar', action='store_true', default=False,
+                    help='read the captures into a NumPy packet table')
+  parser.add_option('-z', action='store_true', dest='compress',
+                    default=False, help='write the HARs gzip compressed')
+  parser.add_option('-l', dest='logging_level', default='error',
+                    choices=['debug', 'info', 'warning', 'error'],
+                    help='log level [%default]')
+  flags, args = parser.parse_args(argv)
+  if not args:
+    parser.error('no captures to convert')
+
+  logging_level = getattr(logging, flags.logging_level.upper())
+  logging.basicConfig(level=logging_level)
+
+  options = convert.Options()
+  options.exclude.extend('port %d' % port for port in flags.port)
+  options.exclude.extend(flags.filter)
+  options.include.extend(flags.only)
+  if flags.content is not None:
+    options.content = flags.content
+  if flags.content_limit is not None:
+    options.content_limit = flags.content_limit
+  options.compact = flags.compact
+  options.columnar = flags.columnar
+
+  extensions = [extension.strip().lower()
+                for extension in flags.extensions.split(',')]
+  inputs = find_inputs(args, extensions)
+  manifest_file = flags.manifest or os.path.join(flags.output_dir or '.',
+                                                 MANIFEST_NAME)
+  manifest = load_manifest(manifest_file)
+
+  tasks = []
+  for pcap_file, name in inputs:
+    if flags.output_dir:
+      har_file = os.path.join(flags.output_dir, name + '.har')
+    else:
+      har_file = pcap_file + '.har'
+    previous = None if flags.force else manifest.get(pcap_file)
+    tasks.append((pcap_file, har_file, options, flags.stream, flags.compress,
+                  previous))
+
+  counts = {'ok': 0, 'skipped': 0, 'failed': 0}
+  start = time.time()
+  pool = multiprocessing.Pool(max(1, flags.jobs), init_worker,
+                              (logging_level,))
+  try:
+    for done, (pcap_file, result) in enumerate(
+        pool.imap_unordered(convert_file, tasks)):
+      counts[result['status']] += 1
+      print_result(pcap_file, result)
+      manifest[pcap_file] = result
+      if (done + 1) % MANIFEST_SAVE_INTERVAL == 0:
+        save_manifest(manifest_file, manifest)
+    pool.close()
+    pool.join()
+  finally:
+    pool.terminate()
+    save_manifest(manifest_file, manifest)
+  print '%d converted, %d skipped, %d failed in %.1fs' % (
+      counts['ok'], counts['skipped'], counts['failed'], time.time() - start)
+  if counts['failed']:
+    return 1
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,350 @@
+#!/usr/bin/python
+'''
+Benchmark of the conversion pipeline over synthetic captures of growing
+size.
+
+Each size is written to a temporary capture file, which is converted by
+convert.convert a few times, every time in a new process. The stages are the
+ones of stats.Stats, with the substages of tcp, and are measured within the
+conversion:
+* tcp: reading, filtering and decoding packets, reassembling TCP flows
+  * read: iterating over the records of the capture
+  * decode: packet filter and dpkt decoding
+  * reassembly: adding the packets to their TCP flows, finishing the flows
+* http: parsing the flows for HTTP and decoding the bodies
+* har: building the HTTPSession
+* json: writing the HAR
+The time of a stage is its wall time in the Stats of the conversion. The
+memory of a stage (not of the substages) is how much the RSS of the process
+grew while it ran, as measured by a MemoryMeter attached to it like a
+profiler. The peak RSS of a run is the ru_maxrss of its process. Every run
+starts in a new process, so it does not reuse the memory freed by a
+previous run, and its peak is its own.
+
+The report has, for every stage, the median of the runs of the time, the
+packets/s and capture MB/s it runs at, and the RSS growth, along with the
+noise of the time: the median absolute deviation of the runs, relative to
+their median. The median peak RSS of the runs follows the stages.
+
+Results can be saved as a baseline, and compared against it. A stage
+regressed if its time grew more than the tolerance plus NOISE_FACTOR times
+the noise of either side, or its RSS growth more than the tolerance and
+MIN_RSS. Stages shorter than MIN_TIME on both sides are too short to compare.
+The peak RSS regressed if it grew more than the tolerance and MIN_RSS.
+Regressions are reported, and the exit status is 1.
+
+Usage: run.py [options]
+'''
+
+import json
+import logging
+import optparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# the resource module is only available on Unix
+try:
+  import resource
+except ImportError:
+  resource = None
+
+# add pcap2har and dpkt to sys.path, like main.py
+path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(path)
+sys.path.append(os.path.join(path, '..', 'dpkt'))
+
+import convert
+import stats
+import synth
+
+# stats.STAGES, with the stats.SUBSTAGES of tcp after it
+STAGES = ('tcp', 'read', 'decode', 'reassembly', 'http', 'har', 'json')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'baseline.json')
+
+# stages faster than this many seconds are not compared to the baseline
+MIN_TIME = 0.01
+# MB of RSS growth a stage may gain on top of the tolerance
+MIN_RSS = 1.0
+# times the noise of the runs a stage may slow down on top of the tolerance
+NOISE_FACTOR = 3
+
+if hasattr(os, 'sysconf'):
+  PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+else:
+  PAGE_SIZE = None
+
+
+class NullWriter(object):
+  '''
+  File-like object that only counts what is written to it.
+  '''
+  def __init__(self):
+    self.size = 0
+
+  def write(self, data):
+    self.size += len(data)
+
+
+def peak_rss():
+  '''
+  returns the peak resident set size of the process in MB, or None.
+  '''
+  if not resource:
+    return None
+  maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  if sys.platform == 'darwin':
+    # bytes, kilobytes elsewhere
+    return maxrss / 1048576.0
+  return maxrss / 1024.0
+
+
+def current_rss():
+  '''
+  returns the resident set size of the process in MB, or None if it is not
+  known. Unlike the peak RSS of resource.getrusage, it goes down when memory
+  is given back.
+  '''
+  if not PAGE_SIZE:
+    return None
+  try:
+    statm = open('/proc/self/statm')
+  except IOError:
+    # not Linux
+    return None
+  try:
+    pages = int(statm.read().split()[1])
+  finally:
+    statm.close()
+  return pages * PAGE_SIZE / 1048576.0
+
+
+class MemoryMeter(object):
+  '''
+  Adds up the growth of the RSS of the process while a stage runs. It has
+  the enable() and disable() of a profiler, see stats.
+
+  Members:
+  growth = float, MB, or None if the RSS is not known
+  '''
+  def __init__(self):
+    self.growth = 0.0
+    self.rss = None
+
+  def enable(self):
+    self.rss = current_rss()
+
+  def disable(self):
+    rss = current_rss()
+    if rss is None or self.rss is None:
+      self.growth = None
+    elif self.growth is not None:
+      self.growth += rss - self.rss
+
+
+def run_conversion(capture_file):
+  '''
+  converts the capture file once. Returns {'packets', 'peak_rss',
+  'stages'}, where stages is {stage: {'time', 'rss'}}. The rss of the
+  substages is None.
+  '''
+  options = convert.Options()
+  options.substages = True
+  meters = dict((stage, MemoryMeter()) for stage in stats.STAGES)
+  options.profilers = meters
+  inf = open(capture_file, 'rb')
+  try:
+    conversion_stats = convert.convert(inf, NullWriter(), options)
+  finally:
+    inf.close()
+  stages = {}
+  for stage in stats.STAGES:
+    stages[stage] = {'time': conversion_stats.wall[stage],
+                     'rss': meters[stage].growth}
+  for substage in stats.SUBSTAGES:
+    stages[substage] = {'time': conversion_stats.substage_wall[substage],
+                        'rss': None}
+  return {'packets': conversion_stats.packets_seen, 'peak_rss': peak_rss(),
+          'stages': stages}
+
+
+def run_in_process(capture_file):
+  '''
+  runs run_conversion in a new process. Returns its results.
+  '''
+  child = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                            '--child', capture_file],
+                           stdout=subprocess.PIPE)
+  output = child.communicate()[0]
+  if child.returncode:
+    raise RuntimeError('benchmark of %s failed' % capture_file)
+  return json.loads(output)
+
+
+def median(values):
+  values = sorted(values)
+  middle = len(values) / 2
+  if len(values) % 2:
+    return values[middle]
+  return (values[middle - 1] + values[middle]) / 2.0
+
+
+def noise(values):
+  '''
+  returns the median absolute deviation of values, relative to their median.
+  '''
+  center = median(values)
+  if not center:
+    return 0.0
+  return median([abs(value - center) for value in values]) / center
+
+
+def run_size(config, repeat):
+  '''
+  generates the capture of config and converts it repeat times. Returns the
+  medians of the runs, with the size of the capture.
+  '''
+  fd, capture_file = tempfile.mkstemp(suffix='.pcap')
+  out = os.fdopen(fd, 'wb')
+  try:
+    try:
+      packets = synth.generate(config, out)
+    finally:
+      out.close()
+    size = os.path.getsize(capture_file)
+    runs = [run_in_process(capture_file) for dummy in range(repeat)]
+  finally:
+    os.remove(capture_file)
+
+  results = {'packets': packets, 'bytes': size, 'runs': repeat,
+             'peak_rss': None, 'stages': {}}
+  peaks = [run['peak_rss'] for run in runs]
+  if None not in peaks:
+    results['peak_rss'] = median(peaks)
+  for stage in STAGES:
+    times = [run['stages'][stage]['time'] for run in runs]
+    growths = [run['stages'][stage]['rss'] for run in runs]
+    seconds = median(times)
+    values = {'time': seconds, 'noise': noise(times),
+              'packets_per_s': None, 'mb_per_s': None, 'rss': None}
+    if seconds:
+      values['packets_per_s'] = packets / seconds
+      values['mb_per_s'] = size / 1048576.0 / seconds
+    if None not in growths:
+      values['rss'] = median(growths)
+    results['stages'][stage] = values
+  return results
+
+
+def compare(results, baseline, tolerance):
+  '''
+  prints the stages of results that regressed compared to baseline, returns
+  their count.
+  '''
+  regressions = 0
+  for size, result in sorted(results.iteritems()):
+    if size not in baseline:
+      print '%s: no baseline' % size
+      continue
+    for stage in STAGES:
+      now = result['stages'][stage]
+      before = baseline[size]['stages'].get(stage)
+      if not before:
+        print '%s %s: no baseline' % (size, stage)
+        continue
+      if max(now['time'], before['time']) >= MIN_TIME:
+        allowed = before['time'] * (
+            1 + tolerance + NOISE_FACTOR * max(now['noise'], before['noise']))
+        if now['time'] > allowed:
+          print '%s %s: %.3fs, baseline %.3fs, allowed %.3fs' % (
+              size, stage, now['time'], before['time'], allowed)
+          regressions += 1
+      if now['rss'] is not None and before['rss'] is not None and \
+         now['rss'] > max(before['rss'], 0) * (1 + tolerance) + MIN_RSS:
+        print '%s %s: RSS growth %.1f MB, baseline %.1f MB' % (
+            size, stage, now['rss'], before['rss'])
+        regressions += 1
+    now = result.get('peak_rss')
+    before = baseline[size].get('peak_rss')
+    if now is not None and before is not None and \
+       now > before * (1 + tolerance) + MIN_RSS:
+      print '%s: peak RSS %.1f MB, baseline %.1f MB' % (size, now, before)
+      regressions += 1
+  return regressions
+
+
+def format_value(format, value):
+  if value is None:
+    return '-'
+  return format % value
+
+
+def print_results(results):
+  print '%-12s %-12s %9s %7s %12s %9s %9s' % (
+      'size', 'stage', 'time s', 'noise', 'packets/s', 'MB/s', 'RSS MB')
+  for size, result in sorted(results.iteritems()):
+    for stage in STAGES:
+      values = result['stages'][stage]
+      if stage in stats.SUBSTAGES:
+        stage = '  ' + stage
+      print '%-12s %-12s %9.3f %6.1f%% %12s %9s %9s' % (
+          size, stage, values['time'], values['noise'] * 100,
+          format_value('%.0f', values['packets_per_s']),
+          format_value('%.2f', values['mb_per_s']),
+          format_value('%.1f', values['rss']))
+    print '%-12s %-12s %9s %7s %12s %9s %9s' % (
+        size, 'peak', '', '', '', '', format_value('%.1f', result['peak_rss']))
+
+
+def main(argv=None):
+  parser = optparse.OptionParser(usage='%prog [options]')
+  parser.add_option('--sizes', default='50,200,800',
+                    help='comma separated flow counts [%default]')
+  parser.add_option('--depth', type='int', default=4,
+                    help='requests per connection [%default]')
+  parser.add_option('--pipelining', action='store_true', default=False)
+  parser.add_option('--linktype', choices=sorted(synth.LINKTYPES),
+                    default='ethernet')
+  parser.add_option('--baseline', default=DEFAULT_BASELINE,
+                    help='baseline file [%default]')
+  parser.add_option('--save-baseline', action='store_true', default=False,
+                    help='save the results as the baseline')
+  parser.add_option('--tolerance', type='float', default=0.2,
+                    help='allowed slowdown or growth, 0.2 = 20% [%default]')
+  parser.add_option('--repeat', type='int', default=5,
+                    help='runs per size, the medians count [%default]')
+  parser.add_option('--child', help=optparse.SUPPRESS_HELP)
+  options, args = parser.parse_args(argv)
+
+  if options.child:
+    logging.basicConfig(level=logging.ERROR)
+    json.dump(run_conversion(options.child), sys.stdout)
+    return 0
+
+  results = {}
+  for flows in [int(size) for size in options.sizes.split(',')]:
+    config = synth.Config(flows=flows, depth=options.depth,
+                          pipelining=options.pipelining,
+                          linktype=options.linktype)
+    key = 'flows=%d' % flows
+    results[key] = run_size(config, options.repeat)
+    print >>sys.stderr, '%s: %d packets, %.1f MB' % (
+        key, results[key]['packets'], results[key]['bytes'] / 1048576.0)
+  print_results(results)
+
+  if options.save_baseline:
+    out = open(options.baseline, 'w')
+    json.dump(results, out, indent=2, sort_keys=True)
+    out.close()
+    return 0
+  if os.path.exists(options.baseline):
+    baseline = json.load(open(options.baseline))
+    if compare(results, baseline, options.tolerance):
+      return 1
+    print 'no regressions'
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
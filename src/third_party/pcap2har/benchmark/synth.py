@@ -0,0 +1,337 @@
+#!/usr/bin/python
+'''
+Deterministic generator of synthetic HTTP captures, for benchmarks.
+
+The same Config (including its seed) always produces the same capture. The
+capture holds flows connections from one client to a few servers, each
+carrying depth keep-alive request/response pairs, optionally pipelined,
+with text and image bodies of which some are gzip compressed or chunked.
+Segments can be reordered or retransmitted, and DNS lookups of the servers
+precede their first connection.
+
+Usage: synth.py [options] <pcap file>
+'''
+
+import optparse
+import os
+import random
+import struct
+import sys
+import zlib
+
+# add pcap2har and dpkt to sys.path, like main.py
+path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(path)
+sys.path.append(os.path.join(path, '..', 'dpkt'))
+
+import dpkt
+from pcaputil import inet_aton
+
+LINKTYPES = {
+  'ethernet': dpkt.pcap.DLT_EN10MB,
+  'sll': dpkt.pcap.DLT_LINUX_SLL,
+  'null': 0,
+  'raw': 101,
+}
+
+CLIENT_IP = inet_aton('192.168.1.2')
+RESOLVER_IP = inet_aton('192.168.1.1')
+CLIENT_MAC = '\x00\x16\x3e\x00\x00\x02'
+GATEWAY_MAC = '\x00\x16\x3e\x00\x00\x01'
+USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/534.30 '
+              '(KHTML, like Gecko) Chrome/12.0.742.91 Safari/534.30')
+# start of the capture
+BASE_TS = 1300000000.0
+# round trip time, and time to send one segment
+RTT = 0.02
+SEGMENT_TIME = 0.0001
+
+
+class Config(object):
+  '''
+  Knobs of the generated capture. Keyword arguments of the constructor
+  override the defaults.
+  '''
+  def __init__(self, **kwargs):
+    self.flows = 100
+    # requests per connection
+    self.depth = 4
+    # whether all requests of a connection are sent before the responses
+    self.pipelining = False
+    self.hosts = 8
+    # connections open at the same time
+    self.concurrency = 6
+    # average response body size
+    self.body_size = 8000
+    # fraction of the bodies that are images, the others are text
+    self.image_ratio = 0.5
+    # fraction of the text bodies that are gzip compressed
+    self.gzip_ratio = 0.5
+    # fraction of the bodies sent with chunked transfer encoding
+    self.chunked_ratio = 0.2
+    # probability of a segment being swapped with the next one
+    self.reorder = 0.01
+    # probability of a segment being sent twice
+    self.retransmit = 0.01
+    self.dns = True
+    # key of LINKTYPES
+    self.linktype = 'ethernet'
+    self.mss = 1460
+    self.seed = 1
+    for name, value in kwargs.iteritems():
+      if not hasattr(self, name):
+        raise TypeError('unknown synthetic capture setting: %s' % name)
+      setattr(self, name, value)
+
+
+class Generator(object):
+  '''
+  Builds the packets of a synthetic capture.
+
+  Members:
+  config = Config
+  packets = [(ts, order, frame)], unsorted until write()
+  '''
+  def __init__(self, config):
+    self.config = config
+    self.rng = random.Random(config.seed)
+    self.linktype = LINKTYPES[config.linktype]
+    self.packets = []
+    # deterministic filler for bodies
+    self.noise = ''.join(chr(self.rng.randrange(256)) for i in xrange(65536))
+    words = ['%s%d' % (w, i) for i in range(16) for w in
+             ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'div', 'span')]
+    self.text = ' '.join(self.rng.choice(words) for i in xrange(16384))
+
+  def host(self, idx):
+    return 'host%d.example.com' % idx
+
+  def host_ip(self, idx):
+    return inet_aton('10.1.%d.%d' % (idx / 250, idx % 250 + 1))
+
+  def frame(self, ip):
+    '''
+    wraps a dpkt.ip.IP in the link layer of the capture.
+    '''
+    if self.linktype == dpkt.pcap.DLT_EN10MB:
+      if ip.src == CLIENT_IP:
+        src, dst = CLIENT_MAC, GATEWAY_MAC
+      else:
+        src, dst = GATEWAY_MAC, CLIENT_MAC
+      return str(dpkt.ethernet.Ethernet(src=src, dst=dst,
+                                        type=dpkt.ethernet.ETH_TYPE_IP,
+                                        data=ip))
+    elif self.linktype == dpkt.pcap.DLT_LINUX_SLL:
+      # packet type: 0 = to us, 4 = outgoing
+      pkttype = 4 if ip.src == CLIENT_IP else 0
+      return struct.pack('>HHH8sH', pkttype, 1, 6, CLIENT_MAC,
+                         dpkt.ethernet.ETH_TYPE_IP) + str(ip)
+    elif self.linktype == 0:
+      return struct.pack('=I', 2) + str(ip)
+    return str(ip)
+
+  def add(self, ts, ip):
+    self.packets.append((ts, len(self.packets), self.frame(ip)))
+
+  def add_tcp(self, ts, src, dst, seq, ack, flags, data=''):
+    segment = dpkt.tcp.TCP(sport=src[1], dport=dst[1], seq=seq & 0xffffffff,
+                           ack=ack & 0xffffffff, flags=flags, win=65535,
+                           data=data)
+    self.add(ts, dpkt.ip.IP(src=src[0], dst=dst[0], p=dpkt.ip.IP_PROTO_TCP,
+                            ttl=64, len=20 + len(segment), data=segment))
+
+  def add_dns(self, ts, host_idx):
+    '''
+    adds the lookup of a host, returns when the answer arrives.
+    '''
+    name = self.host(host_idx)
+    port = 30000 + host_idx % 30000
+    query = dpkt.dns.DNS(id=host_idx & 0xffff,
+                         qd=[dpkt.dns.DNS.Q(name=name)])
+    answer = dpkt.dns.DNS(id=host_idx & 0xffff, op=dpkt.dns.DNS_RA,
+                          qd=[dpkt.dns.DNS.Q(name=name)],
+                          an=[dpkt.dns.DNS.RR(name=name,
+                                              rdata=self.host_ip(host_idx))])
+    for src, dst, sport, dport, msg in (
+        (CLIENT_IP, RESOLVER_IP, port, 53, query),
+        (RESOLVER_IP, CLIENT_IP, 53, port, answer)):
+      udp = dpkt.udp.UDP(sport=sport, dport=dport, data=str(msg))
+      udp.ulen = len(udp)
+      self.add(ts, dpkt.ip.IP(src=src, dst=dst, p=dpkt.ip.IP_PROTO_UDP,
+                              ttl=64, len=20 + len(udp), data=udp))
+      ts += RTT
+    return ts
+
+  def send(self, ts, src, dst, seq, ack, data):
+    '''
+    sends data in segments, with reordering and retransmissions. Returns
+    the time the last segment is sent.
+    '''
+    config = self.config
+    segments = []
+    for offset in xrange(0, len(data), config.mss):
+      segments.append((seq + offset, data[offset:offset + config.mss]))
+    idx = 0
+    while idx < len(segments) - 1:
+      if self.rng.random() < config.reorder:
+        segments[idx], segments[idx + 1] = segments[idx + 1], segments[idx]
+        idx += 1
+      idx += 1
+    for segment_seq, segment in segments:
+      ts += SEGMENT_TIME
+      self.add_tcp(ts, src, dst, segment_seq, ack,
+                   dpkt.tcp.TH_ACK | dpkt.tcp.TH_PUSH, segment)
+      if self.rng.random() < config.retransmit:
+        self.add_tcp(ts + RTT, src, dst, segment_seq, ack,
+                     dpkt.tcp.TH_ACK | dpkt.tcp.TH_PUSH, segment)
+    return ts
+
+  def request(self, host_idx, flow_idx, idx):
+    return ('GET /flow%d/object%d HTTP/1.1\r\n'
+            'Host: %s\r\n'
+            'User-Agent: %s\r\n'
+            'Accept: */*\r\n'
+            'Accept-Encoding: gzip,deflate\r\n'
+            'Connection: keep-alive\r\n'
+            '\r\n' % (flow_idx, idx, self.host(host_idx), USER_AGENT))
+
+  def response(self):
+    config = self.config
+    rng = self.rng
+    size = int(config.body_size * rng.uniform(0.2, 1.8))
+    headers = ['HTTP/1.1 200 OK', 'Server: synth']
+    if rng.random() < config.image_ratio:
+      headers.append('Content-Type: image/png')
+      offset = rng.randrange(len(self.noise))
+      body = (self.noise * (size / len(self.noise) + 2))[offset:offset + size]
+    else:
+      headers.append('Content-Type: text/html; charset=utf-8')
+      offset = rng.randrange(len(self.text))
+      body = (self.text * (size / len(self.text) + 2))[offset:offset + size]
+      if rng.random() < config.gzip_ratio:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        body = compressor.compress(body) + compressor.flush()
+        headers.append('Content-Encoding: gzip')
+    if rng.random() < config.chunked_ratio:
+      headers.append('Transfer-Encoding: chunked')
+      chunks = []
+      for offset in xrange(0, len(body), 4096):
+        chunk = body[offset:offset + 4096]
+        chunks.append('%x\r\n%s\r\n' % (len(chunk), chunk))
+      chunks.append('0\r\n\r\n')
+      body = ''.join(chunks)
+    else:
+      headers.append('Content-Length: %d' % len(body))
+    return '\r\n'.join(headers) + '\r\n\r\n' + body
+
+  def add_flow(self, ts, flow_idx, host_idx):
+    '''
+    adds a connection with its requests and responses, returns the time it
+    is closed.
+    '''
+    config = self.config
+    client = (CLIENT_IP, 1024 + flow_idx % 64000)
+    server = (self.host_ip(host_idx), 80)
+    cseq = self.rng.getrandbits(32)
+    sseq = self.rng.getrandbits(32)
+    SYN, ACK, FIN = dpkt.tcp.TH_SYN, dpkt.tcp.TH_ACK, dpkt.tcp.TH_FIN
+    self.add_tcp(ts, client, server, cseq, 0, SYN)
+    self.add_tcp(ts + RTT / 2, server, client, sseq, cseq + 1, SYN | ACK)
+    ts += RTT
+    cseq += 1
+    sseq += 1
+    self.add_tcp(ts, client, server, cseq, sseq, ACK)
+    requests = [self.request(host_idx, flow_idx, idx)
+                for idx in range(config.depth)]
+    responses = [self.response() for idx in range(config.depth)]
+    if config.pipelining:
+      exchanges = [(''.join(requests), ''.join(responses))]
+    else:
+      exchanges = zip(requests, responses)
+    for request, response in exchanges:
+      ts = self.send(ts, client, server, cseq, sseq, request)
+      cseq += len(request)
+      ts = self.send(ts + RTT, server, client, sseq, cseq, response)
+      sseq += len(response)
+      ts += RTT / 2
+      self.add_tcp(ts, client, server, cseq, sseq, ACK)
+    self.add_tcp(ts, client, server, cseq, sseq, FIN | ACK)
+    self.add_tcp(ts + RTT / 2, server, client, sseq, cseq + 1, FIN | ACK)
+    ts += RTT
+    self.add_tcp(ts, client, server, cseq + 1, sseq + 1, ACK)
+    return ts
+
+  def generate(self):
+    '''
+    adds all the packets of the capture.
+    '''
+    config = self.config
+    resolved = set()
+    # the connections run in config.concurrency parallel lanes
+    lanes = [BASE_TS + idx * RTT for idx in range(config.concurrency)]
+    for flow_idx in range(config.flows):
+      lane = flow_idx % config.concurrency
+      ts = lanes[lane]
+      host_idx = self.rng.randrange(config.hosts)
+      if config.dns and host_idx not in resolved:
+        ts = self.add_dns(ts, host_idx)
+        resolved.add(host_idx)
+      lanes[lane] = self.add_flow(ts, flow_idx, host_idx) + RTT
+
+  def write(self, out):
+    '''
+    writes the capture as a pcap file, returns the number of packets.
+    '''
+    self.packets.sort()
+    writer = dpkt.pcap.Writer(out, snaplen=65535, linktype=self.linktype)
+    for ts, order, frame in self.packets:
+      writer.writepkt(frame, ts)
+    return len(self.packets)
+
+
+def generate(config, out):
+  '''
+  writes the synthetic capture of config to the file-like object out.
+  Returns the number of packets.
+  '''
+  generator = Generator(config)
+  generator.generate()
+  return generator.write(out)
+
+
+def main(argv=None):
+  parser = optparse.OptionParser(usage='%prog [options] <pcap file>')
+  defaults = Config()
+  parser.add_option('--flows', type='int', default=defaults.flows)
+  parser.add_option('--depth', type='int', default=defaults.depth,
+                    help='requests per connection')
+  parser.add_option('--pipelining', action='store_true', default=False)
+  parser.add_option('--hosts', type='int', default=defaults.hosts)
+  parser.add_option('--concurrency', type='int',
+                    default=defaults.concurrency)
+  parser.add_option('--body-size', type='int', default=defaults.body_size)
+  parser.add_option('--image-ratio', type='float',
+                    default=defaults.image_ratio)
+  parser.add_option('--gzip-ratio', type='float', default=defaults.gzip_ratio)
+  parser.add_option('--chunked-ratio', type='float',
+                    default=defaults.chunked_ratio)
+  parser.add_option('--reorder', type='float', default=defaults.reorder)
+  parser.add_option('--retransmit', type='float',
+                    default=defaults.retransmit)
+  parser.add_option('--no-dns', dest='dns', action='store_false',
+                    default=True)
+  parser.add_option('--linktype', choices=sorted(LINKTYPES),
+                    default=defaults.linktype)
+  parser.add_option('--seed', type='int', default=defaults.seed)
+  options, args = parser.parse_args(argv)
+  if len(args) != 1:
+    parser.error('expected one output file')
+  config = Config(**vars(options))
+  out = open(args[0], 'wb')
+  count = generate(config, out)
+  out.close()
+  print '%d packets written to %s' % (count, args[0])
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -9,7 +9,13 @@ import logging
 import http
 import httpsession
 import har
-import json
+import heapq
+import itertools
+import packetfilter
+import packetindex
+import packettable
+from pcapreader import Reader
+from stats import Stats
 
 class Options:
   """'
@@ -21,28 +27,268 @@ class Options:
     """
     self.dns = None #  Will be created when paring pcap.
     self.remove_cookies = True
+    # Streaming mode: seconds of inactivity after which a flow is retired.
+    self.flow_timeout = 60
+    # Filter expressions (see packetfilter) of the traffic to drop, and of
+    # the only connections to keep if not empty.
+    self.exclude = list(packetfilter.DEFAULT_EXCLUDE)
+    self.include = []
+    # Number of processes parsing flows for HTTP. 1 parses in this process.
+    self.workers = 1
+    # How much of the response bodies goes into the HAR, one of
+    # http.CONTENT_MODES, and the number of bytes kept per body in
+    # http.CONTENT_CAPPED mode.
+    self.content = http.CONTENT_FULL
+    self.content_limit = 64 * 1024
+    # Write the HAR without indentation.
+    self.compact = False
+    # Only keep the entries of requests to these hosts, see
+    # packetindex.request_matches. Empty keeps every entry.
+    self.hosts = []
+    # Only keep the entries that start (see httpsession.entry_start_ts) at or
+    # after start_ts and at or before end_ts, capture timestamps. None leaves
+    # that end of the window open.
+    self.start_ts = None
+    self.end_ts = None
+    # Read the capture into a packettable.PacketTable, if NumPy is available.
+    # Not used in streaming mode.
+    self.columnar = False
+    # The stats.Stats of the running conversion, created by convert.
+    self.stats = None
+    # {stage: profiler} of the stages to profile, see stats.
+    self.profilers = {}
+    # Time the substages of the tcp stage too, see stats.
+    self.substages = False
+
+  def result_items(self):
+    """
+    Returns the sorted (name, value) pairs of the options that the HAR
+    depends on, to tell whether a capture needs to be converted again.
+    """
+    # dns and stats are filled by the conversion, workers, columnar,
+    # profilers and substages don't change the result
+    return sorted((name, value) for name, value in vars(self).iteritems()
+                  if name not in ('dns', 'workers', 'columnar', 'stats',
+                                  'profilers', 'substages'))
+
+def http_flow(flow):
+  """
+  Parses a finished tcp.Flow for HTTP, and decodes its response bodies for
+  the content mode. Returns the http.Flow, or None if the flow does not
+  contain HTTP. In parallel mode this runs in the worker processes, and the
+  http.Flow is pickled back without the raw response bodies.
+  """
+  try:
+    return http.Flow(flow)
+  except http.Error, error:
+    logging.warning(error)
+  except Exception, error:
+    logging.warning(error)
+  return None
+
+def create_pool(options):
+  """
+  Returns a process pool for parsing flows if options.workers asks for more
+  than one process, or None.
+  """
+  if options.workers > 1:
+    import multiprocessing
+    return multiprocessing.Pool(options.workers)
+  return None
+
+def parse_flows(flows, options, pool=None, count=None):
+  """
+  Parses the tcp.Flows for HTTP, on the pool if there is one. Yields the
+  http.Flows in the order of flows, before resolve_flow. count is the number
+  of flows, if flows is an iterator.
+  """
+  if pool:
+    if count is None:
+      count = len(flows)
+    chunksize = max(1, count / (4 * options.workers))
+    results = pool.imap(http_flow, flows, chunksize)
+  else:
+    results = itertools.imap(http_flow, flows)
+  for httpflow in results:
+    if httpflow:
+      yield httpflow
+
+def resolve_flow(httpflow, options):
+  """
+  Completes a parsed http.Flow in this process, where the DNS data and stats
+  live: resolves its DNS timing, keeps only the entries to options.hosts and
+  in the window of options.start_ts and end_ts, and counts it in
+  options.stats. Flows must be resolved in the order their connections
+  started, see http.Flow.resolve.
+  """
+  httpflow.resolve(options)
+  if options.hosts:
+    httpflow.pairs = [
+        pair for pair in httpflow.pairs
+        if packetindex.request_matches(pair.request, httpflow.server_ip,
+                                       options.hosts)]
+  if options.start_ts is not None or options.end_ts is not None:
+    pairs = []
+    for pair in httpflow.pairs:
+      ts = httpsession.entry_start_ts(pair.request)
+      if ((options.start_ts is None or ts >= options.start_ts) and
+          (options.end_ts is None or ts <= options.end_ts)):
+        pairs.append(pair)
+    httpflow.pairs = pairs
+  options.stats.http_flows += 1
+  options.stats.entries += len(httpflow.pairs)
+
+def http_flows(flows, options, pool=None, count=None):
+  """
+  Parses the tcp.Flows for HTTP, on the pool if there is one, and resolves
+  them. flows must be in start order. Yields the http.Flows in the order of
+  flows. count is the number of flows, if flows is an iterator.
+  """
+  for httpflow in parse_flows(flows, options, pool, count):
+    resolve_flow(httpflow, options)
+    yield httpflow
+
+def har_writer(har_out, options):
+  """
+  Returns the har.StreamWriter writing to har_out, or har_out itself if it is
+  a har.SplitWriter.
+  """
+  if isinstance(har_out, har.SplitWriter):
+    return har_out
+  if options.compact:
+    return har.StreamWriter(har_out, indent=None)
+  return har.StreamWriter(har_out)
 
 def convert(pcap_in, har_out, options):
-  flows = pcap.TCPFlowsFromString(pcap_in, options)
+  """
+  Converts the pcap to HAR, written to har_out. pcap_in is a string with the
+  capture, or a file object, which is memory-mapped if possible (see
+  pcapreader.open_capture) rather than read into a string. Returns the
+  stats.Stats of the conversion.
+  """
+  reader = Reader(pcap_in)
+  try:
+    return convert_packets(reader, har_out, options)
+  finally:
+    reader.close()
+
+def convert_packets(reader, har_out, options):
+  """
+  Converts the packets of reader to HAR, written to har_out. reader is a
+  pcapreader.Reader, or an object iterating over some of its packets like
+  packetindex.Selection. har_out is a file-like object, or a har.SplitWriter
+  (see har_writer). Returns the stats.Stats of the conversion.
+  """
+  stats = options.stats = Stats(options.profilers, options.substages)
+  columnar = options.columnar and packettable.numpy
+  if options.columnar and not columnar:
+    logging.warning("NumPy is not available, not using a packet table.")
+  with stats.stage('tcp'):
+    if columnar:
+      # the flows are built as they are parsed, in the http stage
+      table = packettable.PacketTable(reader, options)
+      flows = table.flows()
+      count = table.flow_count()
+    else:
+      accumulator = pcap.TCPFlowAccumulator(reader, options)
+      flows = sorted(accumulator.flowdict.itervalues(),
+                     key=lambda flow: flow.start())
+      count = len(flows)
 
   # generate HTTP Flows
-  httpflows = []
-  flow_count = 0
-  for flow in sorted(flows.flowdict.itervalues(),
-                     cmp=lambda x,y: cmp(x.start(), y.start())):
-    try:
-      httpflows.append(http.Flow(flow))
-      flow_count += 1
-    except http.Error, error:
-      logging.warning(error)
-    except Exception, error:
-      logging.warning(error)
-
-  pairs = reduce(lambda x, y: x+y.pairs, httpflows, [])
-  logging.info("Flow=%d HTTP=%d", flow_count, len(pairs))
+  pool = create_pool(options)
+  pairs = []
+  try:
+    with stats.stage('http'):
+      for httpflow in http_flows(flows, options, pool, count):
+        pairs.extend(httpflow.pairs)
+  finally:
+    if pool:
+      pool.terminate()
+  logging.info("Flow=%d HTTP=%d", stats.http_flows, stats.entries)
 
   # parse HAR stuff
-  session = httpsession.HTTPSession(pairs)
+  with stats.stage('har'):
+    session = httpsession.HTTPSession(pairs)
+
+  # write HAR
+  with stats.stage('json'):
+    har_writer(har_out, options).write_session(session)
+  return stats
+
+def convert_stream(pcap_file, har_out, options):
+  """
+  Converts the pcap file object to HAR without holding the whole capture in
+  memory. Each TCP flow is parsed for HTTP as soon as it is closed or has
+  been idle for options.flow_timeout seconds, and its entries are written to
+  har_out right away. Entries are therefore in the order their connections
+  were retired, not sorted by start time.
+
+  The exception are the flows that could claim the DNS timing of their host
+  (see http.Flow.claims_dns). They are held back until every flow that
+  started before them has been retired, and then resolved and written in
+  start order, so they get the same DNS timings as in convert.
+
+  In parallel mode, retired flows are parsed in batches of a few flows per
+  worker.
+
+  Returns the stats.Stats of the conversion.
+  """
+  stats = options.stats = Stats(options.profilers, options.substages)
+  session = httpsession.HTTPSession([])
+  writer = har_writer(har_out, options)
+  with stats.stage('json'):
+    writer.begin(session)
+  pool = create_pool(options)
+  batch_size = 8 * options.workers if pool else 1
+  retired = []
+  # heap of the held back flows: (connection start, order, http.Flow)
+  held = []
+  order = itertools.count()
+
+  def write_flow(httpflow):
+    resolve_flow(httpflow, options)
+    for pair in httpflow.pairs:
+      with stats.stage('har'):
+        entry = session.make_entry(pair)
+      with stats.stage('json'):
+        writer.write_entry(entry)
+
+  def write_retired(accumulator=None):
+    """
+    writes the retired flows, and the held back ones started before the
+    flows still open in accumulator, or all of them without accumulator.
+    """
+    with stats.stage('http'):
+      for httpflow in parse_flows(retired, options, pool):
+        if httpflow.claims_dns(options):
+          heapq.heappush(held, (httpflow.pairs[0].request.ts_connect,
+                                next(order), httpflow))
+        else:
+          write_flow(httpflow)
+      del retired[:]
+      if held and accumulator:
+        oldest_start = accumulator.oldest_start()
+      else:
+        oldest_start = None
+      while held and (oldest_start is None or held[0][0] <= oldest_start):
+        write_flow(heapq.heappop(held)[2])
+
+  def flow_handler(flow, accumulator):
+    retired.append(flow)
+    if len(retired) >= batch_size:
+      write_retired(accumulator)
 
-  json.dump(session, har_out, cls=har.JsonReprEncoder, indent=2,
-            encoding='utf8')
+  reader = Reader(pcap_file)
+  try:
+    with stats.stage('tcp'):
+      pcap.TCPFlowAccumulator(reader, options, flow_handler)
+    write_retired()
+  finally:
+    if pool:
+      pool.terminate()
+    reader.close()
+  logging.info("Flow=%d HTTP=%d", stats.http_flows, stats.entries)
+  with stats.stage('json'):
+    writer.end(session)
+  return stats
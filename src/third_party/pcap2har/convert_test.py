@@ -0,0 +1,74 @@
+"""
+Regression tests of the conversion modes against the example captures.
+
+Run from any directory:
+  python convert_test.py
+"""
+
+import json
+import logging
+import os
+import StringIO
+import sys
+import unittest
+
+# add third_party directory to sys.path for global import, like main.py
+path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(os.path.abspath(path))
+dpkt_path = os.path.join(path, "dpkt")
+sys.path.append(os.path.abspath(dpkt_path))
+
+import convert
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                        '..', 'examples')
+
+
+def dns_timings(pcap_file, stream, workers=1):
+  """
+  Converts the capture, returns the sorted (url, startedDateTime, dns time)
+  of its entries.
+  """
+  options = convert.Options()
+  options.workers = workers
+  out = StringIO.StringIO()
+  inf = open(pcap_file, 'rb')
+  try:
+    if stream:
+      convert.convert_stream(inf, out, options)
+    else:
+      convert.convert(inf, out, options)
+  finally:
+    inf.close()
+  entries = json.loads(out.getvalue())['log']['entries']
+  return sorted((entry['request']['url'], entry['startedDateTime'],
+                 entry['timings']['dns']) for entry in entries)
+
+
+class StreamDNSTest(unittest.TestCase):
+  """
+  Streaming mode retires flows out of start order, but must give the DNS
+  timings to the same connections as converting the whole capture.
+  """
+  def setUp(self):
+    self.pcap_file = os.path.join(EXAMPLES, 'www-sina-com-cn.pcap')
+    self.timings = dns_timings(self.pcap_file, stream=False)
+
+  def testStreamMatchesBatch(self):
+    self.assertEqual(self.timings, dns_timings(self.pcap_file, stream=True))
+
+  def testParallelStreamMatchesBatch(self):
+    self.assertEqual(self.timings,
+                     dns_timings(self.pcap_file, stream=True, workers=2))
+
+  def testFirstConnectionClaimsHost(self):
+    timings = dict((url, dns) for url, started, dns in self.timings)
+    self.assertEqual(
+        478, timings['http://i2.sinaimg.cn/dy/deco/2010/0527/headwww.js'])
+    self.assertEqual(-1, timings[
+        'http://i2.sinaimg.cn/sms/images/sms_image/27133458.jpg'])
+
+
+if __name__ == '__main__':
+  logging.basicConfig(level=logging.ERROR)
+  unittest.main()
@@ -17,6 +17,10 @@ import dpkt
 import logging
 import math
 
+# seconds after the connection that claims the DNS timing of a host within
+# which other connections to it get the timing too
+CLAIM_WINDOW = 0.1
+
 class DNS:
   """
   Store and retrive DNS timings.
@@ -29,6 +33,7 @@ class DNS:
     """ Contructor."""
     self.__dns_timing__ = {}
     self.__hostname_start__ = {}
+    self.__ip_hostnames__ = {}
 
   def check_dns(self, timestamp, ip_packet):
     """Check is a packet is DNS packet, and record DNS timing.
@@ -65,12 +70,25 @@ class DNS:
           hostname_timing['end'] = timestamp
           self.__dns_timing__[an.ip]['end'] = timestamp
           self.__dns_timing__[an.ip]['connected'] = 0
+          self.__ip_hostnames__.setdefault(an.ip, set()).add(qd.name)
           #logging.debug("DNS %s: %.3f", qd.name,
           #              timestamp - self.__dns_timing__[an.ip]['start'])
       return True
     return False
 
 
+  def ip_hostnames(self):
+    """Return {ip: set of hostnames} of the DNS answers seen so far."""
+    return self.__ip_hostnames__
+
+  def ip_lookups(self):
+    """Return {ip: sorted [[start, end]]} of the DNS answers seen so far: the
+    query and last answer timestamps of the hostnames answered with ip."""
+    return dict((ip, sorted([self.__hostname_start__[name]['start'],
+                             self.__hostname_start__[name]['end']]
+                            for name in names))
+                for ip, names in self.__ip_hostnames__.iteritems())
+
   def dns_time_of_connect_to_ip(self, dst_ip):
     """Get DNS qurey time for resoulting IP address.
 
@@ -85,9 +103,18 @@ class DNS:
     return dns_start_ts
 
 
+  def is_unclaimed(self, host):
+    """Return whether host has a DNS timing no connection has claimed yet."""
+    return (host in self.__hostname_start__ and
+            self.__hostname_start__[host]['connected'] == 0)
+
   def dns_time_of_connect_to_host(self, host, connect_ts):
     """Get DNS qurey time for host.
 
+    The first call for a host claims its DNS timing for connections started
+    within CLAIM_WINDOW of connect_ts, so it must be called in the order connections
+    started, see http.Flow.resolve.
+
     Note: If multiple DNS queries for the same hostname, the latest query
     time overrrides the pervious times.
     """
@@ -98,7 +125,7 @@ class DNS:
       timing_connected =  self.__hostname_start__[host]['connected']
       if timing_connected == 0:
         self.__hostname_start__[host]['connected'] = connect_ts
-      elif math.fabs(timing_connected - connect_ts) > 0.1:
+      elif math.fabs(timing_connected - connect_ts) > CLAIM_WINDOW:
         return -1
       dns_start_ts = self.__hostname_start__[host]['start']
       #logging.debug("DNS timing: %s = %d", host, dns_start_ts)
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+'''
+Converts the connections of a capture to some hosts, or in a time window,
+to HAR.
+
+The first run indexes the capture (see packetindex) and saves the index next
+to it. The following runs only read the records of the matching connections
+and the DNS packets, so they take time in proportion to what they extract
+rather than to the size of the capture.
+
+Hosts are addresses, hostnames, or domains starting with a dot. Connections
+are selected by the addresses of both ends, and by the hostnames the DNS
+answers of the capture give for them. Connections to addresses no DNS answer
+names, like those looked up before the capture started, are selected too.
+After parsing, only the requests whose Host header matches a hostname, or
+that were sent to a matching address, are kept, so other sites sharing an
+address (virtual hosting, CDNs) are left out. Likewise, --from and --to
+select the connections that may have entries starting in the time window,
+from their DNS lookup to their last packet, and only the entries whose
+startedDateTime is in it are kept. --list shows the selected connections
+before that.
+
+Usage: extract.py [options] <pcap file> [<har file>]
+'''
+
+import logging
+import optparse
+import os
+import sys
+import time
+
+# add third_party directory to sys.path for global import, like main.py
+path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(path)
+sys.path.append(os.path.join(path, 'dpkt'))
+
+import convert
+import har
+import packetindex
+from pcapreader import Reader
+
+
+def print_connections(index, connections):
+  start_ts = index.start_ts() or 0
+  for connection in connections:
+    print '%10.3f %10.3f %7d  %s:%d -> %s:%d  %s' % (
+        connection.first_ts - start_ts,
+        connection.last_ts - connection.first_ts, connection.count,
+        connection.src[0], connection.src[1], connection.dst[0],
+        connection.dst[1], ' '.join(index.connection_hostnames(connection)))
+
+
+def main(argv=None):
+  parser = optparse.OptionParser(
+      usage='%prog [options] <pcap file> [<har file>]')
+  parser.add_option('--host', action='append', default=[],
+                    help='address, hostname, or .domain for its subdomains; '
+                    'can be repeated. Requests are kept by server address '
+                    'or Host header')
+  parser.add_option('--from', type='float', dest='start',
+                    help='seconds from the start of the capture. Entries '
+                    'that start earlier are left out')
+  parser.add_option('--to', type='float', dest='end',
+                    help='seconds from the start of the capture. Entries '
+                    'that start later are left out')
+  parser.add_option('--list', action='store_true', default=False,
+                    help='print the matching connections instead of '
+                    'converting them')
+  parser.add_option('--rebuild', action='store_true', default=False,
+                    help='index the capture again')
+  parser.add_option('--port', type='int', action='append', default=[],
+                    help='filter out a port')
+  parser.add_option('--filter', action='append', default=[],
+                    help='filter out matching traffic, see main.py')
+  parser.add_option('--only', action='append', default=[],
+                    help='only index matching connections, see main.py')
+  parser.add_option('-j', type='int', dest='workers', default=1,
+                    help='parse flows for HTTP in n processes')
+  parser.add_option('--content', choices=convert.http.CONTENT_MODES,
+                    help='response bodies in the HAR: none, text-only, '
+                    'capped or full')
+  parser.add_option('--content-limit', type='int',
+                    help='bytes kept per body in capped mode')
+  parser.add_option('--compact', action='store_true', default=False,
+                    help='write the HAR without indentation')
+  parser.add_option('--columnar', action='store_true', default=False,
+                    help='read the packets into a NumPy packet table')
+  parser.add_option('-z', action='store_true', dest='compress',
+                    default=False, help='write the HAR gzip compressed')
+  parser.add_option('-l', dest='logging_level', default='warning',
+                    choices=['debug', 'info', 'warning', 'error'],
+                    help='log level [%default]')
+  flags, args = parser.parse_args(argv)
+  if len(args) == 1:
+    pcap_file = args[0]
+    har_file = pcap_file + '.har'
+  elif len(args) == 2:
+    pcap_file, har_file = args
+  else:
+    parser.error('expected a pcap file and an optional har file')
+
+  logging.basicConfig(level=getattr(logging, flags.logging_level.upper()))
+
+  options = convert.Options()
+  options.exclude.extend('port %d' % port for port in flags.port)
+  options.exclude.extend(flags.filter)
+  options.include.extend(flags.only)
+  options.workers = flags.workers
+  if flags.content is not None:
+    options.content = flags.content
+  if flags.content_limit is not None:
+    options.content_limit = flags.content_limit
+  options.compact = flags.compact
+  options.columnar = flags.columnar
+  options.hosts = flags.host
+
+  start = time.time()
+  index = packetindex.open_index(pcap_file, options, flags.rebuild)
+  logging.info('index of %d connections read in %.2fs',
+               len(index.connections), time.time() - start)
+  start_ts = index.start_ts() or 0
+  if flags.start is not None:
+    options.start_ts = start_ts + flags.start
+  if flags.end is not None:
+    options.end_ts = start_ts + flags.end
+  connections = index.select(flags.host, options.start_ts, options.end_ts)
+  if flags.list:
+    print_connections(index, connections)
+    return 0
+  offsets = index.record_offsets(connections)
+  logging.info('%d connections, %d packets selected', len(connections),
+               len(offsets))
+
+  # Let exceptions terminate the program.
+  inf = open(pcap_file, 'rb')
+  outf = open(har_file, 'wb')
+  if flags.compress:
+    har_out = har.CompressingWriter(outf, 'gzip')
+  else:
+    har_out = outf
+  reader = Reader(inf)
+  selection = packetindex.Selection(reader, offsets)
+  stats = convert.convert_packets(selection, har_out, options)
+  reader.close()
+  if flags.compress:
+    har_out.close()
+  outf.close()
+  inf.close()
+  logging.info('%d entries written in %.2fs', stats.entries,
+               stats.total_wall())
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -4,6 +4,10 @@ functions and classes for generating HAR data from parsed http data
 import http
 import logging
 import json
+import zlib
+
+# Entries in each block written by SplitWriter.
+ENTRIES_PER_BLOCK = 50
 
 
 # custom json encoder
@@ -16,3 +20,254 @@ class JsonReprEncoder(json.JSONEncoder):
     if hasattr(obj, 'json_repr'):
       return obj.json_repr()
     return json.JSONEncoder.default(self, obj) # should call super instead?
+
+
+
+class StreamWriter(object):
+  '''
+  Writes a HAR log to a file-like object one entry at a time, so the entries
+  never have to be held in memory all together, nor the json text of the
+  whole log.
+
+  Usage: write_session(session) for a complete session, or begin(session),
+  write_entry(entry) for each entry, end(session) while the entries are
+  still being produced. In the latter case the log-wide data that depends on
+  all entries (pages, browser) is written after the entries.
+  '''
+  def __init__(self, out, indent=2):
+    '''
+    Args:
+    out = file-like object with write()
+    indent = int, json indent of the log, None for compact output
+    '''
+    self.out = out
+    self.indent = indent
+    if indent:
+      self.separators = (', ', ': ')
+    else:
+      self.separators = (',', ':')
+    self.member_count = 0
+    self.entry_count = 0
+    self.footer_written = False
+
+  def newline(self, depth):
+    if self.indent:
+      return '\n' + ' ' * (self.indent * depth)
+    return ''
+
+  def dumps(self, obj, depth):
+    '''
+    json encodes obj as if it was nested depth levels deep in the log.
+    '''
+    text = json.dumps(obj, cls=JsonReprEncoder, indent=self.indent,
+                      separators=self.separators, encoding='utf8')
+    if self.indent:
+      text = text.replace('\n', self.newline(depth))
+    return text
+
+  def write_key(self, key):
+    '''
+    writes the key of the next member of the log.
+    '''
+    if self.member_count:
+      self.out.write(',')
+    self.out.write('%s%s%s' % (self.newline(2), json.dumps(key),
+                               self.separators[1]))
+    self.member_count += 1
+
+  def write_members(self, members):
+    for key, value in members.iteritems():
+      self.write_key(key)
+      self.out.write(self.dumps(value, 2))
+
+  def begin(self, session, complete=False):
+    '''
+    writes the log header, up to the opening of the entries list.
+    session = httpsession.HTTPSession
+    complete = bool, whether the session already holds all its entries, in
+      which case its pages are written before the entries
+    '''
+    self.out.write('{%s"log"%s{' % (self.newline(1), self.separators[1]))
+    self.write_members(session.json_repr_header())
+    if complete:
+      self.write_members(session.json_repr_footer())
+      self.footer_written = True
+    self.write_key('entries')
+    self.out.write('[')
+
+  def write_entry(self, entry):
+    '''
+    writes one httpsession.Entry.
+    '''
+    if self.entry_count:
+      self.out.write(',')
+    self.out.write(self.newline(3) + self.dumps(entry, 3))
+    self.entry_count += 1
+
+  def end(self, session):
+    '''
+    closes the entries list and writes the rest of the log.
+    '''
+    if self.entry_count:
+      self.out.write(self.newline(2))
+    self.out.write(']')
+    if not self.footer_written:
+      self.write_members(session.json_repr_footer())
+    self.out.write('%s}%s}' % (self.newline(1), self.newline(0)))
+
+  def write_session(self, session):
+    '''
+    writes a complete httpsession.HTTPSession: header, pages, then the
+    entries one by one.
+    '''
+    self.begin(session, complete=True)
+    for entry in session.entries:
+      self.write_entry(entry)
+    self.end(session)
+
+
+def summary_entry(entry, index):
+  '''
+  returns the summary of an entry: the json_repr of an httpsession.Entry,
+  with its request and response json_repr too, without headers, cookies,
+  query string, post data and content text. Those lists are left empty so
+  the summary is still a valid HAR entry. _index is the position of the
+  entry in the log.
+  '''
+  request = dict((key, value) for key, value in entry['request'].iteritems()
+                 if key != 'postData')
+  request.update(cookies=[], headers=[], queryString=[])
+  response = dict(entry['response'])
+  response.update(cookies=[], headers=[])
+  response['content'] = dict(
+      (key, value) for key, value in response['content'].iteritems()
+      if key not in ('text', 'encoding'))
+  summary = dict(entry, request=request, response=response)
+  summary['_index'] = index
+  return summary
+
+
+def block_slices(start, count, block_size=ENTRIES_PER_BLOCK):
+  '''
+  returns [(block number, first, end)] of the count entries from start on:
+  the blocks written by SplitWriter that hold them, and the range of lines
+  of each block.
+  '''
+  slices = []
+  end = start + count
+  while start < end:
+    block, first = divmod(start, block_size)
+    last = min(block_size, first + end - start)
+    slices.append((block, first, last))
+    start += last - first
+  return slices
+
+
+class SplitWriter(object):
+  '''
+  Writes a HAR log as a summary that is quick to load, and the complete
+  entries in blocks that can be loaded on demand, and optionally the
+  complete log too. Each entry is only turned into json data once.
+
+  The summary is a HAR log of summary_entry's. Block n holds the entries
+  n * block_size to (n + 1) * block_size - 1, one compact json entry per
+  line, and is passed to write_block(n, text) as soon as it is full. See
+  block_slices.
+
+  It has the interface of StreamWriter, so convert uses it instead of one.
+  '''
+  def __init__(self, writer, summary_writer, write_block,
+               block_size=ENTRIES_PER_BLOCK):
+    '''
+    Args:
+    writer = StreamWriter of the complete log, or None
+    summary_writer = StreamWriter of the summary
+    write_block = function(block number, text)
+    block_size = int, entries per block
+    '''
+    self.writer = writer
+    self.summary_writer = summary_writer
+    self.write_block = write_block
+    self.block_size = block_size
+    self.block = []
+    self.entry_count = 0
+
+  def begin(self, session, complete=False):
+    if self.writer:
+      self.writer.begin(session, complete)
+    self.summary_writer.begin(session, complete)
+
+  def write_entry(self, entry):
+    '''
+    writes one httpsession.Entry to the logs and the current block.
+    '''
+    data = entry.json_repr()
+    data['request'] = data['request'].json_repr()
+    data['response'] = data['response'].json_repr()
+    if self.writer:
+      self.writer.write_entry(data)
+    self.summary_writer.write_entry(summary_entry(data, self.entry_count))
+    self.block.append(json.dumps(data, separators=(',', ':'),
+                                 encoding='utf8'))
+    self.entry_count += 1
+    if len(self.block) == self.block_size:
+      self.end_block()
+
+  def end_block(self):
+    if self.block:
+      self.write_block((self.entry_count - 1) / self.block_size,
+                       '\n'.join(self.block))
+      self.block = []
+
+  def end(self, session):
+    self.end_block()
+    if self.writer:
+      self.writer.end(session)
+    self.summary_writer.end(session)
+
+  def write_session(self, session):
+    self.begin(session, complete=True)
+    for entry in session.entries:
+      self.write_entry(entry)
+    self.end(session)
+
+
+class CompressingWriter(object):
+  '''
+  File-like object that compresses everything written to it, and passes the
+  compressed data on to another file-like object as soon as zlib produces
+  it. Unlike gzip.GzipFile, it only needs write() from the output, so the
+  output can be e.g. a datastore record writer.
+  '''
+  def __init__(self, out, format='zlib', level=6):
+    '''
+    Args:
+    out = file-like object with write()
+    format = 'zlib' or 'gzip', the container of the deflate stream
+    level = int, zlib compression level
+    '''
+    if format == 'gzip':
+      wbits = 16 + zlib.MAX_WBITS
+    elif format == 'zlib':
+      wbits = zlib.MAX_WBITS
+    else:
+      raise ValueError('unknown compression format: %s' % format)
+    self.out = out
+    self.compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    self.size = 0
+
+  def write(self, data):
+    if isinstance(data, unicode):
+      data = data.encode('utf8')
+    self.size += len(data)
+    compressed = self.compressor.compress(data)
+    if compressed:
+      self.out.write(compressed)
+
+  def close(self):
+    '''
+    writes the end of the compressed stream. The output is not closed.
+    '''
+    if self.compressor:
+      self.out.write(self.compressor.flush())
+      self.compressor = None
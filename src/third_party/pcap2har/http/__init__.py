@@ -4,6 +4,13 @@ from response import Response
 from flow import Flow
 import urllib
 
+# content modes, how much of the response bodies goes into the HAR
+CONTENT_NONE = 'none' # headers, sizes and timings only
+CONTENT_TEXT = 'text-only' # text bodies only
+CONTENT_CAPPED = 'capped' # the first bytes of every body
+CONTENT_FULL = 'full' # all bodies
+CONTENT_MODES = (CONTENT_NONE, CONTENT_TEXT, CONTENT_CAPPED, CONTENT_FULL)
+
 class Error(Exception):
     '''
     Raised when HTTP cannot be parsed from the given data.
@@ -12,19 +12,25 @@ class Flow:
   Responses that don't match up with a request are ignored. Requests with no
   response are paired with None.
 
+  The DNS timing of the connection is not looked up here, since flows may be
+  parsed in other processes; call resolve() with the convert.Options of the
+  conversion afterwards.
+
   Members:
   pairs = [MessagePair], where ei
+  server_ip = packed IP address of the end that sent the responses
   '''
   def __init__(self, tcpflow):
     '''
     tcpflow = tcp.Flow
     '''
-    dns = tcpflow.options.dns
     remove_cookies = tcpflow.options.remove_cookies
     # try parsing it with forward as request dir
     success, requests, responses = parse_streams(tcpflow.fwd, tcpflow.rev)
+    self.server_ip = tcpflow.socket[1][0]
     if not success:
       success, requests, responses = parse_streams(tcpflow.rev, tcpflow.fwd)
+      self.server_ip = tcpflow.socket[0][0]
       if not success:
         # flow is not HTTP
         raise Exception('TCP Flow does not contain HTTP')
@@ -52,10 +58,8 @@ class Flow:
         if not connected:
           if tcpflow.packets[0].flags != dpkt.tcp.TH_SYN:
             logging.warning("First packet is not SYN.")
-          connect_ts = tcpflow.packets[0].ts
-          req.ts_connect = connect_ts
-          req.dns_start_ts = dns.dns_time_of_connect_to_host(req.host,
-                                                             connect_ts)
+          req.ts_connect = tcpflow.packets[0].ts
+          req.dns_start_ts = -1
           connected = True
         else:
           req.ts_connect = req.ts_start
@@ -66,18 +70,50 @@ class Flow:
               if cookie_str in msg.headers:
                 cookie = msg.headers[cookie_str]
                 if type(cookie) is list:
-                  for idx in range(len(cookie)):
-                    size = len(msg.headers[cookie_str][idx])
-                    msg.headers[cookie_str][idx] = '*'.center(size, '*')
+                  masked = ['*'.center(len(value), '*') for value in cookie]
                 else:
-                  size = len(msg.headers[cookie_str])
-                  msg.headers[cookie_str] = '*'.center(size, '*')
+                  masked = '*'.center(len(cookie), '*')
+                msg.set_header(cookie_str, masked)
+        if resp:
+          # decode here, in the worker process in parallel mode
+          resp.decode()
         self.pairs.append(MessagePair(req, resp))
     except LookupError:
       # there were no responses after the first request
       # there's nothing we can do
       logging.warning("Request has no reponse.")
 
+  def resolve(self, options):
+    '''
+    Completes the flow in the process that read the capture: sets the DNS
+    start time of the request that opened the connection, from the DNS
+    lookup of its Host, and counts the decompressed bytes of the responses
+    into options.stats.
+
+    Flows must be resolved in the order their connections started, whatever
+    order they were parsed or retired in: the first connection to a host
+    claims its DNS timing. In streaming mode, convert.convert_stream holds
+    back the flows that could claim one until the flows started before them
+    have been retired.
+    options = convert.Options
+    '''
+    if self.pairs:
+      req = self.pairs[0].request
+      req.dns_start_ts = options.dns.dns_time_of_connect_to_host(
+          req.host, req.ts_connect)
+    for pair in self.pairs:
+      if pair.response:
+        options.stats.bytes_decompressed += pair.response.bytes_decompressed
+
+  def claims_dns(self, options):
+    '''
+    whether resolve() could claim a DNS timing no connection has claimed yet,
+    and so has to wait for the connections that started before this one.
+    options = convert.Options
+    '''
+    return bool(self.pairs) and options.dns.is_unclaimed(
+        self.pairs[0].request.host)
+
 class MessagePair:
   '''
   An HTTP Request/Response pair/transaction/whatever. Loosely corresponds to
@@ -111,10 +147,10 @@ def gather_messages(MessageClass, tcpdir):
       msg = MessageClass(tcpdir, pointer)
     except dpkt.Error, error: # if the message failed
       if pointer == 0: # if this is the first message
-        logging.warning("Invalid http -- raise exception")
+        logging.debug("Invalid http -- raise exception")
         raise http.Error('Invalid http: %s' % error)
       else: # we're done parsing messages
-        logging.warning("We got a dpkt.Error %s, but we are done." % error)
+        logging.debug("We got a dpkt.Error %s, but we are done.", error)
         break # out of the loop
     except:
       logging.error("Unkown error.")
@@ -140,7 +176,7 @@ def parse_streams(request_stream, response_stream):
     requests = gather_messages(Request, request_stream)
     responses = gather_messages(Response, response_stream)
   except dpkt.UnpackError, error:
-    logging.warning(error)
+    logging.debug(error)
     return False, None, None
   except:
     logging.warning("Unkown error")
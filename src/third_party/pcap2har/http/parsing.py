@@ -0,0 +1,253 @@
+'''
+HTTP/1.x message parser that works on offsets into the data of a whole
+tcp.Direction, instead of copying the rest of the stream for every message
+like dpkt.http does. It follows the parsing rules of dpkt.http, and raises
+the same dpkt exceptions, so callers can treat both the same way.
+
+A parsed message records where its parts are in the stream:
+* start: offset of the first byte of the message
+* header_end: offset of the first byte after the blank line ending headers
+* body_spans: [(start, end)], where the body is; several for chunked bodies
+* end: offset past the last byte of the message, data_consumed is end - start
+'''
+
+import cStringIO
+import dpkt
+
+METHODS = frozenset((
+  'GET', 'PUT', 'ICY',
+  'COPY', 'HEAD', 'LOCK', 'MOVE', 'POLL', 'POST',
+  'BCOPY', 'BMOVE', 'MKCOL', 'TRACE', 'LABEL', 'MERGE',
+  'DELETE', 'SEARCH', 'UNLOCK', 'REPORT', 'UPDATE', 'NOTIFY',
+  'BDELETE', 'CONNECT', 'OPTIONS', 'CHECKIN',
+  'PROPFIND', 'CHECKOUT', 'CCM_POST',
+  'SUBSCRIBE', 'PROPPATCH', 'BPROPFIND',
+  'BPROPPATCH', 'UNCHECKOUT', 'MKACTIVITY',
+  'MKWORKSPACE', 'UNSUBSCRIBE', 'RPC_CONNECT',
+  'VERSION-CONTROL',
+  'BASELINE-CONTROL'
+))
+PROTO = 'HTTP'
+
+
+def next_line(buf, pos):
+  '''
+  returns the offset past the line starting at pos, like readline().
+  '''
+  end = buf.find('\n', pos)
+  if end < 0:
+    return len(buf)
+  return end + 1
+
+def parse_headers(buf, pos):
+  '''
+  Parses header lines from pos up to a blank line.
+  Returns ({name: value or [values]}, offset past the blank line).
+  '''
+  headers = {}
+  size = len(buf)
+  while 1:
+    if pos >= size:
+      raise dpkt.NeedData('premature end of headers')
+    end = next_line(buf, pos)
+    line = buf[pos:end].strip()
+    pos = end
+    if not line:
+      break
+    l = line.split(':', 1)
+    if len(l[0].split()) != 1:
+      raise dpkt.UnpackError('invalid header: %r' % line)
+    k = l[0].lower()
+    v = len(l) != 1 and l[1].lstrip() or ''
+    if k in headers:
+      if not type(headers[k]) is list:
+        headers[k] = [headers[k]]
+      headers[k].append(v)
+    else:
+      headers[k] = v
+  return headers, pos
+
+def parse_body(buf, pos, headers):
+  '''
+  Finds the body that starts at pos.
+  Returns ([(start, end)] spans of body data, offset past the body).
+  '''
+  size = len(buf)
+  if headers.get('transfer-encoding', '').lower() == 'chunked':
+    spans = []
+    found_end = False
+    while 1:
+      end = next_line(buf, pos)
+      try:
+        # drop chunk extensions
+        sz = buf[pos:end].split(None, 1)[0].split(';', 1)[0]
+        n = int(sz, 16)
+      except (IndexError, ValueError):
+        raise dpkt.UnpackError('missing chunk size')
+      pos = end
+      if n == 0:
+        found_end = True
+      data_end = min(pos + n, size)
+      chunk_len = data_end - pos
+      pos = data_end
+      end = next_line(buf, pos)
+      trailer = buf[pos:end].strip()
+      pos = end
+      if trailer:
+        break
+      if n and chunk_len == n:
+        spans.append((data_end - n, data_end))
+      else:
+        break
+    if not found_end:
+      raise dpkt.NeedData('premature end of chunked body')
+    return spans, pos
+  elif 'content-length' in headers:
+    try:
+      n = int(headers['content-length'])
+    except (TypeError, ValueError):
+      raise dpkt.UnpackError('invalid content-length: %r' %
+                             headers['content-length'])
+    if pos + n > size:
+      raise dpkt.NeedData('short body (missing %d bytes)' % (pos + n - size))
+    return [(pos, pos + n)], pos + n
+  else:
+    # XXX - need to handle HTTP/0.9
+    return [], pos
+
+
+class Message(object):
+  '''
+  A parsed HTTP message, with the members of a dpkt.http.Message (headers,
+  body, version) plus its position in the stream. The body is only copied
+  out of the stream when it is first accessed.
+  '''
+  def __init__(self, buf, start):
+    self.buf = buf
+    self.start = start
+    self.version = None
+    self.headers = None
+    self.header_end = None
+    self.body_spans = None
+    self.end = None
+    self._body = None
+    self.body_discarded = False
+    # {name: value} set by set_header since parsing
+    self.header_edits = {}
+
+  def __getstate__(self):
+    '''
+    Pickles the message with its body, unless it was discarded, but without
+    the stream it was parsed from. The headers are pickled as their block of
+    header lines and header_edits, and parsed again when unpickled, so they
+    come out exactly as they would have if the message had been parsed in
+    this process.
+    '''
+    state = self.__dict__.copy()
+    if not self.body_discarded:
+      state['_body'] = self.body
+    state['buf'] = None
+    state['headers'] = None
+    state['header_block'] = self.buf[next_line(self.buf, self.start):
+                                     self.header_end]
+    return state
+
+  def __setstate__(self, state):
+    header_block = state.pop('header_block')
+    self.__dict__.update(state)
+    self.headers, _ = parse_headers(header_block, 0)
+    for name, value in self.header_edits.iteritems():
+      self.headers[name] = value
+
+  def set_header(self, name, value):
+    '''
+    changes the value of a parsed header, e.g. to mask a cookie.
+    '''
+    self.headers[name] = value
+    self.header_edits[name] = value
+
+  def parse_rest(self, pos):
+    '''
+    parses headers and body starting at pos, after the start line.
+    '''
+    self.headers, self.header_end = parse_headers(self.buf, pos)
+    self.body_spans, self.end = parse_body(self.buf, self.header_end,
+                                           self.headers)
+
+  def discard_body(self):
+    '''
+    drops the copy of the body, once it is not needed anymore. It is not
+    pickled either, so it can not be read after unpickling. body_length
+    still works.
+    '''
+    self._body = None
+    self.body_discarded = True
+
+  def body_length(self):
+    return sum(end - start for start, end in self.body_spans)
+
+  def body_head(self, limit):
+    '''
+    returns the first limit bytes of the body, without copying the rest of
+    it out of the stream. A limit of None returns the whole body.
+    '''
+    if limit is None or self._body is not None:
+      return self.body[:limit]
+    out = cStringIO.StringIO()
+    for start, end in self.body_spans:
+      if limit <= 0:
+        break
+      length = min(end - start, limit)
+      out.write(buffer(self.buf, start, length))
+      limit -= length
+    return out.getvalue()
+
+  @property
+  def body(self):
+    if self._body is None:
+      if self.buf is None:
+        raise ValueError('the body was discarded before pickling')
+      if len(self.body_spans) == 1:
+        start, end = self.body_spans[0]
+        self._body = self.buf[start:end]
+      else:
+        out = cStringIO.StringIO()
+        for start, end in self.body_spans:
+          out.write(buffer(self.buf, start, end - start))
+        self._body = out.getvalue()
+    return self._body
+
+
+class Request(Message):
+  '''
+  HTTP request: method, uri, version, headers, body.
+  '''
+  def __init__(self, buf, start):
+    Message.__init__(self, buf, start)
+    end = next_line(buf, start)
+    line = buf[start:end]
+    l = line.strip().split()
+    if len(l) != 3 or l[0] not in METHODS or not l[2].startswith(PROTO):
+      raise dpkt.UnpackError('invalid request: %r' % line)
+    self.method = l[0]
+    self.uri = l[1]
+    self.version = l[2][len(PROTO)+1:]
+    self.parse_rest(end)
+
+
+class Response(Message):
+  '''
+  HTTP response: version, status, reason, headers, body.
+  '''
+  def __init__(self, buf, start):
+    Message.__init__(self, buf, start)
+    end = next_line(buf, start)
+    line = buf[start:end]
+    l = line.strip().split(None, 2)
+    if len(l) < 2 or not l[0].startswith(PROTO) or not l[1].isdigit():
+      raise dpkt.UnpackError('invalid response: %r' % line)
+    self.version = l[0][len(PROTO)+1:]
+    self.status = l[1]
+    # the reason phrase may be empty
+    self.reason = l[2] if len(l) > 2 else ''
+    self.parse_rest(end)
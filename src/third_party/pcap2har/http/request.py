@@ -2,11 +2,11 @@ import cgi
 import http
 import urlparse
 import base64
-from dpkt import http as dpkt_http
+import parsing
 
 class Request(http.Message):
   '''
-  HTTP request. Parses higher-level info out of dpkt.http.Request
+  HTTP request. Parses higher-level info out of http.parsing.Request
   Members:
   * query: Query string name-value pairs. {string: [string]}
   * host: hostname of server.
@@ -14,7 +14,7 @@ class Request(http.Message):
   * url: Full URL, but without fragments. (that's what HAR wants)
   '''
   def __init__(self, tcpdir, pointer):
-    http.Message.__init__(self, tcpdir, pointer, dpkt_http.Request)
+    http.Message.__init__(self, tcpdir, pointer, parsing.Request)
     # get query string. its the URL after the first '?'
     uri = urlparse.urlparse(self.msg.uri)
     self.host = self.msg.headers['host'] if 'host' in self.msg.headers else ''
@@ -24,6 +24,14 @@ class Request(http.Message):
     self.url, frag = urlparse.urldefrag(self.fullurl)
     self.query = cgi.parse_qs(uri.query)
 
+  def __setstate__(self, state):
+    '''
+    Parses the query again after unpickling, so that the dict iterates in the
+    same order as the original.
+    '''
+    self.__dict__.update(state)
+    self.query = cgi.parse_qs(urlparse.urlparse(self.msg.uri).query)
+
   def json_repr(self):
     '''
     self = http.Request
@@ -44,6 +52,6 @@ class Request(http.Message):
       'queryString': http.query_json_repr(self.query),
       'headersSize': -1,
       'headers': http.header_json_repr(self.msg.headers),
-      'bodySize': len(self.msg.body),
+      'bodySize': self.msg.body_length(),
       'postData': postData,
     }
@@ -1,10 +1,9 @@
 import base64
 import cStringIO
-import gzip
 import http
 import logging
 import zlib
-from dpkt import http as dpkt_http
+import parsing
 from mediatype import MediaType
 
 
@@ -15,20 +14,66 @@ try:
 except ImportError:
   UnicodeDammit = None
 
+# size of the pieces bodies are decompressed in
+DECODE_CHUNK = 64 * 1024
+
+def inflate(data, wbits, limit=None):
+  '''
+  Decompresses zlib data piece by piece, so that only the part of the output
+  that is kept is ever held in memory. Concatenated gzip members are all
+  decompressed, like gzip.GzipFile does.
+  Args:
+  data = string, compressed data
+  wbits = int, see zlib.decompressobj
+  limit = int or None, number of bytes of output to keep, None for all
+  Returns:
+  (string, int) = kept output, size of the whole output
+  Raises zlib.error on invalid data.
+  '''
+  kept = cStringIO.StringIO()
+  size = 0
+  while data:
+    decompressor = zlib.decompressobj(wbits)
+    while data:
+      piece = decompressor.decompress(data, DECODE_CHUNK)
+      data = decompressor.unconsumed_tail
+      size += len(piece)
+      if limit is None or kept.tell() < limit:
+        kept.write(piece if limit is None else piece[:limit - kept.tell()])
+    piece = decompressor.flush()
+    size += len(piece)
+    if limit is None or kept.tell() < limit:
+      kept.write(piece if limit is None else piece[:limit - kept.tell()])
+    data = decompressor.unused_data
+    if wbits & 16 and not data.startswith('\x1f\x8b'):
+      # trailing garbage after the last gzip member is ignored
+      break
+  return kept.getvalue(), size
+
 class Response(http.Message):
   '''
   HTTP response.
   Members:
   * mediaType: mediatype.MediaType, constructed from content-type
   * mimeType: string mime type of returned data
-  * body: http decoded body data, otherwise unmodified
-  * text: body text, unicoded if possible, or None if the body is not text
   * compression: string, compression type
-  * original_encoding: string, original text encoding/charset/whatever
+  * content: string, content mode (http.CONTENT_*) of the HAR entry
+  * content_limit: int, bytes of body kept in http.CONTENT_CAPPED mode
+  * decoded: (size, encoding, text) of the HAR content, set by decode
+  * bytes_decompressed: int, size of the decompressed body, set by decode
+
+  The body is http decoded and converted to text by decode, only as far as
+  the content mode requires. http.Flow calls it while parsing the flow, so
+  in parallel mode the decoding runs in the worker processes, and only its
+  results are pickled back, not the raw body. json_repr only uses them.
   '''
   def __init__(self, tcpdir, pointer):
-    http.Message.__init__(self, tcpdir, pointer, dpkt_http.Response)
-    # uncompress body if necessary
+    http.Message.__init__(self, tcpdir, pointer, parsing.Response)
+    options = tcpdir.flow.options
+    self.content = options.content
+    self.content_limit = options.content_limit
+    self.decoded = None
+    self.bytes_decompressed = 0
     self.handle_compression()
     # get mime type
     if 'content-type' in self.msg.headers:
@@ -36,123 +81,146 @@ class Response(http.Message):
     else:
       self.mediaType = MediaType('application/x-unknown-content-type')
     self.mimeType = self.mediaType.mimeType()
-    # try to get out unicode
-    self.handle_text()
+
   def handle_compression(self):
     '''
-    Sets self.body to the http decoded response data. Sets compression to
-    the name of the compresson type.
+    Sets compression to the name of the compresson type. Raises
+    http.DecodingError if it is not a known one.
     '''
     # if content-encoding is found
     if 'content-encoding' in self.msg.headers:
       encoding = self.msg.headers['content-encoding'].lower()
       self.compression = encoding
-      # handle gzip
-      if encoding == 'gzip' or encoding == 'x-gzip':
-        try:
-          gzipfile = gzip.GzipFile(
-            fileobj = cStringIO.StringIO(self.raw_body)
-          )
-          self.body = gzipfile.read()
-        except zlib.error:
-          raise http.DecodingError('zlib failed to gunzip HTTP data')
-        except:
-          # who knows what else it might raise
-          raise http.DecodingError("failed to gunzip HTTP data, don't know why")
-      # handle deflate
-      elif encoding == 'deflate':
-        try:
-          # NOTE: wbits = -15 is a undocumented feature in python (it's
-          # documented in zlib) that gets rid of the header so we can
-          # do raw deflate. See: http://bugs.python.org/issue5784
-          self.body = zlib.decompress(self.raw_body, -15)
-        except zlib.error:
-          raise http.DecodingError('zlib failed to undeflate HTTP data')
-      elif encoding == 'compress' or encoding == 'x-compress':
-        # apparently nobody uses this, so basically just ignore it
-        self.body = self.raw_body
-      elif encoding == 'identity':
-        # no compression
-        self.body = self.raw_body
-      else:
-        # I'm pretty sure the above are the only allowed encoding types
-        # see RFC 2616 sec 3.5
-        # (http://www.w3.org/Protocols/rfc2616/rfc2616-sec3.html#sec3.5)
+      # I'm pretty sure these are the only allowed encoding types
+      # see RFC 2616 sec 3.5
+      # (http://www.w3.org/Protocols/rfc2616/rfc2616-sec3.html#sec3.5)
+      if encoding not in ('gzip', 'x-gzip', 'deflate', 'compress',
+                          'x-compress', 'identity'):
         raise http.DecodingError('unknown content-encoding token: ' + encoding)
     else:
       # no compression
       self.compression = 'identity'
-      self.body = self.raw_body
 
-  def handle_text(self):
+  def decode_body(self, limit=None):
+    '''
+    Returns (body, size): the http decoded body, or its first limit bytes,
+    and the size of the whole decoded body.
+    Raises http.DecodingError if the body can't be decompressed.
+    '''
+    encoding = self.compression
+    if encoding == 'gzip' or encoding == 'x-gzip':
+      try:
+        return inflate(self.raw_body, 16 + zlib.MAX_WBITS, limit)
+      except zlib.error:
+        raise http.DecodingError('zlib failed to gunzip HTTP data')
+    elif encoding == 'deflate':
+      try:
+        # NOTE: wbits = -15 is a undocumented feature in python (it's
+        # documented in zlib) that gets rid of the header so we can
+        # do raw deflate. See: http://bugs.python.org/issue5784
+        return inflate(self.raw_body, -15, limit)
+      except zlib.error:
+        raise http.DecodingError('zlib failed to undeflate HTTP data')
+    # identity, or compress, which apparently nobody uses, so basically just
+    # ignore it
+    if limit is None:
+      return self.raw_body, self.msg.body_length()
+    return self.msg.body_head(limit), self.msg.body_length()
+
+  def is_text(self):
+    '''
+    Whether the body is text, according to the media type.
+    '''
+    return (self.mediaType.type == 'text' or
+            (self.mediaType.type == 'application' and
+             'xml' in self.mediaType.subtype))
+
+  def handle_text(self, body):
     '''
     Takes care of converting body text to unicode, if its text at all.
-    Sets self.original_encoding to original char encoding, and converts body
-    to unicode if possible. Must come after handle_compression, and after
-    self.mediaType is valid.
+    Returns (encoding, text): text is unicode for text bodies, None if it
+    could not be decoded, or the base64 encoded body with encoding "base64"
+    if the body is not text.
+    '''
+    if not self.is_text():
+      return "base64", base64.b64encode(body)
+    # if there was a charset parameter in HTTP header, use it first
+    if 'charset' in self.mediaType.params:
+      override_encodings = [self.mediaType.params['charset']]
+    else:
+      override_encodings = []
+    # if there even is data (otherwise, dammit.originalEncoding might be None)
+    if body == '':
+      return None, None
+    if UnicodeDammit:
+      # honestly, I don't mind not abiding by RFC 2023. UnicodeDammit just
+      # does what makes sense, and if the content is remotely standards-
+      # compliant, it will do the right thing.
+      dammit = UnicodeDammit(body, override_encodings)
+      # if unicode was not found, HAR can't write data
+      return None, dammit.unicode or None
+    # try the braindead version, just guess content-type or utf-8
+    u = None
+    # try our list of encodings + utf8 with strict errors
+    for e in override_encodings + ['utf8', 'iso-8859-1']:
+      try:
+        u = body.decode(e, 'strict')
+        break # if ^^ didn't throw, we're done
+      except UnicodeError:
+        logging.debug("Decoding unicocde response.")
+    # if none of those worked, try utf8 with 'replace' error mode
+    if not u:
+      # unicode has failed
+      u = body.decode('utf8', 'replace')
+    return None, u or None
+
+  def decode(self):
     '''
-    self.encoding = None
-    self.text = None
-    # if the body is text
-    if (self.mediaType and
-      (self.mediaType.type == 'text' or
-        (self.mediaType.type == 'application' and
-         'xml' in self.mediaType.subtype))):
-      # if there was a charset parameter in HTTP header, store it
-      if 'charset' in self.mediaType.params:
-        override_encodings = [self.mediaType.params['charset']]
-      else:
-        override_encodings = []
-      # if there even is data (otherwise, dammit.originalEncoding might be None)
-      if self.body != '':
-        if UnicodeDammit:
-          # honestly, I don't mind not abiding by RFC 2023. UnicodeDammit just
-          # does what makes sense, and if the content is remotely standards-
-          # compliant, it will do the right thing.
-          dammit = UnicodeDammit(self.body, override_encodings)
-          # if unicode was found
-          if dammit.unicode:
-            self.text = dammit.unicode
-            self.originalEncoding = dammit.originalEncoding
-          else:
-            # unicode could not be decoded, at all
-            # HAR can't write data, but body might still be useful as-is
-            pass
-        else:
-          # try the braindead version, just guess content-type or utf-8
-          u = None
-          # try our list of encodings + utf8 with strict errors
-          for e in override_encodings + ['utf8', 'iso-8859-1']:
-            try:
-              u = self.body.decode(e, 'strict')
-              self.originalEncoding = e
-              break # if ^^ didn't throw, we're done
-            except UnicodeError:
-              logging.warning("Decoding unicocde response.")
-              pass
-          # if none of those worked, try utf8 with 'replace' error mode
-          if not u:
-            # unicode has failed
-            u = self.body.decode('utf8', 'replace')
-            self.originalEncoding = None # ???
-          self.text = u or None
+    http decodes the body and converts it to text, as far as the content
+    mode requires. Sets decoded and bytes_decompressed.
+    '''
+    # how much of the body the content mode needs
+    if self.content == http.CONTENT_NONE:
+      limit = 0
+    elif self.content == http.CONTENT_TEXT and not self.is_text():
+      limit = 0
+    elif self.content == http.CONTENT_CAPPED:
+      limit = self.content_limit
+    else:
+      limit = None
+    try:
+      body, size = self.decode_body(limit)
+    except http.DecodingError, error:
+      logging.warning(error)
+      body, size = self.msg.body_head(limit), self.msg.body_length()
     else:
-      # body is not text
-      self.encoding = "base64"
-      self.text = base64.b64encode(self.body)
+      if self.compression in ('gzip', 'x-gzip', 'deflate'):
+        self.bytes_decompressed = size
+    encoding, text = None, None
+    if limit != 0:
+      encoding, text = self.handle_text(body)
+      if not encoding and text:
+        text = text.encode('utf8') # must transcode to utf8
+    self.decoded = (size, encoding, text)
+    # only decoded is used from now on, the raw body is not sent back from
+    # the worker processes
+    self.msg.discard_body()
 
   def json_repr(self):
     """json_repr for HTTP response."""
+    if self.decoded is None:
+      self.decode()
+    size, encoding, text = self.decoded
     content =  {
-      'size': len(self.body),
-      'compression': len(self.body) - len(self.raw_body),
+      'size': size,
+      'compression': size - self.msg.body_length(),
       'mimeType': self.mimeType
     }
-    if self.encoding:
-      content['encoding'] = self.encoding
-      content['text'] = self.text
-    elif self.text:
-      content['text'] = self.text.encode('utf8') # must transcode to utf8
+    if encoding:
+      content['encoding'] = encoding
+      content['text'] = text
+    elif text:
+      content['text'] = text
 
     headers = self.msg.headers
     return {
@@ -161,7 +229,7 @@ class Response(http.Message):
       'httpVersion': self.msg.version,
       'cookies': [],
       'headersSize': -1,
-      'bodySize': len(self.msg.body),
+      'bodySize': self.msg.body_length(),
       'redirectURL': headers['location'] if 'location' in headers else '',
       'headers': http.header_json_repr(self.msg.headers),
       'content': content,
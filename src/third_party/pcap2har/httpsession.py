@@ -22,6 +22,16 @@ class Page:
     self.started_datetime = started_datetime # python datetime
     self.url = url
 
+def entry_start_ts(request):
+  '''
+  returns the start timestamp of the HAR entry of the resolved http.Request,
+  like Entry: the start of its DNS lookup if it claimed one before it
+  connected, otherwise when it connected.
+  '''
+  if request.dns_start_ts != -1 and request.dns_start_ts <= request.ts_connect:
+    return request.dns_start_ts
+  return request.ts_connect
+
 class Entry:
   '''
   represents an HTTP request/response in a form suitable for writing to a HAR
@@ -184,43 +194,66 @@ class HTTPSession(object):
     self.entries = []
     # iter through messages
     for msg in messages:
-      # if msg.request has a user-agent, add it to our list
-      entry = Entry(msg.request, msg.response)
-
-      if 'user-agent' in msg.request.msg.headers:
-        self.user_agents.add(msg.request.msg.headers['user-agent'])
-
-      # if msg.request has a referer, keep track of that, too
-      # TODO(lsong): This is not quite the right way to break up pages.
-      # entry.page_ref = self.page_tracker.getref(
-      #     msg.request.msg.headers.get('referer', ''), entry.startedDateTime)
-      # Put everything in one page for now.
-      entry.page_ref = self.page_tracker.getref("page_0",
-                                                entry.started_datetime)
-
-
       # parse basic data in the pair, add it to the list
-      self.entries.append(entry)
+      self.entries.append(self.make_entry(msg))
 
     # Sort the entries on start
     self.entries.sort(lambda x, y: cmp(x.ts_start, y.ts_start))
     self.user_agent = self.user_agents.dominant_user_agent()
+
+  def make_entry(self, msg):
+    '''
+    Creates the Entry for one http.MessagePair, and records its user-agent
+    and page. The entry is not added to self.entries, so entries can be
+    written out one by one while the session keeps track of the log-wide
+    data.
+    '''
+    entry = Entry(msg.request, msg.response)
+
+    # if msg.request has a user-agent, add it to our list
+    if 'user-agent' in msg.request.msg.headers:
+      self.user_agents.add(msg.request.msg.headers['user-agent'])
+
+    # if msg.request has a referer, keep track of that, too
+    # TODO(lsong): This is not quite the right way to break up pages.
+    # entry.page_ref = self.page_tracker.getref(
+    #     msg.request.msg.headers.get('referer', ''), entry.startedDateTime)
+    # Put everything in one page for now.
+    entry.page_ref = self.page_tracker.getref("page_0",
+                                              entry.started_datetime)
+    return entry
+
+  def json_repr_header(self):
+    '''
+    return the part of the log that is known before any entry.
+    '''
+    return {
+      'version' : '1.1',
+      'creator': {
+        'name': 'pcap2har',
+        'version': '0.1'
+      },
+    }
+
+  def json_repr_footer(self):
+    '''
+    return the part of the log that is only known after all the entries.
+    '''
+    return {
+      'browser': {
+        'name': self.user_agents.dominant_user_agent(),
+        'version': 'mumble'
+      },
+      'pages': self.page_tracker,
+    }
+
   def json_repr(self):
     '''
     return a JSON serializable python object representation of self.
     '''
+    log = self.json_repr_header()
+    log.update(self.json_repr_footer())
+    log['entries'] = self.entries
     return {
-      'log': {
-        'version' : '1.1',
-        'creator': {
-          'name': 'pcap2har',
-          'version': '0.1'
-        },
-        'browser': {
-          'name': self.user_agent,
-          'version': 'mumble'
-        },
-        'pages': self.page_tracker,
-        'entries': self.entries
-      }
+      'log': log
     }
@@ -33,20 +33,51 @@ sys.path.append(os.path.abspath(dpkt_path))
 
 
 
+import cProfile
 import heapq
 import logging
-import StringIO
+import pstats
 import time
 import convert
+import har
+import stats
 
 def PrintUsage():
   print __file__, "[options] <pcap file> [<har file>]"
   print "options: -l[diwe] log level"
   print "         --port filter out port"
+  print "         --filter <expression> filter out matching traffic"
+  print "         --only <expression> only convert matching connections"
+  print "           expressions: host <ip>, port <n>, portrange <m>-<n>,"
+  print "           tcp, udp, joined by 'and'"
+  print "         --stream convert flows as they close, with bounded memory"
+  print "         -j <n> parse flows for HTTP in n processes"
+  print "         --flow-timeout <seconds> idle time before a flow is closed"
+  print "         --content <mode> response bodies in the HAR: none, text-only,"
+  print "           capped or full (default)"
+  print "         --content-limit <bytes> bytes kept per body in capped mode"
+  print "         --compact write the HAR without indentation"
+  print "         -z write the HAR gzip compressed"
+  print "         --columnar read the capture into a NumPy packet table"
+  print "         --stats print the timings and counters of the conversion,"
+  print "           with the read, decode and reassembly parts of the tcp stage"
+  print "         --profile <stage> print the profile of a stage: tcp, http,"
+  print "           har or json"
 
 def main(argv=None):
   logging_level = logging.WARNING
-  filter_port = -1
+  exclude = []
+  include = []
+  stream = False
+  flow_timeout = None
+  workers = 1
+  content = None
+  content_limit = None
+  compact = False
+  compress = False
+  columnar = False
+  print_stats = False
+  profile = []
   if argv is None:
     argv = sys.argv
   filenames = []
@@ -60,7 +91,56 @@ def main(argv=None):
       if idx >= len(argv):
         PrintUsage()
         return 1
-      filter_port = int(argv[idx])
+      exclude.append('port %d' % int(argv[idx]))
+    elif argv[idx] in ('--filter', '--only'):
+      idx += 1
+      if idx >= len(argv):
+        PrintUsage()
+        return 1
+      if argv[idx - 1] == '--filter':
+        exclude.append(argv[idx])
+      else:
+        include.append(argv[idx])
+    elif argv[idx] == '-j':
+      idx += 1
+      if idx >= len(argv):
+        PrintUsage()
+        return 1
+      workers = int(argv[idx])
+    elif argv[idx] == '--stream':
+      stream = True
+    elif argv[idx] == '--flow-timeout':
+      idx += 1
+      if idx >= len(argv):
+        PrintUsage()
+        return 1
+      flow_timeout = float(argv[idx])
+    elif argv[idx] == '--content':
+      idx += 1
+      if idx >= len(argv) or argv[idx] not in convert.http.CONTENT_MODES:
+        PrintUsage()
+        return 1
+      content = argv[idx]
+    elif argv[idx] == '--content-limit':
+      idx += 1
+      if idx >= len(argv):
+        PrintUsage()
+        return 1
+      content_limit = int(argv[idx])
+    elif argv[idx] == '--compact':
+      compact = True
+    elif argv[idx] == '-z':
+      compress = True
+    elif argv[idx] == '--columnar':
+      columnar = True
+    elif argv[idx] == '--stats':
+      print_stats = True
+    elif argv[idx] == '--profile':
+      idx += 1
+      if idx >= len(argv) or argv[idx] not in stats.STAGES:
+        PrintUsage()
+        return 1
+      profile.append(argv[idx])
     elif argv[idx] == '-ld':
       logging_level = logging.DEBUG
     elif argv[idx] == '-li':
@@ -90,19 +170,45 @@ def main(argv=None):
     PrintUsage()
     return 1
 
-  # If excpetion raises, do not catch it to terminate the program.
-  inf = open(pcap_file, 'r')
-  pcap_in = inf.read()
-  inf.close
-  har_out = StringIO.StringIO()
   options = convert.Options()
   #options.remove_cookie = False
-  convert.convert(pcap_in, har_out, options)
-  har_out_str = har_out.getvalue()
-  outf = open(har_file, 'w')
-  outf.write(har_out_str)
-  outf.close()
+  if flow_timeout is not None:
+    options.flow_timeout = flow_timeout
+  options.exclude.extend(exclude)
+  options.workers = workers
+  if content is not None:
+    options.content = content
+  if content_limit is not None:
+    options.content_limit = content_limit
+  options.compact = compact
+  options.columnar = columnar
+  options.substages = print_stats
+  options.include.extend(include)
+  for stage in profile:
+    options.profilers[stage] = cProfile.Profile()
 
+  # If excpetion raises, do not catch it to terminate the program.
+  outf = open(har_file, 'wb')
+  if compress:
+    har_out = har.CompressingWriter(outf, 'gzip')
+  else:
+    har_out = outf
+  inf = open(pcap_file, 'rb')
+  if stream:
+    conversion_stats = convert.convert_stream(inf, har_out, options)
+  else:
+    conversion_stats = convert.convert(inf, har_out, options)
+  inf.close()
+  if compress:
+    har_out.close()
+  outf.close()
+  if print_stats:
+    print >>sys.stderr, conversion_stats.report()
+  for stage in profile:
+    print >>sys.stderr, "Profile of stage", stage
+    pstats.Stats(options.profilers[stage], stream=sys.stderr).sort_stats(
+        'cumulative').print_stats(30)
+  return 0
 
 if __name__ == "__main__":
   sys.exit(main())
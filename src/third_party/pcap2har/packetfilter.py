@@ -0,0 +1,186 @@
+'''
+Packet filter that works on the raw captured bytes, so that traffic that is
+going to be dropped never gets decoded by dpkt.
+
+A filter is built from expressions, each a list of terms joined by "and":
+
+  host <a.b.c.d>      either address is a.b.c.d
+  port <n>            either port is n
+  portrange <m>-<n>   either port is in [m, n]
+  tcp, udp            the transport protocol
+
+e.g. "tcp and port 53", "host 10.0.0.1 and portrange 8000-8080".
+
+Packets whose headers cannot be read from fixed offsets (unusual link layer
+encapsulations, IP fragments, ...) are left undecided, and get checked by
+accept_ip() once they have been decoded.
+'''
+
+import struct
+import dpkt
+from pcaputil import inet_aton
+
+IP_PROTO_TCP = 6
+IP_PROTO_UDP = 17
+
+ETH_TYPE_IP = 0x0800
+ETH_TYPE_8021Q = 0x8100
+ETH_TYPE_MPLS = 0x8847
+ETH_TYPE_MPLS_MCAST = 0x8848
+
+LINKTYPE_NULL = 0
+LINKTYPE_RAW = 101
+
+# traffic that is never HTTP, or that can't be parsed anyway
+DEFAULT_EXCLUDE = [
+  'port 443', # HTTPS
+  'port 5223', # hpvirtgrp
+  'port 5228', # hpvroom
+  'tcp and port 53', # DNS over TCP
+]
+
+_ushort = struct.Struct('>H')
+_loopback_family = struct.Struct('@I')
+# version/header length, fragment offset, protocol, source and destination
+_ipv4 = struct.Struct('>B5xHxB2x4s4s')
+_ports = struct.Struct('>HH')
+
+
+def parse_term(term):
+  '''
+  Returns a predicate(proto, src, dst, sport, dport) for a single term.
+  Raises ValueError if the term is not understood.
+  '''
+  words = term.split()
+  if words == ['tcp']:
+    return lambda proto, src, dst, sport, dport: proto == IP_PROTO_TCP
+  if words == ['udp']:
+    return lambda proto, src, dst, sport, dport: proto == IP_PROTO_UDP
+  if len(words) == 2 and words[0] == 'host':
+    addr = inet_aton(words[1])
+    return lambda proto, src, dst, sport, dport: addr == src or addr == dst
+  if len(words) == 2 and words[0] == 'port':
+    port = int(words[1])
+    return lambda proto, src, dst, sport, dport: port == sport or port == dport
+  if len(words) == 2 and words[0] == 'portrange':
+    low, high = [int(p) for p in words[1].split('-', 1)]
+    return lambda proto, src, dst, sport, dport: (low <= sport <= high or
+                                                  low <= dport <= high)
+  raise ValueError('invalid filter term: %r' % term)
+
+def parse_expression(expression):
+  '''
+  Returns a predicate(proto, src, dst, sport, dport) that is true if all the
+  terms of the expression match.
+  '''
+  terms = [parse_term(term) for term in expression.split(' and ')]
+  if len(terms) == 1:
+    return terms[0]
+  return lambda *fields: all(term(*fields) for term in terms)
+
+
+class PacketFilter(object):
+  '''
+  Decides which packets get decoded.
+
+  TCP packets are kept if they match none of the exclude expressions, and,
+  if there are include expressions, at least one of them. UDP packets are
+  only kept if they are DNS (port 53) and match no exclude expression; the
+  include expressions select connections, so they don't apply to DNS.
+  Everything that is not TCP or UDP over IPv4 is dropped.
+
+  Members:
+  linktype = int, DLT_* of the capture
+  '''
+  def __init__(self, linktype, exclude=(), include=()):
+    '''
+    Args:
+    linktype = int, DLT_* of the capture
+    exclude = [string], filter expressions of traffic to drop
+    include = [string], filter expressions of traffic to keep
+    '''
+    self.linktype = linktype
+    self.exclude = [parse_expression(e) for e in exclude]
+    self.include = [parse_expression(e) for e in include]
+
+  def ip_offset(self, buf):
+    '''
+    Returns the offset of the IPv4 header in the frame, -1 if the frame is
+    not IPv4, or None if that can't be told from the raw bytes.
+    '''
+    if self.linktype == dpkt.pcap.DLT_EN10MB:
+      if len(buf) < 14:
+        return None
+      eth_type = _ushort.unpack_from(buf, 12)[0]
+      if eth_type == ETH_TYPE_IP:
+        return 14
+      if eth_type == ETH_TYPE_8021Q:
+        if len(buf) >= 18 and _ushort.unpack_from(buf, 16)[0] == ETH_TYPE_IP:
+          return 18
+        return None
+      if (eth_type <= 1500 or eth_type == ETH_TYPE_MPLS or
+          eth_type == ETH_TYPE_MPLS_MCAST):
+        # LLC, ISL or MPLS, let dpkt sort it out
+        return None
+      return -1
+    elif self.linktype == dpkt.pcap.DLT_LINUX_SLL:
+      if len(buf) >= 16 and _ushort.unpack_from(buf, 14)[0] == ETH_TYPE_IP:
+        return 16
+      return None
+    elif self.linktype == LINKTYPE_NULL:
+      if len(buf) >= 4 and \
+         _loopback_family.unpack_from(buf, 0)[0] in (2, 0x02000000):
+        return 4
+      return None
+    elif self.linktype == LINKTYPE_RAW:
+      return 0
+    return None
+
+  def check(self, buf):
+    '''
+    Returns True if the raw frame should be decoded, False if it should be
+    dropped, or None if it must be decoded to decide (see accept_ip).
+    '''
+    offset = self.ip_offset(buf)
+    if offset is None:
+      return None
+    if offset < 0:
+      return False
+    if len(buf) < offset + 20:
+      return None
+    v_hl, frag, proto, src, dst = _ipv4.unpack_from(buf, offset)
+    if v_hl >> 4 != 4 or v_hl & 0xf < 5 or frag & 0x1fff:
+      # not IPv4 after all, broken, or a fragment
+      return None
+    if proto != IP_PROTO_TCP and proto != IP_PROTO_UDP:
+      return False
+    offset += (v_hl & 0xf) << 2
+    if len(buf) < offset + 4:
+      return None
+    sport, dport = _ports.unpack_from(buf, offset)
+    return self.match(proto, src, dst, sport, dport)
+
+  def accept_ip(self, ip):
+    '''
+    Same as check(), for an already decoded dpkt.ip.IP. Packets that are not
+    TCP or UDP are accepted; the caller ignores them anyway.
+    '''
+    if not isinstance(ip.data, (dpkt.tcp.TCP, dpkt.udp.UDP)):
+      return True
+    return self.match(ip.p, ip.src, ip.dst, ip.data.sport, ip.data.dport)
+
+  def match(self, proto, src, dst, sport, dport):
+    '''
+    Applies the filter expressions to the fields of a TCP or UDP packet.
+    '''
+    if proto == IP_PROTO_UDP and sport != 53 and dport != 53:
+      return False
+    for expression in self.exclude:
+      if expression(proto, src, dst, sport, dport):
+        return False
+    if self.include and proto == IP_PROTO_TCP:
+      for expression in self.include:
+        if expression(proto, src, dst, sport, dport):
+          return True
+      return False
+    return True
@@ -0,0 +1,482 @@
+'''
+Sidecar index of a capture, to convert only some of its connections.
+
+The indexing pass reads the capture like pcap.TCPFlowAccumulator, with the
+same filters, but does not reassemble or parse anything. It records:
+* for every TCP connection: its addresses and ports, the timestamps of its
+  first and last packets, the file offset of its SYN, and the file offsets of
+  the records of its packets
+* the file offsets of the DNS packets, and the hostnames the DNS answers
+  give for each address, with the timestamps of their lookups
+
+The index is saved next to the capture, in the file named by index_file.
+Connections can then be selected by hostname, address or time window, and
+converted by reading only their records and the DNS ones: see Selection,
+convert.convert_packets and extract.py. open_index rebuilds the index when
+the capture changed size or modification time, or was indexed with other
+filters.
+
+File format: INDEX_MAGIC, then two zlib compressed parts, each preceded by
+its compressed length as a little-endian 64 bit integer:
+* JSON metadata: capture, filters, hostnames, lookups and connections
+* the record offsets as little-endian 64 bit integers: the DNS packets,
+  then the packets of each connection, delta-encoded within each group
+'''
+
+import array
+import json
+import logging
+import os
+import struct
+import sys
+import zlib
+import dpkt
+import dns
+import pcap
+from pcaputil import inet_ntoa
+from pcapreader import Reader
+
+INDEX_SUFFIX = '.p2hidx'
+INDEX_MAGIC = 'pcap2har index 2\n'
+# array type of the offsets: Python 2 arrays have no 64 bit integer type, and
+# 'l' only has 64 bits on some platforms. Doubles hold offsets up to 2^53.
+if array.array('l').itemsize == 8:
+  OFFSET_TYPE = 'l'
+else:
+  OFFSET_TYPE = 'd'
+# offsets packed at once when converting them
+PACK_COUNT = 65536
+
+
+def index_file(pcap_file):
+  '''
+  returns the name of the index file of the capture file.
+  '''
+  return pcap_file + INDEX_SUFFIX
+
+
+def address_str(ip):
+  '''
+  returns the packed address as a dotted IPv4 address, or as hex.
+  '''
+  if len(ip) == 4:
+    return inet_ntoa(ip)
+  return ip.encode('hex')
+
+
+def is_address(host):
+  '''
+  returns whether a host given to select is an address rather than a
+  hostname: a dotted IPv4 address, or the hex of an IPv6 one.
+  '''
+  if host.count('.') == 3:
+    return all(part.isdigit() for part in host.split('.'))
+  return len(host) == 32 and all(c in '0123456789abcdef' for c in host.lower())
+
+
+def hostname_matches(hostname, host):
+  '''
+  returns whether hostname is host, or a subdomain of host if host starts
+  with a dot. Case and a port after the hostname are ignored.
+  '''
+  hostname = hostname.split(':')[0].lower()
+  host = host.lower()
+  return hostname == host or (host.startswith('.') and
+                              ('.' + hostname).endswith(host))
+
+
+def request_matches(request, server_ip, hosts):
+  '''
+  returns whether the http.Request, sent to the packed server_ip, is to any
+  of the hosts: the address of the server, or the hostname or domain of its
+  Host header.
+  '''
+  for host in hosts:
+    if is_address(host):
+      if address_str(server_ip) == host.lower():
+        return True
+    elif hostname_matches(request.host, host):
+      return True
+  return False
+
+
+def encode(offsets, deltas):
+  '''
+  appends the sorted offsets to the deltas array, delta-encoded.
+  '''
+  previous = 0
+  for offset in offsets:
+    deltas.append(offset - previous)
+    previous = offset
+
+
+def decode(deltas, position, count):
+  '''
+  returns the count offsets starting at position in the deltas array.
+  '''
+  offsets = []
+  offset = 0
+  for delta in deltas[position:position + count]:
+    offset += int(delta)
+    offsets.append(offset)
+  return offsets
+
+
+def pack_offsets(offsets):
+  '''
+  returns the offsets array as little-endian 64 bit integers.
+  '''
+  if OFFSET_TYPE == 'l' and sys.byteorder == 'little':
+    return offsets.tostring()
+  return ''.join(struct.pack('<%dq' % len(offsets[pos:pos + PACK_COUNT]),
+                             *[int(offset) for offset in
+                               offsets[pos:pos + PACK_COUNT]])
+                 for pos in xrange(0, len(offsets), PACK_COUNT))
+
+
+def unpack_offsets(data):
+  '''
+  returns the array of the offsets packed by pack_offsets.
+  '''
+  offsets = array.array(OFFSET_TYPE)
+  if OFFSET_TYPE == 'l' and sys.byteorder == 'little':
+    offsets.fromstring(data)
+    return offsets
+  for pos in xrange(0, len(data), PACK_COUNT * 8):
+    chunk = data[pos:pos + PACK_COUNT * 8]
+    offsets.extend(struct.unpack('<%dq' % (len(chunk) / 8), chunk))
+  return offsets
+
+
+class Connection(object):
+  '''
+  A TCP connection of an indexed capture.
+
+  Members:
+  src, dst = (address, port), src being the end that sent the first packet.
+    Addresses are strings, see address_str.
+  first_ts, last_ts = timestamps of the first and last packets
+  syn_offset = file offset of the record of the SYN, or None
+  count = number of packets
+  position = index of the first of the packet offsets in PacketIndex.deltas
+  '''
+  def __init__(self, src, dst, first_ts, last_ts, syn_offset, count,
+               position):
+    self.src = src
+    self.dst = dst
+    self.first_ts = first_ts
+    self.last_ts = last_ts
+    self.syn_offset = syn_offset
+    self.count = count
+    self.position = position
+
+  def json_repr(self):
+    return [self.src[0], self.src[1], self.dst[0], self.dst[1], self.first_ts,
+            self.last_ts, self.syn_offset, self.count]
+
+
+class IndexBuilder(pcap.TCPFlowAccumulator):
+  '''
+  Collects the record offsets of the TCP connections and DNS packets of a
+  capture. flowdict stays empty.
+
+  Members:
+  sockets = {socket: [first_ts, last_ts, syn_offset, array of offsets]}, the
+    connections by the socket of their first packet, with packed addresses
+  order = [socket], in the order of their first packet
+  dns_offsets = [int], record offsets of the DNS packets
+  '''
+  def __init__(self, pcap_reader, options):
+    self.sockets = {}
+    self.order = []
+    self.dns_offsets = []
+    pcap.TCPFlowAccumulator.__init__(self, pcap_reader, options)
+
+  def add_dns(self, record):
+    self.dns_offsets.append(record[2].offset)
+
+  def add_segment(self, record, ip_packet):
+    ts, frame, header = record
+    segment = ip_packet.data
+    src = (ip_packet.src, segment.sport)
+    dst = (ip_packet.dst, segment.dport)
+    connection = self.sockets.get((src, dst)) or self.sockets.get((dst, src))
+    if connection is None:
+      connection = self.sockets[(src, dst)] = [ts, ts, None,
+                                               array.array(OFFSET_TYPE)]
+      self.order.append((src, dst))
+    if ts > connection[1]:
+      connection[1] = ts
+    if (connection[2] is None and segment.flags & dpkt.tcp.TH_SYN and
+        not segment.flags & dpkt.tcp.TH_ACK):
+      connection[2] = header.offset
+    connection[3].append(header.offset)
+
+
+class PacketIndex(object):
+  '''
+  The index of a capture. See the module documentation.
+
+  Members:
+  capture = {'size': int, 'mtime': int} of the indexed capture file
+  filters = {'exclude': [string], 'include': [string]} it was indexed with
+  hostnames = {address: [hostname]}, from the DNS answers
+  lookups = {address: [[start, end]]}, the query and answer timestamps of
+    the DNS lookups that answered the address, see dns.DNS.ip_lookups
+  connections = [Connection], in the order of their first packet
+  dns_count = number of DNS packets, whose offsets start the deltas
+  deltas = array of the delta-encoded record offsets
+  '''
+  def __init__(self, capture, filters, hostnames, lookups, connections,
+               dns_count, deltas):
+    self.capture = capture
+    self.filters = filters
+    self.hostnames = hostnames
+    self.lookups = lookups
+    self.connections = connections
+    self.dns_count = dns_count
+    self.deltas = deltas
+
+  def start_ts(self):
+    '''
+    returns the timestamp of the first connection, or None.
+    '''
+    if not self.connections:
+      return None
+    return min(connection.first_ts for connection in self.connections)
+
+  def connection_hostnames(self, connection):
+    '''
+    returns the hostnames the DNS answers give for either end.
+    '''
+    return (self.hostnames.get(connection.dst[0], []) +
+            self.hostnames.get(connection.src[0], []))
+
+  def first_ts(self, connection):
+    '''
+    returns the earliest timestamp an entry of the connection may start at:
+    the start of the earliest DNS lookup of either end if it came first, as
+    the first entry starts with the DNS lookup it claims, see
+    httpsession.entry_start_ts. Otherwise its first packet.
+    '''
+    starts = [lookup[0]
+              for address in (connection.dst[0], connection.src[0])
+              for lookup in self.lookups.get(address, [])]
+    return min([connection.first_ts] + starts)
+
+  def dns_claimers(self):
+    '''
+    returns the connections that may claim the DNS timings, see
+    dns.DNS.dns_time_of_connect_to_host: for each lookup of an address, the
+    first connection to it after the answer, and those within
+    dns.CLAIM_WINDOW of it. Converting them along with the selected
+    connections gives those the DNS timings of converting the whole capture.
+    '''
+    claimers = []
+    # {address: [answer timestamp, first_ts of its first connection]}
+    pending = dict((address, [[end, None] for start, end in lookups])
+                   for address, lookups in self.lookups.iteritems())
+    for connection in self.connections:
+      for address in (connection.dst[0], connection.src[0]):
+        claimed = False
+        for lookup in pending.get(address, []):
+          if connection.first_ts < lookup[0]:
+            continue
+          if lookup[1] is None:
+            lookup[1] = connection.first_ts
+          if connection.first_ts - lookup[1] <= dns.CLAIM_WINDOW:
+            claimed = True
+        if claimed:
+          claimers.append(connection)
+          break
+    return claimers
+
+  def matches_host(self, connection, host):
+    '''
+    returns whether an end of the connection may be host: an address, a
+    hostname, or a domain starting with a dot that matches its subdomains.
+    Hostnames are those of the DNS answers. A connection to addresses no
+    DNS answer gives hostnames for may be to any host; it may also be to
+    other hosts at the same address. Either way the Host header of its
+    requests tells, see request_matches.
+    '''
+    if is_address(host):
+      return host.lower() in (connection.src[0], connection.dst[0])
+    hostnames = self.connection_hostnames(connection)
+    if not hostnames:
+      return True
+    for hostname in hostnames:
+      if hostname_matches(hostname, host):
+        return True
+    return False
+
+  def select(self, hosts=None, start=None, end=None):
+    '''
+    returns the connections that may be to any of the hosts (see
+    matches_host) that may have entries starting between the start and end
+    timestamps: from their first_ts to their last packet. None matches
+    everything. Earlier connections that may claim DNS timings are selected
+    too, see dns_claimers. Convert them with the hosts in
+    convert.Options.hosts, and the timestamps in its start_ts and end_ts, to
+    only keep those entries.
+    '''
+    selected = []
+    claimers = set()
+    if start is not None:
+      claimers = set(self.dns_claimers())
+    for connection in self.connections:
+      if (start is not None and connection.last_ts < start and
+          connection not in claimers):
+        continue
+      if end is not None and self.first_ts(connection) > end:
+        continue
+      if hosts and not [host for host in hosts
+                        if self.matches_host(connection, host)]:
+        continue
+      selected.append(connection)
+    return selected
+
+  def record_offsets(self, connections):
+    '''
+    returns the sorted record offsets of the packets of the connections,
+    and of all the DNS packets, which the DNS timings need.
+    '''
+    offsets = decode(self.deltas, 0, self.dns_count)
+    for connection in connections:
+      offsets.extend(decode(self.deltas, connection.position,
+                            connection.count))
+    offsets.sort()
+    return offsets
+
+  def save(self, filename):
+    '''
+    writes the index to the file.
+    '''
+    metadata = {
+      'capture': self.capture,
+      'filters': self.filters,
+      'hostnames': self.hostnames,
+      'lookups': self.lookups,
+      'connections': [connection.json_repr()
+                      for connection in self.connections],
+      'dns_count': self.dns_count,
+    }
+    out = open(filename, 'wb')
+    try:
+      out.write(INDEX_MAGIC)
+      for part in (json.dumps(metadata), pack_offsets(self.deltas)):
+        part = zlib.compress(part)
+        out.write(struct.pack('<Q', len(part)))
+        out.write(part)
+    finally:
+      out.close()
+
+
+def build(pcap_file, options):
+  '''
+  indexes the capture file with the filters of the convert.Options. Returns
+  the PacketIndex.
+  '''
+  inf = open(pcap_file, 'rb')
+  try:
+    reader = Reader(inf)
+    builder = IndexBuilder(reader, options)
+    reader.close()
+    status = os.fstat(inf.fileno())
+  finally:
+    inf.close()
+  deltas = array.array(OFFSET_TYPE)
+  encode(builder.dns_offsets, deltas)
+  connections = []
+  for socket in builder.order:
+    first_ts, last_ts, syn_offset, offsets = builder.sockets[socket]
+    (src, sport), (dst, dport) = socket
+    connections.append(Connection(
+        (address_str(src), sport), (address_str(dst), dport), first_ts,
+        last_ts, syn_offset, len(offsets), len(deltas)))
+    encode(offsets, deltas)
+  hostnames = dict((address_str(ip), sorted(names)) for ip, names in
+                   options.dns.ip_hostnames().iteritems())
+  lookups = dict((address_str(ip), ip_lookups) for ip, ip_lookups in
+                 options.dns.ip_lookups().iteritems())
+  return PacketIndex(
+      {'size': status.st_size, 'mtime': int(status.st_mtime)},
+      {'exclude': list(options.exclude), 'include': list(options.include)},
+      hostnames, lookups, connections, len(builder.dns_offsets), deltas)
+
+
+def load(filename):
+  '''
+  reads the PacketIndex from the index file.
+  '''
+  inf = open(filename, 'rb')
+  try:
+    if inf.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+      raise ValueError('%s is not a pcap2har index' % filename)
+    parts = []
+    for dummy in range(2):
+      length = struct.unpack('<Q', inf.read(8))[0]
+      parts.append(zlib.decompress(inf.read(length)))
+  finally:
+    inf.close()
+  metadata = json.loads(parts[0])
+  deltas = unpack_offsets(parts[1])
+  connections = []
+  position = metadata['dns_count']
+  for (src, sport, dst, dport, first_ts, last_ts, syn_offset,
+       count) in metadata['connections']:
+    connections.append(Connection((src, sport), (dst, dport), first_ts,
+                                  last_ts, syn_offset, count, position))
+    position += count
+  return PacketIndex(metadata['capture'], metadata['filters'],
+                     metadata['hostnames'], metadata['lookups'], connections,
+                     metadata['dns_count'], deltas)
+
+
+def open_index(pcap_file, options, rebuild=False):
+  '''
+  returns the PacketIndex of the capture file for the filters of the
+  convert.Options: the saved one if it is up to date, otherwise a new one,
+  which is saved.
+  '''
+  filename = index_file(pcap_file)
+  if not rebuild and os.path.exists(filename):
+    try:
+      index = load(filename)
+    except (ValueError, EnvironmentError, struct.error, zlib.error), error:
+      logging.warning('rebuilding %s: %s', filename, error)
+    else:
+      status = os.stat(pcap_file)
+      if (index.capture == {'size': status.st_size,
+                            'mtime': int(status.st_mtime)} and
+          index.filters == {'exclude': list(options.exclude),
+                            'include': list(options.include)}):
+        return index
+      logging.info('rebuilding %s, the capture or filters changed', filename)
+  index = build(pcap_file, options)
+  index.save(filename)
+  return index
+
+
+class Selection(object):
+  '''
+  The packets of a capture at some record offsets, read like a
+  pcapreader.Reader, for convert.convert_packets.
+  '''
+  def __init__(self, reader, offsets):
+    '''
+    Args:
+    reader = pcapreader.Reader
+    offsets = sorted record offsets, see PacketIndex.record_offsets
+    '''
+    self.reader = reader
+    self.offsets = offsets
+
+  def datalink(self):
+    return self.reader.datalink()
+
+  def capture(self):
+    return self.reader.capture()
+
+  def __iter__(self):
+    return self.reader.read_at(self.offsets)
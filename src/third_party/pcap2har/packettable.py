@@ -0,0 +1,180 @@
+'''
+Columnar packet table, an alternative to pcap.TCPFlowAccumulator for
+captures with many packets.
+
+TCPFlowAccumulator keeps a tcp.Packet, with its dpkt objects and a copy of
+its payload, for every packet of every flow until the conversion ends.
+PacketTable decodes the capture the same way, but keeps each TCP segment as a
+row of a NumPy structured array: timestamp, addresses and ports, seq, ack,
+flags, and the offset and length of the payload in the capture, which stays
+memory-mapped. A row takes 41 bytes.
+
+Flows are found by sorting the rows on their socket, with both directions
+of a connection mapped to the same key. Each flow is then built from its rows
+only when it is iterated over, and drops its packets once it is finished, so
+only the flow being handed out holds packet objects.
+
+The table needs the whole capture, it is not used by convert.convert_stream.
+NumPy is optional: without it, numpy is None and the table is not available.
+'''
+
+import pcap
+import tcp
+
+# NumPy is not available everywhere, App Engine for one
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+# one row per TCP segment. src and dst index PacketTable.addresses, offset and
+# length locate the payload in the capture.
+PACKET_DTYPE = [
+  ('ts', 'f8'),
+  ('src', 'u4'),
+  ('sport', 'u2'),
+  ('dst', 'u4'),
+  ('dport', 'u2'),
+  ('seq', 'u4'),
+  ('ack', 'u4'),
+  ('flags', 'u1'),
+  ('offset', 'i8'),
+  ('length', 'u4'),
+]
+
+# Rows collected in a list before they are converted to an array.
+BLOCK_ROWS = 65536
+
+
+def payload_offset(frame, data):
+  '''
+  returns the offset of the TCP payload data in the frame buffer. It ends
+  the frame, unless the frame was padded to the minimum frame size.
+  '''
+  start = len(frame) - len(data)
+  if frame[start:] == data:
+    return start
+  return str(frame).rfind(data)
+
+
+class PacketTable(pcap.TCPFlowAccumulator):
+  '''
+  Reads the TCP segments of a capture into a NumPy structured array. See the
+  module documentation. Filtering, DNS and stats are handled like in
+  pcap.TCPFlowAccumulator, but flowdict stays empty: iterate over flows()
+  instead.
+
+  Members:
+  packets = numpy array of PACKET_DTYPE, the segments in capture order
+  addresses = [string], the IP addresses of the src and dst columns
+  capture = mmap or string, the capture the offset column points into
+  '''
+  def __init__(self, pcap_reader, options):
+    '''
+    Args:
+    pcap_reader = pcapreader.Reader
+    options = convert.Options
+    '''
+    self.capture = pcap_reader.capture()
+    self.addresses = []
+    self.address_index = {}
+    self.rows = []
+    self.blocks = []
+    pcap.TCPFlowAccumulator.__init__(self, pcap_reader, options)
+    self.end_block()
+    if self.blocks:
+      self.packets = numpy.concatenate(self.blocks)
+    else:
+      self.packets = numpy.zeros(0, dtype=PACKET_DTYPE)
+    self.blocks = None
+    self.address_index = None
+    self.groups = None
+
+  def address(self, ip):
+    '''
+    returns the index of ip in self.addresses, adding it if needed.
+    '''
+    index = self.address_index.get(ip)
+    if index is None:
+      index = self.address_index[ip] = len(self.addresses)
+      self.addresses.append(ip)
+    return index
+
+  def add_segment(self, record, ip_packet):
+    '''
+    adds a row for the TCP segment. See pcap.TCPFlowAccumulator.
+    '''
+    ts, frame, header = record
+    segment = ip_packet.data
+    data = segment.data
+    self.rows.append((ts, self.address(ip_packet.src), segment.sport,
+                      self.address(ip_packet.dst), segment.dport,
+                      segment.seq, segment.ack, segment.flags,
+                      header.data_offset + payload_offset(frame, data),
+                      len(data)))
+    if len(self.rows) >= BLOCK_ROWS:
+      self.end_block()
+
+  def end_block(self):
+    '''
+    converts the collected rows into an array.
+    '''
+    if self.rows:
+      self.blocks.append(numpy.array(self.rows, dtype=PACKET_DTYPE))
+      self.rows = []
+
+  def flow_rows(self):
+    '''
+    returns [numpy array of row indexes] for every flow, oldest flow first,
+    each in capture order.
+    '''
+    if self.groups is None:
+      packets = self.packets
+      if not len(packets):
+        self.groups = []
+        return self.groups
+      # (address, port) keys of both ends, the lower one first so that both
+      # directions of a connection get the same key
+      src = (packets['src'].astype(numpy.int64) << 16) | packets['sport']
+      dst = (packets['dst'].astype(numpy.int64) << 16) | packets['dport']
+      low = numpy.minimum(src, dst)
+      high = numpy.maximum(src, dst)
+      order = numpy.lexsort((numpy.arange(len(packets)), high, low))
+      low = low[order]
+      high = high[order]
+      starts = numpy.flatnonzero((low[1:] != low[:-1]) |
+                                 (high[1:] != high[:-1])) + 1
+      groups = numpy.split(order, starts)
+      # flows start with their first packet, like tcp.Flow.start
+      firsts = order[numpy.concatenate(([0], starts))]
+      by_start = numpy.lexsort((firsts, packets['ts'][firsts]))
+      self.groups = [groups[index] for index in by_start]
+    return self.groups
+
+  def flow_count(self):
+    return len(self.flow_rows())
+
+  def flow(self, rows):
+    '''
+    builds the finished tcp.Flow of the rows, without the packets it does
+    not need anymore.
+    '''
+    flow = tcp.Flow(self.options)
+    addresses = self.addresses
+    capture = self.capture
+    for (ts, src, sport, dst, dport, seq, ack, flags, offset,
+         length) in self.packets[rows].tolist():
+      flow.add(tcp.Packet.from_fields(
+          ts, ((addresses[src], sport), (addresses[dst], dport)), seq, ack,
+          flags, capture[offset:offset + length]))
+    self.finish_flow(flow)
+    flow.discard_packets()
+    return flow
+
+  def flows(self):
+    '''
+    yields the finished tcp.Flow of every connection, oldest first, like
+    the sorted flowdict of a pcap.TCPFlowAccumulator.
+    '''
+    for rows in self.flow_rows():
+      yield self.flow(rows)
@@ -1,9 +1,28 @@
 import dns
 import dpkt
 import logging
-import StringIO
 import tcp
-from pcaputil import ModifiedReader
+from packetfilter import PacketFilter
+from pcapreader import Reader
+from stats import Stats
+
+
+def packet_class(linktype):
+  '''
+  Returns the dpkt class of the frames of a capture with the given DLT_*
+  link type, or None if the frames are bare IP packets.
+  '''
+  if linktype == dpkt.pcap.DLT_EN10MB:
+    return dpkt.ethernet.Ethernet
+  elif linktype == dpkt.pcap.DLT_LINUX_SLL:
+    return dpkt.sll.SLL
+  elif linktype == 0:
+    # Loopback packet
+    return dpkt.loopback.Loopback
+  elif linktype == 101:
+    # RAW packet
+    return None
+  raise Exception("Unkown packet type: %d" % linktype)
 
 
 class TCPFlowAccumulator:
@@ -13,108 +32,234 @@ class TCPFlowAccumulator:
   dictionary indexed by their socket (the tuple
   ((srcip, sport), (dstip,dport)), possibly the other way around).
 
+  If a flow_handler is passed, flows are retired as soon as they are closed
+  (FIN from both ends or RST) or have been idle for options.flow_timeout
+  seconds. A retired flow is finished, removed from flowdict and passed to
+  flow_handler with the accumulator, so only the concurrently open
+  connections are kept in memory.
+
   Members:
   flowdict = {socket: tcp.Flow}, the list of tcp.Flow's organized by socket
+  closed_sockets = {socket: timestamp}, sockets of recently retired flows
   '''
 
-  def __init__(self, pcap_reader, options):
+  def __init__(self, pcap_reader, options, flow_handler=None):
     '''
     scans the pcap_reader for TCP packets, and adds them to the tcp.Flow
     they belong to, based on their socket
 
     Args:
-    pcap_reader = pcaputil.ModifiedReader
+    pcap_reader = pcapreader.Reader
+    options = convert.Options
+    flow_handler = callable(tcp.Flow, TCPFlowAccumulator) or None, called
+      with each retired flow
     '''
     self.flowdict = {}
+    self.closed_sockets = {}
     self.options = options
     self.options.dns = dns.DNS()
+    self.flow_handler = flow_handler
+    if self.options.stats is None:
+      self.options.stats = Stats()
+    stats = self.options.stats
+    next_sweep_ts = None
     debug_pkt_count = 0
+    # counted locally, they are updated for every packet
+    filtered_count = 0
+    decoded_count = 0
+    truncated_count = 0
+    error_count = 0
 
-    # Determine the packet type.
-    if (pcap_reader.datalink() == dpkt.pcap.DLT_EN10MB):
-      PacketClass = dpkt.ethernet.Ethernet
-    elif (pcap_reader.datalink() == dpkt.pcap.DLT_LINUX_SLL):
-      PacketClass = dpkt.sll.SLL
-    elif pcap_reader.datalink() == 0:
-      # Loopback packet
-      PacketClass = dpkt.loopback.Loopback
-    elif pcap_reader.datalink() == 101:
-      # RAW packet
-      PacketClass = None
-    else:
-      raise Exception("Unkown packet type: %d" % reader.datalink())
+    PacketClass = packet_class(pcap_reader.datalink())
+    packet_filter = PacketFilter(pcap_reader.datalink(), options.exclude,
+                                 options.include)
+    # the substages of the packets, or None, see stats
+    self.timer = timer = stats.substage_timer()
 
     try:
+      if timer:
+        timer.switch('read')
       for pkt in pcap_reader:
         debug_pkt_count += 1
-        # logging.debug("Processing packet %d", debug_pkt_count)
-        # discard incomplete packets
-        header = pkt[2]
-        if header.caplen != header.len:
-          # packet is too short
-          logging.warning('discarding incomplete packet')
-        # parse packet
-        if PacketClass:
-          packet = PacketClass(pkt[1])
-          ip_packet = packet.data
-        else:
-          packet = dpkt.ip.IP(pkt[1])
-          ip_packet = packet
-
+        if timer:
+          timer.switch('reassembly')
         try:
-          if isinstance(ip_packet, dpkt.ip.IP):
-            if self.options.dns.check_dns(pkt[0], ip_packet):
-              continue
-            if isinstance(ip_packet.data, dpkt.tcp.TCP):
-              # then it's a TCP packet process it
-              tcppkt = tcp.Packet(pkt[0], ip_packet, ip_packet.data)
-              self.process_packet(tcppkt) # organize by socket
-        except dpkt.Error, error:
-          logging.warning(error)
+          if self.flow_handler:
+            # retire the flows that went quiet
+            if next_sweep_ts is None:
+              next_sweep_ts = pkt[0] + self.options.flow_timeout
+            elif pkt[0] >= next_sweep_ts:
+              self.retire_idle_flows(pkt[0])
+              next_sweep_ts = pkt[0] + self.options.flow_timeout
+          if timer:
+            timer.switch('decode')
+          # logging.debug("Processing packet %d", debug_pkt_count)
+          # drop filtered traffic before decoding anything
+          verdict = packet_filter.check(pkt[1])
+          if verdict is False:
+            filtered_count += 1
+            continue
+          header = pkt[2]
+          if header.caplen != header.len:
+            # packet is too short, its data may be incomplete
+            truncated_count += 1
+          # parse packet, dpkt needs a copy of the buffer as string
+          decoded_count += 1
+          if PacketClass:
+            packet = PacketClass(str(pkt[1]))
+            ip_packet = packet.data
+          else:
+            packet = dpkt.ip.IP(str(pkt[1]))
+            ip_packet = packet
+          if timer:
+            timer.switch('reassembly')
+
+          try:
+            if isinstance(ip_packet, dpkt.ip.IP):
+              if verdict is None and not packet_filter.accept_ip(ip_packet):
+                filtered_count += 1
+                continue
+              if self.options.dns.check_dns(pkt[0], ip_packet):
+                self.add_dns(pkt)
+                continue
+              if isinstance(ip_packet.data, dpkt.tcp.TCP):
+                # then it's a TCP packet process it
+                self.add_segment(pkt, ip_packet)
+          except dpkt.Error, error:
+            error_count += 1
+            logging.debug(error)
+        finally:
+          if timer:
+            timer.switch('read')
     except dpkt.dpkt.NeedData, error:
       logging.warning(error)
       logging.warning('A packet in the pcap file was too short, '
                   'debug_pkt_count=%d', debug_pkt_count)
-    # finish all tcp flows
-    map(tcp.Flow.finish, self.flowdict.itervalues())
+    stats.packets_seen += debug_pkt_count
+    stats.packets_filtered += filtered_count
+    stats.packets_decoded += decoded_count
+    stats.packets_truncated += truncated_count
+    stats.decode_errors += error_count
+    if truncated_count:
+      logging.warning('%d packets were not captured entirely',
+                      truncated_count)
+    if timer:
+      timer.switch('reassembly')
+    if self.flow_handler:
+      # retire the remaining flows, oldest first
+      for socket, flow in sorted(self.flowdict.items(),
+                                 key=lambda item: item[1].start()):
+        self.retire_flow(socket)
+    else:
+      # finish all tcp flows
+      for flow in self.flowdict.itervalues():
+        self.finish_flow(flow)
+    if timer:
+      timer.switch(None)
+
+  def add_dns(self, record):
+    '''
+    called with the DNS packets of the capture, after options.dns has
+    taken in their timings.
+
+    Args:
+    record = (timestamp, buffer, RecordHeader), as yielded by the reader
+    '''
+    pass
+
+  def add_segment(self, record, ip_packet):
+    '''
+    adds a TCP segment of the capture to its flow.
+
+    Args:
+    record = (timestamp, buffer, RecordHeader), as yielded by the reader
+    ip_packet = dpkt.ip.IP carrying the segment
+    '''
+    self.process_packet(tcp.Packet(record[0], ip_packet, ip_packet.data))
 
   def process_packet(self, pkt):
     '''
     adds the tcp packet to flowdict. pkt is a TCPPacket
     '''
+    # unwanted ports were dropped by the PacketFilter already
     #try both orderings of src/dst socket components
     #otherwise, start a new list for that socket
     src, dst = pkt.socket
-    srcip, srcport = src
-    dstip, dstport = dst
-    if (srcport == 5223 or dstport == 5223):
-      logging.debug("hpvirtgrp packets are ignored.")
-      return
-    if (srcport == 5228 or dstport == 5228):
-      logging.debug("hpvroom packets are ignored.")
-      return
-    if (srcport == 443 or dstport == 443):
-      logging.debug("HTTPS packets are ignored.")
-      return
-    if (srcport == 53 or dstport == 53):
-      logging.debug("DNS TCP packets are ignored.")
-      return
-
     if (src, dst) in self.flowdict:
-      self.flowdict[(src, dst)].add(pkt)
+      socket = (src, dst)
     elif (dst, src) in self.flowdict:
-      self.flowdict[(dst, src)].add(pkt)
+      socket = (dst, src)
     else:
+      for socket in ((src, dst), (dst, src)):
+        if socket in self.closed_sockets:
+          if not pkt.flags & dpkt.tcp.TH_SYN:
+            # late ACK or retransmission of an already retired flow
+            return
+          # the port pair is reused by a new connection
+          del self.closed_sockets[socket]
       # log.debug("New flow: s:%d -> d:%d", srcport, dstport)
-      newflow = tcp.Flow(self.options)
-      newflow.add(pkt)
-      self.flowdict[(src, dst)] = newflow
+      socket = (src, dst)
+      self.flowdict[socket] = tcp.Flow(self.options)
+    flow = self.flowdict[socket]
+    flow.add(pkt)
+    if self.flow_handler and flow.closed():
+      self.retire_flow(socket)
+      self.closed_sockets[socket] = pkt.ts
+
+  def retire_flow(self, socket):
+    '''
+    finishes the flow of the socket, removes it from flowdict and hands it
+    to the flow_handler.
+    '''
+    flow = self.flowdict.pop(socket)
+    self.finish_flow(flow)
+    # the handler runs in other stages
+    substage = self.timer and self.timer.switch(None)
+    self.flow_handler(flow, self)
+    if substage:
+      self.timer.switch(substage)
+
+  def oldest_start(self):
+    '''
+    returns the start time of the oldest flow still in flowdict, or None.
+    '''
+    if not self.flowdict:
+      return None
+    return min(flow.start() for flow in self.flowdict.itervalues())
+
+  def finish_flow(self, flow):
+    '''
+    finishes the flow, and adds its counters to the stats.
+    '''
+    flow.finish()
+    stats = self.options.stats
+    stats.flows += 1
+    if flow.handshake is False:
+      stats.handshake_failures += 1
+    for direction in (flow.fwd, flow.rev):
+      stats.out_of_order_segments += direction.out_of_order
+      stats.retransmitted_segments += direction.retransmitted
+      stats.holes += direction.holes
+      stats.bytes_reassembled += len(direction.data)
+
+  def retire_idle_flows(self, now):
+    '''
+    retires all flows that have not seen a packet for options.flow_timeout
+    seconds, and forgets sockets that were retired before that.
+    '''
+    deadline = now - self.options.flow_timeout
+    idle = [socket for socket, flow in self.flowdict.iteritems()
+            if flow.last_ts() < deadline]
+    for socket in sorted(idle, key=lambda s: self.flowdict[s].start()):
+      self.retire_flow(socket)
+    for socket, ts in self.closed_sockets.items():
+      if ts < deadline:
+        del self.closed_sockets[socket]
 
 def TCPFlowsFromString(buf, options):
   '''
   helper function for getting a TCPFlowAccumulator from a pcap buf.
   buffer in, flows out.
   '''
-  f = StringIO.StringIO(buf)
-  reader = ModifiedReader(f)
+  reader = Reader(buf)
   return TCPFlowAccumulator(reader, options)
@@ -0,0 +1,331 @@
+'''
+Reader for pcap and pcapng capture files.
+
+The capture is memory-mapped when it comes from a real file, and packets are
+yielded as read-only buffer slices of it, so a packet that is never decoded
+is never copied. Python 2 mmap objects do not support memoryview, buffer
+objects are the zero-copy slices that work for both mmaps and strings.
+
+Supported formats:
+* classic pcap, microsecond and nanosecond resolution, either byte order
+* pcapng, with per-interface timestamp resolution and offset
+'''
+
+import collections
+import logging
+import struct
+import dpkt
+
+# try to import mmap, App Engine does not have it
+try:
+  import mmap
+except ImportError:
+  mmap = None
+
+PCAP_MAGIC = 0xa1b2c3d4
+PCAP_NSEC_MAGIC = 0xa1b23c4d
+
+PCAPNG_SHB = 0x0a0d0d0a
+PCAPNG_IDB = 0x00000001
+PCAPNG_PB = 0x00000002
+PCAPNG_SPB = 0x00000003
+PCAPNG_EPB = 0x00000006
+PCAPNG_BYTE_ORDER_MAGIC = 0x1a2b3c4d
+
+PCAPNG_OPT_ENDOFOPT = 0
+PCAPNG_OPT_IF_TSRESOL = 9
+PCAPNG_OPT_IF_TSOFFSET = 14
+
+# header of each packet yielded by Reader, a replacement of dpkt.pcap.PktHdr
+# offset is the file offset of the record holding the packet, data_offset the
+# file offset of the packet data
+RecordHeader = collections.namedtuple('RecordHeader',
+                                      'caplen len offset data_offset')
+
+
+def open_capture(source):
+  '''
+  Returns the capture data of source as something that supports the buffer
+  interface: an mmap of the file if possible, otherwise a string.
+
+  Args:
+  source = string with the capture, or file-like object
+  '''
+  if isinstance(source, str):
+    return source
+  if mmap:
+    try:
+      return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+      # not a real file (e.g. StringIO), or an empty one
+      pass
+  source.seek(0)
+  return source.read()
+
+
+class Interface(object):
+  '''
+  A pcapng interface, or the single implicit interface of a pcap file.
+
+  Members:
+  linktype = int, DLT_* value
+  snaplen = int
+  units = int, timestamp units per second
+  offset = int, seconds added to every timestamp
+  '''
+  def __init__(self, linktype, snaplen, units=1000000, offset=0):
+    self.linktype = linktype
+    self.snaplen = snaplen
+    self.units = units
+    self.offset = offset
+
+  def timestamp(self, value):
+    '''
+    converts a timestamp in self.units to float seconds.
+    '''
+    sec, frac = divmod(value, self.units)
+    return sec + self.offset + frac / float(self.units)
+
+
+class Reader(object):
+  '''
+  Iterates over the packets of a pcap or pcapng capture. Yields
+  (timestamp, buffer, RecordHeader), like pcaputil.ModifiedReader did.
+
+  Members:
+  snaplen = int, snap length of the (first) interface
+  format = 'pcap' or 'pcapng'
+  '''
+  def __init__(self, source):
+    '''
+    Args:
+    source = string with the capture, or a file object
+    '''
+    self.__buf = open_capture(source)
+    self.__size = len(self.__buf)
+    if self.__size < 4:
+      raise ValueError('invalid tcpdump header')
+    magic_le = struct.unpack_from('<I', self.__buf, 0)[0]
+    magic_be = struct.unpack_from('>I', self.__buf, 0)[0]
+    if magic_le == PCAPNG_SHB:
+      self.format = 'pcapng'
+      self.__interface = self.first_interface()
+    elif PCAP_MAGIC in (magic_le, magic_be) or \
+         PCAP_NSEC_MAGIC in (magic_le, magic_be):
+      self.format = 'pcap'
+      self.__interface = self.read_pcap_header(
+          '<' if magic_le in (PCAP_MAGIC, PCAP_NSEC_MAGIC) else '>')
+    else:
+      raise ValueError('invalid tcpdump header')
+    self.snaplen = self.__interface.snaplen
+
+  def datalink(self):
+    return self.__interface.linktype
+
+  def capture(self):
+    '''
+    returns the capture data, the mmap or string RecordHeader offsets point
+    into.
+    '''
+    return self.__buf
+
+  def close(self):
+    '''
+    unmaps the capture if it was memory-mapped. The packet buffers of the
+    capture can not be read afterwards. The source is not closed.
+    '''
+    if not isinstance(self.__buf, str):
+      self.__buf.close()
+
+  def __iter__(self):
+    if self.format == 'pcap':
+      return self.iter_pcap()
+    return self.iter_pcapng()
+
+  def read_pcap_header(self, byte_order):
+    '''
+    parses the classic pcap file header, returns its Interface.
+    '''
+    if self.__size < 24:
+      raise dpkt.NeedData('short pcap file header')
+    magic, snaplen, linktype = struct.unpack_from(byte_order + 'I12xII',
+                                                  self.__buf, 0)
+    self.__record = struct.Struct(byte_order + 'IIII')
+    if magic == PCAP_NSEC_MAGIC:
+      units = 1000000000
+    else:
+      units = 1000000
+    # upper bits of the link type carry FCS information
+    return Interface(linktype & 0xffff, snaplen, units)
+
+  def iter_pcap(self):
+    '''
+    yields the packets of a classic pcap file.
+    '''
+    buf = self.__buf
+    size = self.__size
+    unpack_from = self.__record.unpack_from
+    interface = self.__interface
+    units = float(interface.units)
+    pos = 24
+    while pos < size:
+      if pos + 16 > size:
+        raise dpkt.NeedData('short pcap record header')
+      sec, frac, caplen, wirelen = unpack_from(buf, pos)
+      data_pos = pos + 16
+      if data_pos + caplen > size:
+        raise dpkt.NeedData('short pcap record')
+      yield (sec + frac / units, buffer(buf, data_pos, caplen),
+             RecordHeader(caplen, wirelen, pos, data_pos))
+      pos = data_pos + caplen
+
+  def read_at(self, offsets):
+    '''
+    yields the packets of the records at the sorted file offsets, as given
+    by RecordHeader.offset. Classic pcap records are read directly. pcapng
+    blocks depend on the interface blocks before them, so the block headers
+    are scanned up to the last offset, without reading the other packets.
+    '''
+    if not offsets:
+      return
+    if self.format == 'pcapng':
+      wanted = set(offsets)
+      last = offsets[-1]
+      for packet in self.iter_pcapng():
+        offset = packet[2].offset
+        if offset in wanted:
+          yield packet
+        if offset >= last:
+          return
+      return
+    buf = self.__buf
+    size = self.__size
+    unpack_from = self.__record.unpack_from
+    units = float(self.__interface.units)
+    for pos in offsets:
+      if pos + 16 > size:
+        raise dpkt.NeedData('short pcap record header')
+      sec, frac, caplen, wirelen = unpack_from(buf, pos)
+      data_pos = pos + 16
+      if data_pos + caplen > size:
+        raise dpkt.NeedData('short pcap record')
+      yield (sec + frac / units, buffer(buf, data_pos, caplen),
+             RecordHeader(caplen, wirelen, pos, data_pos))
+
+  def blocks(self):
+    '''
+    yields (offset, block_type, byte_order, body_offset, body_length) for
+    every pcapng block. Section header blocks set the byte order of the
+    blocks after them.
+    '''
+    buf = self.__buf
+    size = self.__size
+    byte_order = '<'
+    pos = 0
+    while pos < size:
+      if pos + 12 > size:
+        raise dpkt.NeedData('short pcapng block header')
+      block_type = struct.unpack_from(byte_order + 'I', buf, pos)[0]
+      if block_type == PCAPNG_SHB:
+        # the byte order magic follows the block length
+        if struct.unpack_from('<I', buf, pos + 8)[0] == \
+           PCAPNG_BYTE_ORDER_MAGIC:
+          byte_order = '<'
+        else:
+          byte_order = '>'
+      length = struct.unpack_from(byte_order + 'I', buf, pos + 4)[0]
+      if length < 12 or length % 4:
+        raise dpkt.UnpackError('invalid pcapng block length %d' % length)
+      if pos + length > size:
+        raise dpkt.NeedData('short pcapng block')
+      yield pos, block_type, byte_order, pos + 8, length - 12
+      pos += length
+
+  def parse_interface(self, byte_order, body, length):
+    '''
+    parses an interface description block, returns its Interface.
+    '''
+    buf = self.__buf
+    linktype, snaplen = struct.unpack_from(byte_order + 'H2xI', buf, body)
+    interface = Interface(linktype, snaplen)
+    pos = body + 8
+    end = body + length
+    while pos + 4 <= end:
+      code, opt_len = struct.unpack_from(byte_order + 'HH', buf, pos)
+      if code == PCAPNG_OPT_ENDOFOPT:
+        break
+      if code == PCAPNG_OPT_IF_TSRESOL and opt_len >= 1:
+        resolution = ord(buf[pos + 4])
+        if resolution & 0x80:
+          interface.units = 2 ** (resolution & 0x7f)
+        else:
+          interface.units = 10 ** resolution
+      elif code == PCAPNG_OPT_IF_TSOFFSET and opt_len >= 8:
+        interface.offset = struct.unpack_from(byte_order + 'q', buf,
+                                              pos + 4)[0]
+      # options are padded to 32 bits
+      pos += 4 + ((opt_len + 3) & ~3)
+    return interface
+
+  def first_interface(self):
+    '''
+    returns the first Interface of a pcapng file.
+    '''
+    for pos, block_type, byte_order, body, length in self.blocks():
+      if block_type == PCAPNG_IDB:
+        return self.parse_interface(byte_order, body, length)
+    raise ValueError('pcapng file without interface description block')
+
+  def iter_pcapng(self):
+    '''
+    yields the packets of a pcapng file. Packets captured on an interface
+    with a different link type than datalink() are skipped.
+    '''
+    buf = self.__buf
+    linktype = self.datalink()
+    interfaces = []
+    ts = 0.0
+    warned = False
+    for pos, block_type, byte_order, body, length in self.blocks():
+      if block_type == PCAPNG_SHB:
+        # a new section starts its own interface numbering
+        interfaces = []
+        continue
+      elif block_type == PCAPNG_IDB:
+        interfaces.append(self.parse_interface(byte_order, body, length))
+        continue
+      elif block_type == PCAPNG_EPB:
+        if_id, ts_high, ts_low, caplen, wirelen = struct.unpack_from(
+            byte_order + 'IIIII', buf, body)
+        data_pos = body + 20
+      elif block_type == PCAPNG_PB:
+        if_id, ts_high, ts_low, caplen, wirelen = struct.unpack_from(
+            byte_order + 'H2xIIII', buf, body)
+        data_pos = body + 20
+      elif block_type == PCAPNG_SPB:
+        # no timestamp, the packet keeps the one of the previous packet
+        if_id = 0
+        wirelen = struct.unpack_from(byte_order + 'I', buf, body)[0]
+        data_pos = body + 4
+        caplen = min(wirelen, length - 4)
+        if interfaces and interfaces[0].snaplen:
+          caplen = min(caplen, interfaces[0].snaplen)
+        ts_high = None
+      else:
+        # statistics, name resolution and custom blocks
+        continue
+      if if_id >= len(interfaces):
+        raise dpkt.UnpackError('pcapng packet of unknown interface %d' % if_id)
+      interface = interfaces[if_id]
+      if interface.linktype != linktype:
+        if not warned:
+          logging.warning('skipping packets of link type %d',
+                          interface.linktype)
+          warned = True
+        continue
+      if data_pos + caplen > body + length:
+        raise dpkt.UnpackError('pcapng packet longer than its block')
+      if ts_high is not None:
+        ts = interface.timestamp((ts_high << 32) | ts_low)
+      yield (ts, buffer(buf, data_pos, caplen),
+             RecordHeader(caplen, wirelen, pos, data_pos))
@@ -10,6 +10,12 @@ def inet_ntoa(ip):
   return (str(ord(ip[0])) + "." + str(ord(ip[1])) + "." + str(ord(ip[2])) +
           "." + str(ord(ip[3])))
 
+def inet_aton(ip):
+  parts = ip.split('.')
+  if len(parts) != 4 or not all(p.isdigit() and int(p) < 256 for p in parts):
+    raise ValueError("Incorrect IP: %s" % ip)
+  return ''.join(chr(int(p)) for p in parts)
+
 def friendly_tcp_flags(flags):
     '''
     returns a string containing a user-friendly representation of the tcp flags
@@ -55,55 +61,3 @@ def ms_from_dpkt_time(td):
     done on a number gotten from subtracting two dpkt timestamps.
     '''
     return int(td * 1000) # um, I guess
-
-class ModifiedReader(object):
-    """
-    A copy of the dpkt pcap Reader. The only change is that the iterator
-    yields the pcap packet header as well, so it's possible to check the true
-    frame length, among other things.
-    
-    stolen from pyper.
-    """
-    
-    def __init__(self, fileobj):
-        self.__f = fileobj
-        buf = self.__f.read(dpkt.pcap.FileHdr.__hdr_len__)
-        self.__fh = dpkt.pcap.FileHdr(buf)
-        self.__ph = dpkt.pcap.PktHdr
-        if self.__fh.magic == dpkt.pcap.PMUDPCT_MAGIC:
-            self.__fh = dpkt.pcap.LEFileHdr(buf)
-            self.__ph = dpkt.pcap.LEPktHdr
-        elif self.__fh.magic != dpkt.pcap.TCPDUMP_MAGIC:
-            raise ValueError, 'invalid tcpdump header'
-        self.snaplen = self.__fh.snaplen
-        self.filter = ''
-
-    def datalink(self):
-        return self.__fh.linktype
-    
-    def setfilter(self, value, optimize=1):
-        return NotImplementedError
-
-    def readpkts(self):
-        return list(self)
-    
-    def dispatch(self, cnt, callback, *args):
-        if cnt > 0:
-            for i in range(cnt):
-                ts, pkt = self.next()
-                callback(ts, pkt, *args)
-        else:
-            for ts, pkt in self:
-                callback(ts, pkt, *args)
-
-    def loop(self, callback, *args):
-        self.dispatch(0, callback, *args)
-    
-    def __iter__(self):
-        self.__f.seek(dpkt.pcap.FileHdr.__hdr_len__)
-        while 1:
-            buf = self.__f.read(dpkt.pcap.PktHdr.__hdr_len__)
-            if not buf: break
-            hdr = self.__ph(buf)
-            buf = self.__f.read(hdr.caplen)
-            yield (hdr.tv_sec + (hdr.tv_usec / 1000000.0), buf, hdr)
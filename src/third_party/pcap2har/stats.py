@@ -0,0 +1,186 @@
+'''
+Instrumentation of a conversion: wall and CPU time per stage, and counters
+of what was found in the capture.
+
+Stages:
+* tcp: reading, filtering and decoding packets, reassembling TCP flows
+* http: parsing the flows for HTTP
+* har: building the HAR entries and pages
+* json: writing the HAR
+
+In streaming mode the stages interleave. A stage entered while another one
+is running pauses it, so every second is counted in exactly one stage.
+
+With substages, the wall time of the tcp stage is split further:
+* read: iterating over the records of the capture
+* decode: packet filter and dpkt decoding
+* reassembly: adding the packets to their TCP flows, finishing the flows
+They are timed with a SubstageTimer, a few clock reads per packet, which is
+cheaper than switching stages but not free, so they are off by default.
+
+A profiler can be attached to a stage through convert.Options.profilers. Any
+object with enable() and disable(), like cProfile.Profile, will do: it is
+enabled while the stage runs, and disabled while it is paused.
+'''
+
+import contextlib
+import os
+import time
+
+STAGES = ('tcp', 'http', 'har', 'json')
+# parts of the tcp stage, timed if Stats.substages
+SUBSTAGES = ('read', 'decode', 'reassembly')
+
+# name, description
+COUNTERS = (
+  ('packets_seen', 'packets read from the capture'),
+  ('packets_filtered', 'packets dropped by the packet filter'),
+  ('packets_decoded', 'packets decoded by dpkt'),
+  ('packets_truncated', 'packets shorter than on the wire'),
+  ('decode_errors', 'packets dpkt failed to decode'),
+  ('flows', 'TCP flows'),
+  ('handshake_failures', 'TCP flows without a handshake'),
+  ('out_of_order_segments', 'segments filling a hole in their stream'),
+  ('retransmitted_segments', 'segments without new data'),
+  ('holes', 'holes left in the reassembled streams'),
+  ('bytes_reassembled', 'bytes of reassembled TCP data'),
+  ('http_flows', 'TCP flows carrying HTTP'),
+  ('entries', 'HTTP request/response pairs'),
+  ('bytes_decompressed', 'bytes of decompressed response bodies'),
+)
+
+
+def cpu_time():
+  '''
+  returns the user + system CPU time of the process.
+  '''
+  times = os.times()
+  return times[0] + times[1]
+
+
+class SubstageTimer(object):
+  '''
+  Splits wall time between substages: switch(name) adds the time since the
+  previous switch to the substage running until then, and runs name next.
+  '''
+  def __init__(self, wall):
+    '''
+    Args:
+    wall = {substage: float}, the seconds are added to
+    '''
+    self.wall = wall
+    self.name = None
+    self.last = time.time()
+
+  def switch(self, name):
+    '''
+    runs the substage name, or none if name is None. Returns the substage
+    that was running.
+    '''
+    now = time.time()
+    previous = self.name
+    if previous:
+      self.wall[previous] += now - self.last
+    self.name = name
+    self.last = now
+    return previous
+
+
+class Stats(object):
+  '''
+  Members:
+  wall = {stage: float}, seconds spent in each stage
+  cpu = {stage: float}, CPU seconds spent in each stage
+  profilers = {stage: profiler}
+  substages = bool, whether the SUBSTAGES are timed
+  substage_wall = {substage: float}, seconds spent in each substage
+  and an int member for every name in COUNTERS
+  '''
+  def __init__(self, profilers=None, substages=False):
+    self.wall = dict.fromkeys(STAGES, 0.0)
+    self.cpu = dict.fromkeys(STAGES, 0.0)
+    self.profilers = profilers or {}
+    self.substages = substages
+    self.substage_wall = dict.fromkeys(SUBSTAGES, 0.0)
+    for name, description in COUNTERS:
+      setattr(self, name, 0)
+    # the running stage and the ones it paused: [name, wall, cpu] with the
+    # times it was (re)started at
+    self.running = []
+
+  def start(self, name):
+    self.running.append([name, time.time(), cpu_time()])
+    profiler = self.profilers.get(name)
+    if profiler:
+      profiler.enable()
+
+  def stop(self):
+    name, wall_start, cpu_start = self.running.pop()
+    profiler = self.profilers.get(name)
+    if profiler:
+      profiler.disable()
+    self.wall[name] += time.time() - wall_start
+    self.cpu[name] += cpu_time() - cpu_start
+    return name
+
+  @contextlib.contextmanager
+  def stage(self, name):
+    '''
+    context manager timing the code it wraps as the stage name.
+    '''
+    if self.running:
+      outer = self.stop()
+    else:
+      outer = None
+    self.start(name)
+    try:
+      yield self
+    finally:
+      self.stop()
+      if outer:
+        self.start(outer)
+
+  def substage_timer(self):
+    '''
+    returns a SubstageTimer adding up substage_wall, or None if the
+    substages are not timed.
+    '''
+    if self.substages:
+      return SubstageTimer(self.substage_wall)
+    return None
+
+  def total_wall(self):
+    return sum(self.wall.itervalues())
+
+  def total_cpu(self):
+    return sum(self.cpu.itervalues())
+
+  def json_repr(self):
+    '''
+    returns the stats as a dict.
+    '''
+    result = dict((name, getattr(self, name)) for name, dummy in COUNTERS)
+    result['wall'] = dict(self.wall)
+    result['cpu'] = dict(self.cpu)
+    if self.substages:
+      result['substage_wall'] = dict(self.substage_wall)
+    return result
+
+  def report(self):
+    '''
+    returns the stats as text, one line per stage and counter.
+    '''
+    lines = ['%-12s %9s %9s' % ('stage', 'wall s', 'cpu s')]
+    for name in STAGES:
+      lines.append('%-12s %9.3f %9.3f' % (name, self.wall[name],
+                                          self.cpu[name]))
+      if name == 'tcp' and self.substages:
+        for substage in SUBSTAGES:
+          lines.append('  %-10s %9.3f' % (substage,
+                                          self.substage_wall[substage]))
+    lines.append('%-12s %9.3f %9.3f' % ('total', self.total_wall(),
+                                        self.total_cpu()))
+    for name, description in COUNTERS:
+      lines.append('%-24s %12d  %s' % (name, getattr(self, name),
+                                       description))
+    return '\n'.join(lines)
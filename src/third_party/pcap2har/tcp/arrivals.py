@@ -0,0 +1,61 @@
+'''
+Final arrival times of a tcp.Direction, computed with NumPy.
+
+The final arrival time of a sequence number is the latest arrival time of the
+data up to it, a running maximum over the arrivals sorted by sequence number.
+Only the arrivals that raise the maximum are kept, and a lookup is a binary
+search of them.
+
+NumPy is optional. Without it, tcp.Direction computes the same vertices in a
+loop, into a SortedCollection.
+'''
+
+# NumPy is not available everywhere, App Engine for one
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+# Directions with fewer arrivals are faster to compute in a loop.
+MIN_ARRIVALS = 64
+
+
+class FinalArrivals(object):
+  '''
+  The final arrival vertices of a direction, in the part of the
+  SortedCollection interface that tcp.Direction uses: len(), iteration over
+  (seq_num, ts) and find_le.
+
+  Members:
+  seqs = numpy array of sequence numbers, sorted
+  times = numpy array of the final arrival time at each of seqs
+  '''
+  def __init__(self, seqs, times):
+    '''
+    Args:
+    seqs = sequence numbers of the arrivals, sorted
+    times = arrival time of each of seqs
+    '''
+    seqs = numpy.asarray(seqs, dtype=numpy.int64)
+    times = numpy.asarray(times, dtype=numpy.float64)
+    # an arrival is a vertex if it is later than all the data before it
+    keep = numpy.empty(len(times), dtype=bool)
+    keep[:1] = times[:1] > 0.0
+    keep[1:] = times[1:] > numpy.maximum.accumulate(times)[:-1]
+    self.seqs = seqs[keep]
+    self.times = times[keep]
+
+  def __len__(self):
+    return len(self.seqs)
+
+  def __iter__(self):
+    return iter(zip(self.seqs.tolist(), self.times.tolist()))
+
+  def find_le(self, seq_num):
+    '''
+    returns (seq, ts) of the last vertex at or before seq_num.
+    '''
+    index = int(numpy.searchsorted(self.seqs, seq_num, side='right')) - 1
+    if index < 0:
+      raise ValueError('No item found with key at or below: %r' % (seq_num,))
+    return int(self.seqs[index]), float(self.times[index])
@@ -1,16 +1,34 @@
+import bisect
 from sortedcollection import SortedCollection
 import tcp
+import arrivals
+import tcpseq as seq
 
 class Direction:
   '''
   Represents data moving in one direction in a TCP flow.
 
+  Packets are reassembled into tcp.Chunk's, kept sorted by position, and
+  found with a binary search, so adding a packet costs O(log n) plus the
+  chunks it actually touches, even on flows with many holes.
+
+  Sequence numbers are unwrapped into a monotonic space by following them
+  from packet to packet with tcpseq.subtract. seq_start, byte_to_seq and
+  arrival_data all use that space, so lookups keep working across a
+  wrap-around.
+
   Members:
-  * chunks = [tcp.Chunk], sorted by seq_start
+  * chunks = [tcp.Chunk], sorted by start
+  * chunk_starts = [int], the start of each chunk, for bisect
   * flow = tcp.Flow, the flow to which the direction belongs
+  * seq_base = the sequence number of the first data packet
   * seq_start = the sequence number at which the data starts, after finish()
   * arrival_data = [(seq_num, pkt)] or SortedCollection
-  * final_arrival_data = SortedCollection, after calculate_final_arrivals()
+  * final_arrival_data = SortedCollection or tcp.arrivals.FinalArrivals,
+    after calculate_final_arrivals()
+  * out_of_order = int, packets that filled a hole behind newer data
+  * retransmitted = int, packets that brought no new data
+  * holes = int, holes between the chunks, after finish()
   '''
   def __init__(self, flow):
     '''
@@ -23,16 +41,39 @@ class Direction:
     self.final_arrival_data = None #
     self.closed_cleanly = False # until proven true
     self.chunks = []
+    self.chunk_starts = []
     self.flow = flow
+    # offset past the furthest data seen
+    self.max_end = 0
+    self.out_of_order = 0
+    self.retransmitted = 0
+    self.holes = 0
+    self.seq_base = None
+    # the latest sequence number and its offset, for unwrapping
+    self.last_seq = None
+    self.last_offset = 0
     # the seq number of the first byte of data,
     # valid after finish() if self.data is valid
     self.seq_start= None
+
+  def offset(self, seq_num):
+    '''
+    Returns the position of seq_num relative to seq_base, taking
+    wrap-around into account.
+    '''
+    if self.last_seq is None:
+      self.seq_base = seq_num
+      self.last_seq = seq_num
+      return 0
+    self.last_offset += seq.subtract(seq_num, self.last_seq)
+    self.last_seq = seq_num
+    return self.last_offset
+
   def add(self, pkt):
     '''
-    Merge the packet into the first chunk it overlaps with. If data was
-    added to the end of a chunk, attempts to merge the next chunk (if there
-    is one). This way, it is ensured that everything is as fully merged as
-    it can be with the current data.
+    Merge the packet into the chunks it overlaps with or touches, which are
+    merged into one chunk. The data that arrives for the first time fills
+    the holes between them; data that was already there is kept.
 
     Args:
     pkt = tcp.Packet
@@ -40,26 +81,51 @@ class Direction:
     # discard packets with no payload. we don't care about them here
     if pkt.data == '':
       return
-    # attempt to merge packet with existing chunks
-    merged = False
-    for i in range(len(self.chunks)):
-      chunk = self.chunks[i]
-      overlapped, result = chunk.merge(pkt, self.create_merge_callback(pkt))
-      if overlapped: # if the data overlapped
-        # if data was added on the back and there is a chunk after this
-        if result[1] and i < (len(self.chunks)-1):
-          # try to merge with the next chunk as well in case that packet
-          # bridged the gap
-          overlapped2, result2 = chunk.merge(self.chunks[i+1])
-          if overlapped2: # if that merge worked
-            # The original code asserts that the data only be added to the back.
-            # But there is no reason for that, so removed that assertion.
-            del self.chunks[i+1] # remove the now-redundant chunk
-        merged = True
-        break # skip further chunks
-    if not merged:
+    data = pkt.data
+    start = self.offset(pkt.seq)
+    end = start + len(data)
+    arrivals = len(self.arrival_data)
+    # find the chunks that overlap or touch [start, end)
+    first = bisect.bisect_right(self.chunk_starts, start) - 1
+    if first < 0 or self.chunks[first].end < start:
+      first += 1
+    last = bisect.bisect_right(self.chunk_starts, end, first)
+    if first == last:
       # Nothing is overlapped with the packet. We need a new chunk.
-      self.new_chunk(pkt)
+      self.chunks.insert(first, tcp.Chunk(start, data))
+      self.chunk_starts.insert(first, start)
+      self.record_arrival(start, pkt)
+    else:
+      chunk = self.chunks[first]
+      # new data in front of the first chunk
+      if start < chunk.start:
+        self.record_arrival(start, pkt)
+        chunk.prepend(data[:chunk.start - start])
+        self.chunk_starts[first] = chunk.start
+      # new data filling the holes up to the following chunks
+      for other in self.chunks[first + 1:last]:
+        if chunk.end < other.start:
+          self.record_arrival(chunk.end, pkt)
+          chunk.append(data[chunk.end - start:other.start - start])
+        chunk.absorb(other)
+      del self.chunks[first + 1:last]
+      del self.chunk_starts[first + 1:last]
+      # new data after the last chunk
+      if chunk.end < end:
+        self.record_arrival(chunk.end, pkt)
+        chunk.append(data[chunk.end - start:])
+    if len(self.arrival_data) == arrivals:
+      self.retransmitted += 1
+    elif start < self.max_end:
+      self.out_of_order += 1
+    if end > self.max_end:
+      self.max_end = end
+
+  def record_arrival(self, offset, pkt):
+    '''
+    Notes that the data at offset arrived for the first time in pkt.
+    '''
+    self.arrival_data.append((self.seq_base + offset, pkt))
 
   def finish(self):
     '''
@@ -69,10 +135,14 @@ class Direction:
     '''
     # set data to the data from the first chunk, if there is one
     if self.chunks:
-      self.data = self.chunks[0].data
-      self.seq_start = self.chunks[0].seq_start
+      self.data = self.chunks[0].join()
+      self.seq_start = self.seq_base + self.chunks[0].start
+      # the data after the first hole is lost
+      self.holes = len(self.chunks) - 1
     else:
       self.data = ''
+    self.chunks = []
+    self.chunk_starts = []
     self.arrival_data = SortedCollection(self.arrival_data, key=lambda v: v[0])
   def calculate_final_arrivals(self):
     '''
@@ -81,6 +151,11 @@ class Direction:
     data before it have arrived, that is, when the data is usable by the
     application. Must be called after self.finish().
     '''
+    if arrivals.numpy and len(self.arrival_data) >= arrivals.MIN_ARRIVALS:
+      self.final_arrival_data = arrivals.FinalArrivals(
+          [vertex[0] for vertex in self.arrival_data],
+          [vertex[1].ts for vertex in self.arrival_data])
+      return
     self.final_arrival_data = []
     peak_time = 0.0
     # final arrival vertex always coincides with an arrival vertex
@@ -91,34 +166,42 @@ class Direction:
     self.final_arrival_data = SortedCollection(self.final_arrival_data,
                                                key=lambda v: v[0])
 
-  def new_chunk(self, pkt):
+  def discard_packets(self):
     '''
-    creates a new tcp.Chunk for the pkt to live in. Only called if an
-    attempt has been made to merge the packet with all existing chunks.
+    Computes the final arrival times and drops the arrival packets, which
+    the final arrival times are all that is needed of.
     '''
-    chunk = tcp.Chunk()
-    chunk.merge(pkt, self.create_merge_callback(pkt))
-    self.chunks.append(chunk)
-    self.sort_chunks() # it would be better to insert the packet sorted
-  def sort_chunks(self):
-    self.chunks.sort(key=lambda chunk: chunk.seq_start)
-  def create_merge_callback(self, pkt):
+    if not self.final_arrival_data:
+      self.calculate_final_arrivals()
+    self.arrival_data = []
+
+  def __getstate__(self):
     '''
-    Returns a function that will serve as a callback for Chunk. It will
-    add the passed sequence number and the packet to self.arrival_data.
+    Pickles a finished direction with only what is needed to parse its data,
+    so it can be sent to another process: the data and the final arrival
+    times, but not the packets. The flow pickles itself (see tcp.Flow).
     '''
-    def callback(seq_num):
-      self.arrival_data.append((seq_num, pkt))
-    return callback
+    if not self.final_arrival_data:
+      self.calculate_final_arrivals()
+    state = self.__dict__.copy()
+    state['arrival_data'] = []
+    state['final_arrival_data'] = list(self.final_arrival_data)
+    return state
+
+  def __setstate__(self, state):
+    self.__dict__.update(state)
+    self.final_arrival_data = SortedCollection(self.final_arrival_data,
+                                               key=lambda v: v[0])
+
   def byte_to_seq(self, byte):
     '''
     Converts the passed byte index to a sequence number in the stream. byte
     is assumed to be zero-based.
     '''
-    if self.seq_start:
+    if self.seq_start is not None:
       return byte + self.seq_start
     else:
-      return byte + self.flow.first_packet.seq
+      return byte + (self.seq_base or 0)
 
   def seq_arrival(self, seq_num):
     '''
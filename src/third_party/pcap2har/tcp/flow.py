@@ -1,3 +1,4 @@
+import copy
 import logging
 import dpkt
 import tcp
@@ -16,6 +17,8 @@ class Flow:
   * packets = list of tcp.Packet's, all packets in the flow
   * handshake = None or (syn, synack, ack) or False. None while a handshake is
     still being searched for, False when we've given up on finding it.
+  * fin_sockets = set of sockets that have sent a FIN
+  * reset = True once a RST has been seen on the flow
   '''
   def __init__(self, options):
     self.fwd = Direction(self)
@@ -24,6 +27,8 @@ class Flow:
     self.socket = None
     self.packets = []
     self.options = options
+    self.fin_sockets = set()
+    self.reset = False
     # DEBUG
     self.print_log_out_of_order = True
   def add(self, pkt):
@@ -36,20 +41,25 @@ class Flow:
         # error out
         if len(self.packets[-1].data) == 0 or len(pkt.data) == 0 :
           if self.print_log_out_of_order:
-            logging.info("Non-data packet may be out of chronological order.")
+            logging.debug("Non-data packet may be out of chronological order.")
             self.print_log_out_of_order = False
         elif (self.packets[-1].data == pkt.data and
               self.packets[-1].seq == pkt.seq and
               self.packets[-1].ack == pkt.ack):
-          logging.info("Retransmission ignored.")
+          logging.debug("Retransmission ignored.")
         else:
-          logging.info(
-              "packet added to TCPFlow out of chronological order %f > %f" %
-              (self.packets[-1].ts , pkt.ts))
+          logging.debug(
+              "packet added to TCPFlow out of chronological order %f > %f",
+              self.packets[-1].ts, pkt.ts)
           #raise ValueError(
           #    "packet added to TCPFlow out of chronological order %f > %f" %
           #    (self.packets[-1].ts , pkt.ts))
     self.packets.append(pkt)
+    # remember connection teardown, so the flow can be retired early
+    if pkt.flags & dpkt.tcp.TH_RST:
+      self.reset = True
+    elif pkt.flags & dpkt.tcp.TH_FIN:
+      self.fin_sockets.add(pkt.socket)
     # look out for handshake
     # add it to the appropriate direction, if we've found or given up on
     # finding handshake
@@ -57,8 +67,7 @@ class Flow:
       self.merge_pkt(pkt)
     else: # if handshake is None, we're still looking for a handshake
       if len(self.packets) > 13: # or something like that
-        # give up
-        logging.warning("TCP handshake detection failed.")
+        # give up, the stats count flows without handshake
         self.handshake = False
         self.socket = self.packets[0].socket
         self.flush_packets() # merge all stored packets
@@ -113,5 +122,42 @@ class Flow:
     else:
       raise ValueError("tcp.Flow.samedir found a packet from the wrong flow")
 
+  def discard_packets(self):
+    '''
+    Drops the packets of a finished flow that parsing it for HTTP does not
+    need, like pickling does: all but the first packet, and the arrival
+    packets of both directions.
+    '''
+    self.fwd.discard_packets()
+    self.rev.discard_packets()
+    self.packets = self.packets[:1]
+
+  def __getstate__(self):
+    '''
+    Pickles a finished flow for parsing in another process. Only the first
+    packet is kept, and the options lose the DNS data and the stats, which
+    stay with the process that collected them.
+    '''
+    state = self.__dict__.copy()
+    state['packets'] = self.packets[:1]
+    state['options'] = copy.copy(self.options)
+    state['options'].dns = None
+    state['options'].stats = None
+    state['options'].profilers = {}
+    return state
+
   def start(self):
     return self.packets[0].ts
+
+  def last_ts(self):
+    '''
+    returns the timestamp of the latest packet added to the flow.
+    '''
+    return self.packets[-1].ts
+
+  def closed(self):
+    '''
+    returns whether the connection has been torn down, either by a RST or
+    by a FIN from both ends.
+    '''
+    return self.reset or len(self.fin_sockets) == 2
@@ -36,6 +36,35 @@ class Packet(object):
     self.seq_end = self.tcp.seq + len(self.tcp.data) # - 1
     self.rtt = None
 
+  @classmethod
+  def from_fields(cls, ts, socket, seq, ack, flags, data):
+    '''
+    Builds a packet from its already decoded fields, without the dpkt
+    objects. ip and tcp are None. Used by packettable.PacketTable.
+    '''
+    pkt = cls.__new__(cls)
+    pkt.ts = ts
+    pkt.ip = None
+    pkt.tcp = None
+    pkt.socket = socket
+    pkt.data = data
+    pkt.seq = seq
+    pkt.ack = ack
+    pkt.flags = flags
+    pkt.seq_start = seq
+    pkt.seq_end = seq + len(data)
+    pkt.rtt = None
+    return pkt
+
+  def __getstate__(self):
+    '''
+    Pickles the packet without the dpkt objects it was parsed from.
+    '''
+    state = self.__dict__.copy()
+    state['ip'] = None
+    state['tcp'] = None
+    return state
+
   def __cmp__(self, other):
     return cmp(self.ts, other.ts)
   def __eq__(self, other):
@@ -48,8 +77,8 @@ class Packet(object):
   def __repr__(self):
     return 'TCPPacket(%s, %s, seq=%x , ack=%x, data="%s")' % (
       friendly_socket(self.socket),
-      friendly_tcp_flags(self.tcp.flags),
-      self.tcp.seq,
-      self.tcp.ack,
-      friendly_data(self.tcp.data)[:60]
+      friendly_tcp_flags(self.flags),
+      self.seq,
+      self.ack,
+      friendly_data(self.data)[:60]
     )
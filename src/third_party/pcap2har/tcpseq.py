@@ -15,12 +15,12 @@ def wrap(x):
     (int)( (a) - (b) ). Basically, if a number's absolute value is greater
     than half the (unsigned) number space, it needs to be wrapped.
     '''
-    # if abs(x) > numberspace / 2, its value must be reduced by numberspace/2,
-    # and its sign must be flipped
+    # if abs(x) > numberspace / 2, the difference went around the number
+    # space, so bring it back by a whole numberspace
     if x > halfspace:
-        x = 0 - (x - halfspace)
+        x -= numberspace
     elif x < -halfspace:
-        x = 0 - (x + halfspace)
+        x += numberspace
     # x is now normalized
     return x
 
@@ -56,6 +56,8 @@ class TestTcpSeqSubtraction(unittest.TestCase):
         self.assertEqual(subtract(0x10000000, 0xd0000000), 0x40000000)
         # actual: a > b. want: a < b
         self.assertEqual(subtract(0xd0000000, 0x10000000), -0x40000000)
+        self.assertEqual(subtract(5, 0xfffffff6), 15)
+        self.assertEqual(subtract(0xfffffff6, 5), -15)
         #self.assertEqual(subtract(
         #self.assertEqual(subtract(
         #self.assertEqual(subtract(